@@ -0,0 +1,95 @@
+"""Latency of ``GET /api/v1/books`` while a login storm is running.
+
+Start the API first, then run:
+
+    python -m benchmarks.login_storm --email reader@example.com \
+        --password Reader0! --logins 500 --login-concurrency 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+async def login_storm(
+    client: httpx.AsyncClient,
+    email: str,
+    password: str,
+    total: int,
+    concurrency: int,
+) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def login() -> None:
+        async with semaphore:
+            await client.post(
+                "/api/v1/auth", json={"email": email, "password": password}
+            )
+
+    await asyncio.gather(*(login() for _ in range(total)))
+
+
+async def probe_books(
+    client: httpx.AsyncClient, stop: asyncio.Event, interval: float
+) -> list[float]:
+    latencies = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get(
+            "/api/v1/books", headers={"Cache-Control": "no-cache"}
+        )
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def run(args: argparse.Namespace) -> None:
+    limits = httpx.Limits(max_connections=args.login_concurrency + 10)
+    async with httpx.AsyncClient(
+        base_url=args.base_url, limits=limits, timeout=60
+    ) as client:
+        stop = asyncio.Event()
+        probe = asyncio.create_task(probe_books(client, stop, args.interval))
+        started = time.perf_counter()
+        await login_storm(
+            client,
+            args.email,
+            args.password,
+            args.logins,
+            args.login_concurrency,
+        )
+        elapsed = time.perf_counter() - started
+        stop.set()
+        latencies = await probe
+
+    print(f"logins: {args.logins} in {elapsed:.2f}s")
+    print(f"GET /api/v1/books samples: {len(latencies)}")
+    if latencies:
+        print(f"  p50: {statistics.median(latencies):.1f} ms")
+        print(f"  p95: {percentile(latencies, 95):.1f} ms")
+        print(f"  p99: {percentile(latencies, 99):.1f} ms")
+        print(f"  max: {max(latencies):.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--logins", type=int, default=500)
+    parser.add_argument("--login-concurrency", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=0.01)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Redis memory and hit latency of cached book pages, per cache coder.
+
+Stores the same page with the old JSON coder and with the response bytes
+coder, then times full cache hits against the Redis from the settings,
+including hits answered by the in-process tier:
+
+    python -m benchmarks.response_cache --items 100 --hits 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from typing import Awaitable, Callable
+
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.coder import JsonCoder
+from redis import asyncio as aioredis
+from starlette.responses import JSONResponse
+
+from benchmarks.login_storm import percentile
+from benchmarks.serialization import make_books
+from src.core.cache import ResponseBytesCoder, TieredBackend
+from src.core.config import settings
+from src.core.serialization import json_response, validate_list
+from src.schemas.book import BookResponse
+
+RESPONSE_FIELD = create_model_field(
+    name="Response_get_books", type_=list[BookResponse], mode="serialization"
+)
+
+HitPath = Callable[[aioredis.Redis, str], Awaitable[bytes]]
+
+
+async def json_coder_hit(redis: aioredis.Redis, key: str) -> bytes:
+    cached = await redis.get(key)
+    content = await serialize_response(
+        field=RESPONSE_FIELD,
+        response_content=JsonCoder.decode_as_type(cached, type_=None),
+    )
+    return JSONResponse(content).body
+
+
+async def bytes_coder_hit(redis: aioredis.Redis, key: str) -> bytes:
+    cached = await redis.get(key)
+    return ResponseBytesCoder.decode_as_type(cached, type_=None).body
+
+
+def local_tier_hit(backend: TieredBackend) -> HitPath:
+    async def hit(redis: aioredis.Redis, key: str) -> bytes:
+        _, cached = await backend.get_with_ttl(key)
+        return ResponseBytesCoder.decode_as_type(cached, type_=None).body
+
+    return hit
+
+
+async def measure(
+    redis: aioredis.Redis, path: HitPath, key: str, hits: int
+) -> list[float]:
+    timings = []
+    for _ in range(hits):
+        started = time.perf_counter()
+        await path(redis, key)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def report(name: str, stored: int, timings: list[float]) -> None:
+    print(f"{name}: {stored} bytes in Redis")
+    print(f"  hit p50: {statistics.median(timings):.3f} ms")
+    print(f"  hit p99: {percentile(timings, 99):.3f} ms")
+
+
+async def run(args: argparse.Namespace) -> None:
+    page = validate_list(BookResponse, make_books(args.items))
+    response = json_response(list[BookResponse], page)
+    tag = uuid.uuid4().hex[:8]
+    redis = aioredis.from_url(settings.REDIS_URL)
+    tiered = TieredBackend(RedisBackend(redis), maxsize=16, local_ttl=3600)
+    paths = {
+        "json coder": (JsonCoder.encode(page), json_coder_hit),
+        "bytes coder": (ResponseBytesCoder.encode(response), bytes_coder_hit),
+        "bytes coder, local tier": (
+            ResponseBytesCoder.encode(response),
+            local_tier_hit(tiered),
+        ),
+    }
+
+    keys = []
+    try:
+        for name, (encoded, path) in paths.items():
+            key = f"benchmark:{tag}:{name}"
+            keys.append(key)
+            await redis.set(key, encoded)
+            assert await path(redis, key) == response.body
+            stored = await redis.memory_usage(key)
+            report(name, stored, await measure(redis, path, key, args.hits))
+    finally:
+        if keys:
+            await redis.delete(*keys)
+        await redis.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--hits", type=int, default=1000)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
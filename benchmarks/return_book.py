@@ -0,0 +1,173 @@
+"""Compare the lean return-book path with the previous implementation.
+
+Runs against the database from the current settings, seeds its own rows
+and removes them afterwards:
+
+    python -m benchmarks.return_book --loans 500
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import UTC, date, datetime
+from typing import Awaitable, Callable
+
+from sqlalchemy import delete, event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.login_storm import percentile
+from src.core.config import settings
+from src.core.exceptions.not_found import BookLoanNotFoundException
+from src.db.database import async_session, engine
+from src.db.models.books import Author, Book, BookLoan, Genre
+from src.db.models.users import User
+from src.db.repositories.book import BookRepository
+from src.schemas.book import BookLoanUpdate, BookUpdate
+from src.services.book import BookService
+
+ReturnPath = Callable[[AsyncSession, int, uuid.UUID], Awaitable[None]]
+
+
+async def legacy_return_book(
+    db: AsyncSession, loan_id: int, user_id: uuid.UUID
+) -> None:
+    service = BookService(db)
+    book_loan = await service.get_book_loan_by_id_or_raise(loan_id)
+    if user_id != book_loan.user_id or book_loan.returned:
+        raise BookLoanNotFoundException()
+    await service.update_book_loan(
+        loan_id,
+        BookLoanUpdate(
+            returned=True,
+            return_date=datetime.now(UTC).replace(tzinfo=None),
+        ),
+    )
+    book = book_loan.book
+    await service.update(
+        book.id, BookUpdate(available_copies=book.available_copies + 1)
+    )
+
+
+async def lean_return_book(
+    db: AsyncSession, loan_id: int, user_id: uuid.UUID
+) -> None:
+    await BookService(db).return_book(loan_id, user_id)
+
+
+async def seed(
+    tag: str, loans: int
+) -> tuple[int, list[tuple[int, uuid.UUID]]]:
+    async with async_session() as session:
+        book = Book(
+            title=f"Benchmark {tag}",
+            published_at=date(2000, 1, 1),
+            available_copies=loans,
+            authors=[
+                Author(name=f"Bench {tag} {i}", birth_date=date(1900, 1, 1))
+                for i in range(3)
+            ],
+            genres=[Genre(name=f"Bench {tag[:4]} {i}") for i in range(2)],
+        )
+        users = [
+            User(
+                email=f"bench-{tag}-{i}@example.com",
+                first_name="Bench",
+                last_name="Reader",
+                hashed_password=b"unused",
+            )
+            for i in range(loans)
+        ]
+        session.add_all([book, *users])
+        await session.commit()
+
+        repo = BookRepository(session)
+        opened = []
+        for user in users:
+            loan = await repo.lend(
+                book.id, user.id, settings.BOOK_LIMIT_FOR_USER
+            )
+            opened.append((loan.id, user.id))
+        return book.id, opened
+
+
+async def cleanup(tag: str, book_id: int) -> None:
+    async with async_session() as session:
+        book = await session.get(Book, book_id)
+        await session.execute(
+            delete(BookLoan).where(BookLoan.book_id == book_id)
+        )
+        await session.execute(
+            delete(User).where(User.email.like(f"bench-{tag}-%"))
+        )
+        await session.execute(
+            delete(Author).where(Author.name.like(f"Bench {tag} %"))
+        )
+        await session.execute(
+            delete(Genre).where(Genre.name.like(f"Bench {tag[:4]} %"))
+        )
+        await session.delete(book)
+        await session.commit()
+
+
+async def measure(
+    path: ReturnPath, loans: list[tuple[int, uuid.UUID]]
+) -> tuple[list[float], float]:
+    statements = 0
+
+    def count(*args) -> None:
+        nonlocal statements
+        statements += 1
+
+    latencies = []
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    try:
+        for loan_id, user_id in loans:
+            async with async_session() as session:
+                started = time.perf_counter()
+                await path(session, loan_id, user_id)
+                latencies.append((time.perf_counter() - started) * 1000)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count)
+    return latencies, statements / len(loans)
+
+
+def report(name: str, latencies: list[float], statements: float) -> None:
+    print(
+        f"{name}: {len(latencies)} returns, {statements:.1f} statements each"
+    )
+    print(f"  p50: {statistics.median(latencies):.2f} ms")
+    print(f"  p95: {percentile(latencies, 95):.2f} ms")
+    print(f"  p99: {percentile(latencies, 99):.2f} ms")
+
+
+async def run(args: argparse.Namespace) -> None:
+    tag = uuid.uuid4().hex[:8]
+    book_id, loans = await seed(tag, args.loans * 2)
+    try:
+        legacy = await measure(legacy_return_book, loans[::2])
+        lean = await measure(lean_return_book, loans[1::2])
+    finally:
+        await cleanup(tag, book_id)
+        await engine.dispose()
+
+    report("legacy", *legacy)
+    report("lean", *lean)
+    speedup = statistics.median(legacy[0]) / statistics.median(lean[0])
+    print(f"p50 speedup: {speedup:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--loans",
+        type=int,
+        default=200,
+        help="returns to measure per path",
+    )
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""CPU cost of serializing a page of books, before and after the fast path.
+
+Builds in-memory ORM objects, so no database is needed:
+
+    python -m benchmarks.serialization --items 100 --rounds 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable
+
+from faker import Faker
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from starlette.responses import JSONResponse
+
+from benchmarks.login_storm import percentile
+from src.core.serialization import json_response, validate_list
+from src.db.models.books import Author, Book, Genre
+from src.schemas.book import BookResponse
+
+RESPONSE_FIELD = create_model_field(
+    name="Response_get_books", type_=list[BookResponse], mode="serialization"
+)
+
+
+def make_books(count: int) -> list[Book]:
+    fake = Faker()
+    fake.seed_instance(count)
+    authors = [
+        Author(id=i, name=fake.name(), birth_date=fake.date_of_birth())
+        for i in range(1, 4)
+    ]
+    genres = [Genre(id=i, name=fake.word()) for i in range(1, 3)]
+    return [
+        Book(
+            id=i,
+            title=fake.sentence(nb_words=4),
+            description=fake.text(max_nb_chars=200),
+            published_at=fake.date_object(),
+            available_copies=i % 5,
+            authors=authors[: i % 3 + 1],
+            genres=genres[: i % 2 + 1],
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+async def legacy_path(books: list[Book]) -> bytes:
+    items = [BookResponse.model_validate(book) for book in books]
+    content = await serialize_response(
+        field=RESPONSE_FIELD, response_content=items
+    )
+    return JSONResponse(content).body
+
+
+async def fast_path(books: list[Book]) -> bytes:
+    items = validate_list(BookResponse, books)
+    return json_response(list[BookResponse], items).body
+
+
+async def measure(
+    path: Callable[[list[Book]], Awaitable[bytes]],
+    books: list[Book],
+    rounds: int,
+) -> list[float]:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        await path(books)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def report(name: str, timings: list[float]) -> None:
+    print(f"{name}: {len(timings)} pages")
+    print(f"  p50: {statistics.median(timings):.3f} ms")
+    print(f"  p99: {percentile(timings, 99):.3f} ms")
+
+
+async def run(args: argparse.Namespace) -> None:
+    books = make_books(args.items)
+    assert await legacy_path(books) == await fast_path(books)
+    legacy = await measure(legacy_path, books, args.rounds)
+    fast = await measure(fast_path, books, args.rounds)
+    report("legacy", legacy)
+    report("fast", fast)
+    speedup = statistics.median(legacy) / statistics.median(fast)
+    print(f"p50 speedup: {speedup:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=1000)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
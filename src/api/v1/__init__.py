@@ -1,11 +1,14 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from . import auth, author, book, genre, user
+from src.core.serialization import bind_request
 
-router = APIRouter(prefix="/api/v1")
+from . import auth, author, book, genre, metrics, user
+
+router = APIRouter(prefix="/api/v1", dependencies=[Depends(bind_request)])
 
 router.include_router(user.router)
 router.include_router(auth.router)
 router.include_router(author.router)
 router.include_router(book.router)
 router.include_router(genre.router)
+router.include_router(metrics.router)
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 
 from src.core.dependencies import (
     get_auth_service,
     get_current_user_for_refresh,
 )
+from src.core.rate_limit import client_ip
 from src.db.models import User
 from src.schemas.auth import AccessToken, TokenPair
 from src.schemas.users import UserLogin
@@ -19,10 +20,11 @@ router = APIRouter(prefix="/auth", tags=["Auth"])
     summary="Authenticate user",
 )
 async def login(
+    request: Request,
     user_data: UserLogin,
     auth_service: AuthService = Depends(get_auth_service),
 ) -> TokenPair:
-    return await auth_service.login(user_data)
+    return await auth_service.login(user_data, client_ip(request))
 
 
 @router.post(
@@ -36,4 +38,4 @@ async def refresh_jwt(
     current_user: User = Depends(get_current_user_for_refresh),
     auth_service: AuthService = Depends(get_auth_service),
 ) -> AccessToken:
-    return await auth_service.refresh_jwt(data={"sub": current_user.id})
+    return await auth_service.refresh_jwt(current_user)
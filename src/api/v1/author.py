@@ -1,17 +1,28 @@
 import logging
 
-from fastapi import APIRouter, Depends, Query, status
-from fastapi_cache.decorator import cache
+from fastapi import APIRouter, Body, Depends, Query, Response, status
 
-from src.core.dependencies import admin_required, get_author_service
+from src.core.cache import CacheTag, response_cache
+from src.core.config import settings
+from src.core.dependencies import (
+    admin_required,
+    get_author_read_service,
+    get_author_service,
+)
+from src.core.serialization import json_response
 from src.db.models import User
 from src.schemas.author import (
+    AuthorBatchCreateResponse,
     AuthorCreate,
     AuthorDeleteResponse,
     AuthorResponse,
     AuthorUpdate,
 )
-from src.schemas.common import PaginationParams
+from src.schemas.common import (
+    CursorPage,
+    CursorPaginationParams,
+    PaginationParams,
+)
 from src.services.author import AuthorService
 
 logger = logging.getLogger(__name__)
@@ -35,20 +46,57 @@ async def create_author(
     return author
 
 
+@router.post(
+    "/batch",
+    response_model=AuthorBatchCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create authors in bulk, skipping names that already exist",
+)
+async def create_authors_batch(
+    authors_data: list[AuthorCreate] = Body(
+        ..., min_length=1, max_length=settings.BATCH_CREATE_MAX_ITEMS
+    ),
+    current_user: User = Depends(admin_required),
+    author_service: AuthorService = Depends(get_author_service),
+) -> AuthorBatchCreateResponse:
+    result = await author_service.create_many(authors_data)
+    logger.info(
+        f"Пользователь {current_user} добавил авторов: "
+        f"{len(result.created)}, уже существовало: {len(result.existing)}"
+    )
+    return result
+
+
 @router.get(
     "",
     response_model=list[AuthorResponse],
     status_code=status.HTTP_200_OK,
     summary="Author list",
 )
-@cache(expire=60)
+@response_cache(CacheTag.AUTHORS)
 async def get_authors(
     pagination_params: PaginationParams = Query(),
-    author_service: AuthorService = Depends(get_author_service),
-) -> list[AuthorResponse]:
-    return await author_service.get_all_with_pagination(
+    author_service: AuthorService = Depends(get_author_read_service),
+) -> Response:
+    result = await author_service.get_all_with_pagination(
         limit=pagination_params.limit, offset=pagination_params.offset
     )
+    return json_response(list[AuthorResponse], result)
+
+
+@router.get(
+    "/cursor",
+    response_model=CursorPage[AuthorResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Author list with keyset pagination",
+)
+@response_cache(CacheTag.AUTHORS)
+async def get_authors_by_cursor(
+    params: CursorPaginationParams = Query(),
+    author_service: AuthorService = Depends(get_author_read_service),
+) -> Response:
+    result = await author_service.get_all_with_cursor(params)
+    return json_response(CursorPage[AuthorResponse], result)
 
 
 @router.patch(
@@ -1,27 +1,41 @@
 import logging
 
-from fastapi import APIRouter, Depends, Query, status
-from fastapi_cache.decorator import cache
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
+from src.core.cache import CacheTag, response_cache
 from src.core.dependencies import (
     admin_required,
+    get_book_export_service,
+    get_book_import_service,
+    get_book_read_service,
     get_book_service,
     get_current_user_for_access,
 )
+from src.core.serialization import json_response
 from src.db.models import User
 from src.schemas.book import (
     BookCreate,
+    BookCursorQueryParams,
     BookDeleteResponse,
+    BookFileFormat,
+    BookImportReport,
+    BookLendResult,
+    BookLoanBatchCreate,
+    BookLoanBatchReturn,
     BookLoanCreate,
     BookLoanResponse,
     BookLoanReturnResponse,
     BookQueryParams,
     BookResponse,
     BookResponseWithStats,
+    BookReturnResult,
     BookUpdate,
 )
-from src.schemas.common import PaginationParams
+from src.schemas.common import CursorPage, PaginationParams
 from src.services.book import BookService
+from src.services.book_export import MEDIA_TYPES, BookExportService
+from src.services.book_import import BookImportService
 
 logger = logging.getLogger(__name__)
 
@@ -44,18 +58,88 @@ async def create_book(
     return book
 
 
+@router.post(
+    "/import",
+    response_model=BookImportReport,
+    status_code=status.HTTP_200_OK,
+    summary="Bulk import books from a CSV or NDJSON request body",
+)
+async def import_books(
+    request: Request,
+    import_format: BookFileFormat = Query(
+        default=BookFileFormat.CSV, alias="format"
+    ),
+    current_user: User = Depends(admin_required),
+    import_service: BookImportService = Depends(get_book_import_service),
+) -> BookImportReport:
+    report = await import_service.import_stream(
+        request.stream(), import_format
+    )
+    logger.info(
+        f"Пользователь {current_user} импортировал книги: "
+        f"создано {report.created}, обновлено {report.updated}, "
+        f"ошибок {report.failed}"
+    )
+    return report
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    summary="Stream the whole catalog as CSV or NDJSON",
+    response_class=StreamingResponse,
+)
+async def export_books(
+    export_format: BookFileFormat = Query(
+        default=BookFileFormat.NDJSON, alias="format"
+    ),
+    current_user: User = Depends(admin_required),
+    export_service: BookExportService = Depends(get_book_export_service),
+) -> StreamingResponse:
+    logger.info(f"Пользователь {current_user} выгружает каталог книг")
+    return StreamingResponse(
+        export_service.export(export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f"attachment; filename=books.{export_format.value}"
+            )
+        },
+    )
+
+
 @router.get(
     "",
     response_model=list[BookResponse],
     status_code=status.HTTP_200_OK,
     summary="Book list with filtering and pagination",
 )
-@cache(expire=60)
+@response_cache(
+    CacheTag.BOOKS, CacheTag.AUTHORS, CacheTag.GENRES, CacheTag.LOANS
+)
 async def get_books(
     params: BookQueryParams = Query(),
-    book_service: BookService = Depends(get_book_service),
-) -> list[BookResponse]:
-    return await book_service.get_all_with_pagination_and_filtration(params)
+    book_service: BookService = Depends(get_book_read_service),
+) -> Response:
+    result = await book_service.get_all_with_pagination_and_filtration(params)
+    return json_response(list[BookResponse], result)
+
+
+@router.get(
+    "/cursor",
+    response_model=CursorPage[BookResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Book list with filtering and keyset pagination",
+)
+@response_cache(
+    CacheTag.BOOKS, CacheTag.AUTHORS, CacheTag.GENRES, CacheTag.LOANS
+)
+async def get_books_by_cursor(
+    params: BookCursorQueryParams = Query(),
+    book_service: BookService = Depends(get_book_read_service),
+) -> Response:
+    result = await book_service.get_all_with_cursor_and_filtration(params)
+    return json_response(CursorPage[BookResponse], result)
 
 
 @router.patch(
@@ -109,6 +193,44 @@ async def lend_book(
     return book_loan
 
 
+@router.post(
+    "/lend/batch",
+    response_model=list[BookLendResult],
+    status_code=status.HTTP_200_OK,
+    summary="Lend several books to a reader at once",
+)
+async def lend_books_batch(
+    batch: BookLoanBatchCreate,
+    current_user: User = Depends(admin_required),
+    book_service: BookService = Depends(get_book_service),
+) -> list[BookLendResult]:
+    results = await book_service.lend_many(batch)
+    lent = [result.book_id for result in results if result.loan is not None]
+    logger.info(
+        f"Пользователь {current_user} выдал книги с id {lent} читателю c id '{batch.user_id}'"
+    )
+    return results
+
+
+@router.post(
+    "/return-book/batch",
+    response_model=list[BookReturnResult],
+    status_code=status.HTTP_200_OK,
+    summary="Return several books at once",
+)
+async def return_books_batch(
+    batch: BookLoanBatchReturn,
+    current_user: User = Depends(get_current_user_for_access),
+    book_service: BookService = Depends(get_book_service),
+) -> list[BookReturnResult]:
+    results = await book_service.return_many(batch, current_user.id)
+    returned = [
+        result.loan.book_id for result in results if result.loan is not None
+    ]
+    logger.info(f"Пользователь {current_user} вернул книги с id {returned}")
+    return results
+
+
 @router.post(
     "/return-book/{loan_id}",
     response_model=BookLoanReturnResponse,
@@ -133,11 +255,14 @@ async def return_book(
     status_code=status.HTTP_200_OK,
     summary="List of books sorted by popularity",
 )
-@cache(expire=60)
+@response_cache(
+    CacheTag.BOOKS, CacheTag.AUTHORS, CacheTag.GENRES, CacheTag.LOANS
+)
 async def get_popular_books(
     params: PaginationParams = Query(),
-    book_service: BookService = Depends(get_book_service),
-) -> list[BookResponseWithStats]:
-    return await book_service.get_most_popular_books(
+    book_service: BookService = Depends(get_book_read_service),
+) -> Response:
+    result = await book_service.get_most_popular_books(
         limit=params.limit, offset=params.offset
     )
+    return json_response(list[BookResponseWithStats], result)
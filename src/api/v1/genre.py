@@ -1,12 +1,27 @@
 import logging
 
-from fastapi import APIRouter, Depends, Query, status
-from fastapi_cache.decorator import cache
+from fastapi import APIRouter, Body, Depends, Query, Response, status
 
-from src.core.dependencies import admin_required, get_genre_service
+from src.core.cache import CacheTag, response_cache
+from src.core.config import settings
+from src.core.dependencies import (
+    admin_required,
+    get_genre_read_service,
+    get_genre_service,
+)
+from src.core.serialization import json_response
 from src.db.models import User
-from src.schemas.common import PaginationParams
-from src.schemas.genre import GenreCreate, GenreDeleteResponse, GenreResponse
+from src.schemas.common import (
+    CursorPage,
+    CursorPaginationParams,
+    PaginationParams,
+)
+from src.schemas.genre import (
+    GenreBatchCreateResponse,
+    GenreCreate,
+    GenreDeleteResponse,
+    GenreResponse,
+)
 from src.services.genre import GenreService
 
 logger = logging.getLogger(__name__)
@@ -30,20 +45,57 @@ async def create_genre(
     return genre
 
 
+@router.post(
+    "/batch",
+    response_model=GenreBatchCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create genres in bulk, skipping names that already exist",
+)
+async def create_genres_batch(
+    genres_data: list[GenreCreate] = Body(
+        ..., min_length=1, max_length=settings.BATCH_CREATE_MAX_ITEMS
+    ),
+    current_user: User = Depends(admin_required),
+    genre_service: GenreService = Depends(get_genre_service),
+) -> GenreBatchCreateResponse:
+    result = await genre_service.create_many(genres_data)
+    logger.info(
+        f"Пользователь {current_user} добавил жанров: "
+        f"{len(result.created)}, уже существовало: {len(result.existing)}"
+    )
+    return result
+
+
 @router.get(
     "",
     response_model=list[GenreResponse],
     status_code=status.HTTP_200_OK,
     summary="Genre list",
 )
-@cache(expire=60)
+@response_cache(CacheTag.GENRES)
 async def get_genres(
     pagination_params: PaginationParams = Query(),
-    genre_service: GenreService = Depends(get_genre_service),
-) -> list[GenreResponse]:
-    return await genre_service.get_all_with_pagination(
+    genre_service: GenreService = Depends(get_genre_read_service),
+) -> Response:
+    result = await genre_service.get_all_with_pagination(
         limit=pagination_params.limit, offset=pagination_params.offset
     )
+    return json_response(list[GenreResponse], result)
+
+
+@router.get(
+    "/cursor",
+    response_model=CursorPage[GenreResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Genre list with keyset pagination",
+)
+@response_cache(CacheTag.GENRES)
+async def get_genres_by_cursor(
+    params: CursorPaginationParams = Query(),
+    genre_service: GenreService = Depends(get_genre_read_service),
+) -> Response:
+    result = await genre_service.get_all_with_cursor(params)
+    return json_response(CursorPage[GenreResponse], result)
 
 
 @router.delete(
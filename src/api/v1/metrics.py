@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, status
+
+from src.core.cache import response_cache, token_payload_cache, user_cache
+from src.core.dependencies import admin_required
+from src.core.rate_limit import login_rate_limiter
+from src.core.security import password_hasher
+from src.db.database import get_pool_stats, get_replica_pool_stats
+from src.db.models import User
+from src.schemas.metrics import MetricsResponse
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get(
+    "",
+    response_model=MetricsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Runtime metrics of pools and caches",
+)
+async def get_metrics(
+    current_user: User = Depends(admin_required),
+) -> MetricsResponse:
+    return MetricsResponse(
+        database_pool=get_pool_stats(),
+        replica_database_pool=get_replica_pool_stats(),
+        password_hasher=password_hasher.stats(),
+        login_rate_limiter=login_rate_limiter.stats(),
+        token_payload_cache=token_payload_cache.stats(),
+        user_cache=user_cache.stats(),
+        response_cache=response_cache.stats(),
+    )
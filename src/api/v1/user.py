@@ -1,17 +1,23 @@
 import logging
 import uuid
 
-from fastapi import APIRouter, Depends, Query, status
-from fastapi_cache.decorator import cache
+from fastapi import APIRouter, Depends, Query, Response, status
 
+from src.core.cache import CacheTag, response_cache
 from src.core.dependencies import (
     admin_required,
     get_current_user_for_access,
+    get_user_read_service,
     get_user_service,
     superuser_required,
 )
+from src.core.serialization import json_response
 from src.db.models.users import Role, User
-from src.schemas.common import PaginationParams
+from src.schemas.common import (
+    CursorPage,
+    CursorPaginationParams,
+    PaginationParams,
+)
 from src.schemas.users import (
     UserCreate,
     UserResponse,
@@ -63,15 +69,32 @@ async def change_user_role(
     status_code=status.HTTP_200_OK,
     summary="User list",
 )
-@cache(expire=60)
+@response_cache(CacheTag.USERS)
 async def get_users(
     pagination_params: PaginationParams = Query(),
     current_user: str = Depends(admin_required),
-    user_service: UserService = Depends(get_user_service),
-) -> list[UserResponse]:
-    return await user_service.get_all_with_pagination(
+    user_service: UserService = Depends(get_user_read_service),
+) -> Response:
+    result = await user_service.get_all_with_pagination(
         limit=pagination_params.limit, offset=pagination_params.offset
     )
+    return json_response(list[UserResponse], result)
+
+
+@router.get(
+    "/cursor",
+    response_model=CursorPage[UserResponse],
+    status_code=status.HTTP_200_OK,
+    summary="User list with keyset pagination",
+)
+@response_cache(CacheTag.USERS)
+async def get_users_by_cursor(
+    params: CursorPaginationParams = Query(),
+    current_user: str = Depends(admin_required),
+    user_service: UserService = Depends(get_user_read_service),
+) -> Response:
+    result = await user_service.get_all_with_cursor(params)
+    return json_response(CursorPage[UserResponse], result)
 
 
 @router.get(
@@ -107,12 +130,13 @@ async def update_current_user(
     status_code=status.HTTP_200_OK,
     summary="List of users sorted by activity",
 )
-@cache(expire=60)
+@response_cache(CacheTag.USERS, CacheTag.LOANS)
 async def get_active_users(
     params: PaginationParams = Query(),
     current_user: str = Depends(admin_required),
-    user_service: UserService = Depends(get_user_service),
-) -> list[UserResponseWithStats]:
-    return await user_service.get_most_active_users(
+    user_service: UserService = Depends(get_user_read_service),
+) -> Response:
+    result = await user_service.get_most_active_users(
         limit=params.limit, offset=params.offset
     )
+    return json_response(list[UserResponseWithStats], result)
@@ -4,6 +4,7 @@ import jwt
 from fastapi.encoders import jsonable_encoder
 
 from src.core.config import settings
+from src.db.models import User
 
 
 def create_token(data: dict, expires_delta: timedelta, token_type: str) -> str:
@@ -16,7 +17,19 @@ def create_token(data: dict, expires_delta: timedelta, token_type: str) -> str:
     return encoded_jwt
 
 
-def create_access_token(data: dict) -> str:
+def get_user_claims(user: User) -> dict:
+    return {
+        "sub": user.id,
+        "email": user.email,
+        "role": user.role,
+        "is_superuser": bool(user.is_superuser),
+        "ver": user.token_version,
+    }
+
+
+def create_access_token(data: dict, user: User | None = None) -> str:
+    if user is not None:
+        data = {**data, **get_user_claims(user)}
     access_token_expires = timedelta(
         minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
     )
@@ -0,0 +1,10 @@
+from .backends import TieredBackend
+from .coder import ResponseBytesCoder
+from .invalidation import InvalidationBus, invalidation_bus
+from .keys import request_key_builder
+from .lru import TTLCache
+from .payloads import TokenPayloadCache, token_payload_cache
+from .responses import ResponseCache, response_cache
+from .tags import CacheTag, CacheTags, TagVersion, cache_tags
+from .token_versions import TokenVersionStore, token_versions
+from .users import UserCache, user_cache
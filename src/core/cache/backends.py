@@ -0,0 +1,90 @@
+import time
+from typing import Any, Optional
+
+from fastapi_cache.types import Backend
+
+from src.core.cache.invalidation import invalidation_bus
+from src.core.cache.lru import TTLCache
+
+
+class TieredBackend(Backend):
+    """In-process LRU in front of a shared cache backend.
+
+    Local entries live for at most ``local_ttl`` seconds and never outlive
+    the shared entry they copy. Every write is broadcast, so the other
+    workers drop their copy of the key instead of serving it until it
+    expires.
+    """
+
+    kind = "response-cache"
+
+    def __init__(self, backend: Backend, maxsize: int, local_ttl: float):
+        self.backend = backend
+        self.local: TTLCache[tuple[float | None, bytes]] = TTLCache(
+            maxsize, local_ttl
+        )
+        self.remote_hits = 0
+        self.remote_misses = 0
+        invalidation_bus.subscribe(self.kind, self._drop, self.local.clear)
+
+    async def get_with_ttl(self, key: str) -> tuple[int, Optional[bytes]]:
+        cached = self.local.get(key)
+        if cached is not None:
+            expires_at, value = cached
+            if expires_at is None:
+                return -1, value
+            return max(round(expires_at - time.monotonic()), 0), value
+        ttl, value = await self.backend.get_with_ttl(key)
+        if value is None:
+            self.remote_misses += 1
+            return ttl, value
+        self.remote_hits += 1
+        self._store_locally(key, value, ttl)
+        return ttl, value
+
+    async def get(self, key: str) -> Optional[bytes]:
+        _, value = await self.get_with_ttl(key)
+        return value
+
+    async def set(
+        self, key: str, value: bytes, expire: Optional[int] = None
+    ) -> None:
+        await self.backend.set(key, value, expire)
+        self._store_locally(key, value, expire)
+        await invalidation_bus.publish(self.kind, key=key)
+
+    async def clear(
+        self, namespace: Optional[str] = None, key: Optional[str] = None
+    ) -> int:
+        if key is not None:
+            self.local.delete(key)
+        else:
+            self.local.clear()
+        cleared = await self.backend.clear(namespace, key)
+        await invalidation_bus.publish(self.kind, key=key)
+        return cleared
+
+    def _store_locally(
+        self, key: str, value: bytes, ttl: Optional[int]
+    ) -> None:
+        if ttl is None or ttl < 0:
+            self.local.set(key, (None, value))
+        else:
+            self.local.set(key, (time.monotonic() + ttl, value), ttl)
+
+    def _drop(self, message: dict[str, Any]) -> None:
+        if message["key"] is None:
+            self.local.clear()
+        else:
+            self.local.delete(message["key"])
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.remote_hits + self.remote_misses
+        return {
+            "local": self.local.stats(),
+            "redis": {
+                "hits": self.remote_hits,
+                "misses": self.remote_misses,
+                "hit_ratio": self.remote_hits / lookups if lookups else 0.0,
+            },
+        }
@@ -0,0 +1,47 @@
+import gzip
+from typing import Any, Optional
+
+from fastapi.encoders import jsonable_encoder
+from fastapi_cache.coder import Coder
+from starlette.responses import JSONResponse, Response
+
+from src.core.config import settings
+from src.core.serialization import JSONBytesResponse
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class ResponseBytesCoder(Coder):
+    """Caches the rendered JSON body instead of a re-encodable value.
+
+    Bodies of at least ``RESPONSE_CACHE_COMPRESS_MIN_BYTES`` are stored
+    gzip-compressed. A JSON document never starts with the gzip magic
+    bytes, so entries are told apart without a header of our own. Hits are
+    returned as a ready ``JSONBytesResponse``, skipping decoding and
+    response-model validation altogether.
+    """
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        if isinstance(value, Response):
+            body = bytes(value.body)
+        else:
+            body = JSONResponse(jsonable_encoder(value)).body
+        threshold = settings.RESPONSE_CACHE_COMPRESS_MIN_BYTES
+        if threshold and len(body) >= threshold:
+            return gzip.compress(
+                body, compresslevel=settings.RESPONSE_CACHE_COMPRESS_LEVEL
+            )
+        return body
+
+    @classmethod
+    def decode(cls, value: bytes) -> bytes:
+        if value[:2] == GZIP_MAGIC:
+            return gzip.decompress(value)
+        return value
+
+    @classmethod
+    def decode_as_type(
+        cls, value: bytes, *, type_: Optional[Any]
+    ) -> JSONBytesResponse:
+        return JSONBytesResponse(cls.decode(value))
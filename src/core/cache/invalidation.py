@@ -0,0 +1,105 @@
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any, Callable
+
+from redis import RedisError
+from redis.asyncio import Redis
+
+from src.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+RECONNECT_SECONDS = 1.0
+
+MessageHandler = Callable[[dict[str, Any]], None]
+
+
+class InvalidationBus:
+    """Broadcasts invalidations of in-process caches over Redis pub/sub.
+
+    Each local tier subscribes a handler for its ``kind`` of message and a
+    reset callback. Messages published while the subscription is down are
+    lost, so every (re)subscription resets the local tiers first. A worker
+    skips its own messages, it has applied them already.
+    """
+
+    channel = "cache-invalidation"
+
+    def __init__(self):
+        self.origin = uuid.uuid4().hex
+        self._handlers: dict[
+            str, tuple[MessageHandler, Callable[[], None]]
+        ] = {}
+        self._listener: asyncio.Task | None = None
+
+    def subscribe(
+        self, kind: str, handler: MessageHandler, reset: Callable[[], None]
+    ) -> None:
+        self._handlers[kind] = (handler, reset)
+
+    async def publish(self, kind: str, **message: Any) -> None:
+        redis = get_redis()
+        if redis is None:
+            return
+        payload = json.dumps({"origin": self.origin, "kind": kind, **message})
+        try:
+            await redis.publish(self.channel, payload)
+        except RedisError as e:
+            logger.error(f"Failed to broadcast a cache invalidation: {e}")
+
+    def start(self, redis: Redis) -> None:
+        self._listener = asyncio.create_task(self._listen(redis))
+        self._listener.add_done_callback(self._listener_done)
+
+    @staticmethod
+    def _listener_done(listener: asyncio.Task) -> None:
+        if listener.cancelled():
+            return
+        logger.error(
+            "Cache invalidation listener stopped, local caches are no "
+            f"longer invalidated by other workers: {listener.exception()!r}"
+        )
+
+    async def stop(self) -> None:
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        try:
+            await self._listener
+        except asyncio.CancelledError:
+            pass
+        self._listener = None
+
+    async def _listen(self, redis: Redis) -> None:
+        while True:
+            pubsub = redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                for _, reset in self._handlers.values():
+                    reset()
+                async for message in pubsub.listen():
+                    self._dispatch(message["data"])
+            except RedisError as e:
+                logger.warning(f"Cache invalidation subscription lost: {e}")
+                await asyncio.sleep(RECONNECT_SECONDS)
+            finally:
+                await pubsub.aclose()
+
+    def _dispatch(self, data: str) -> None:
+        # A malformed message is skipped, it must not end the listener.
+        try:
+            message = json.loads(data)
+            if message["origin"] == self.origin:
+                return
+            handlers = self._handlers.get(message["kind"])
+            if handlers is not None:
+                handlers[0](message)
+        except Exception as e:
+            logger.warning(
+                f"Skipping a malformed cache invalidation {data!r}: {e!r}"
+            )
+
+
+invalidation_bus = InvalidationBus()
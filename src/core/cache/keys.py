@@ -0,0 +1,28 @@
+import hashlib
+from typing import Any, Callable, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+def request_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> str:
+    """Key cached responses by endpoint, path and query string.
+
+    The default builder hashes the endpoint's keyword arguments. Those
+    include the injected services, whose reprs differ per request, so
+    the same URL almost never produced the same key twice.
+    """
+    query = sorted(request.query_params.multi_items()) if request else []
+    path = request.url.path if request else ""
+    digest = hashlib.md5(
+        f"{path}?{query}".encode(), usedforsecurity=False
+    ).hexdigest()
+    return f"{namespace}:{func.__module__}:{func.__name__}:{digest}"
@@ -0,0 +1,37 @@
+import hashlib
+import time
+from typing import Any
+
+from src.core.cache.lru import TTLCache
+from src.core.config import settings
+
+
+class TokenPayloadCache:
+    """Verified JWT payloads keyed by the token's SHA-256 digest.
+
+    An entry never outlives the token's ``exp`` claim.
+    """
+
+    def __init__(self, maxsize: int, ttl: int):
+        self.cache: TTLCache[dict[str, Any]] = TTLCache(maxsize, ttl)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        payload = self.cache.get(self._key(token))
+        return dict(payload) if payload is not None else None
+
+    def set(self, token: str, payload: dict[str, Any]) -> None:
+        expires_in = payload.get("exp", 0) - time.time()
+        self.cache.set(self._key(token), dict(payload), ttl=expires_in)
+
+    def stats(self) -> dict[str, Any]:
+        return self.cache.stats()
+
+
+token_payload_cache = TokenPayloadCache(
+    maxsize=settings.JWT_PAYLOAD_CACHE_MAXSIZE,
+    ttl=settings.JWT_PAYLOAD_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,390 @@
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from functools import wraps
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi_cache import FastAPICache
+from redis import RedisError
+from redis.exceptions import LockError
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.core.cache.backends import TieredBackend
+from src.core.cache.tags import CacheTag, cache_tags
+from src.core.config import settings
+from src.core.redis import get_redis
+from src.core.serialization import current_request, injected_response
+from src.db.database import reads_from_replica
+
+logger = logging.getLogger(__name__)
+
+# Errors of an unavailable or overloaded database. A cached value is served
+# in their place, while anything else, e.g. an invalid cursor, propagates.
+DATABASE_ERRORS = (SQLAlchemyError, OSError)
+
+LOCK_POLL_SECONDS = 0.05
+
+
+@dataclass
+class CachedEntry:
+    ttl: int
+    stamp: bytes
+    body: bytes
+
+
+class ResponseCache:
+    """Caches endpoint responses in the ``FastAPICache`` backend.
+
+    An entry is fresh for ``RESPONSE_CACHE_TTL_SECONDS`` and is then served
+    stale for another ``RESPONSE_CACHE_STALE_SECONDS`` to every request but
+    the one refreshing it. Entries are prefixed with the versions of the
+    endpoint's tags; an entry from older versions is recomputed before it
+    is served.
+
+    Recomputation is single-flight: requests of one worker follow a leading
+    request, and workers share a Redis lock whose losers wait for the
+    winner's value. When the database fails or does not answer within
+    ``RESPONSE_CACHE_REFRESH_TIMEOUT_SECONDS`` the last stored value is
+    served instead.
+
+    For ``REPLICA_PIN_SECONDS`` after a bump, the replica is presumed to lag
+    behind it. Requests read from the replica then store nothing.
+
+    The ETag is derived from the key and the tag versions and Last-Modified
+    from the time of their last bump, so conditional requests are answered
+    with ``304 Not Modified`` before the cache or the database is read.
+    """
+
+    def __init__(self):
+        self._flights: dict[tuple[str, bytes], asyncio.Future] = {}
+        self.not_modified = 0
+
+    def __call__(self, *tags: CacheTag) -> Callable:
+        def wrapper(func: Callable[..., Awaitable[Any]]) -> Callable:
+            @wraps(func)
+            async def inner(*args, **kwargs) -> Any:
+                request = current_request()
+                if not self._cacheable(request):
+                    return await func(*args, **kwargs)
+                stamped = await cache_tags.stamp(tags)
+                if stamped is None:
+                    return await func(*args, **kwargs)
+                stamp, modified_at = stamped
+                response = injected_response()
+                key = FastAPICache.get_key_builder()(
+                    func,
+                    f"{FastAPICache.get_prefix()}:",
+                    request=request,
+                    response=response,
+                    args=args,
+                    kwargs=kwargs,
+                )
+                cache_control = self._cache_control(request)
+                if self._not_modified(request, key, stamp, modified_at):
+                    self.not_modified += 1
+                    return Response(
+                        status_code=304,
+                        headers={
+                            "Cache-Control": cache_control,
+                            **self._validators(key, stamp, modified_at),
+                        },
+                    )
+                if response is not None:
+                    response.headers["Cache-Control"] = cache_control
+                return await self._respond(
+                    key,
+                    stamp.encode(),
+                    modified_at,
+                    lambda: func(*args, **kwargs),
+                    force=request.headers.get("Cache-Control") == "no-cache",
+                    lagging=reads_from_replica(request)
+                    and time.time() - modified_at
+                    < settings.REPLICA_PIN_SECONDS,
+                )
+
+            return inner
+
+        return wrapper
+
+    @staticmethod
+    def _cacheable(request: Optional[Request]) -> bool:
+        return (
+            request is not None
+            and request.method == "GET"
+            and request.headers.get("Cache-Control") != "no-store"
+        )
+
+    @staticmethod
+    def _cache_control(request: Request) -> str:
+        # Responses to authenticated requests are kept out of shared caches.
+        scope = "private" if "Authorization" in request.headers else "public"
+        return (
+            f"{scope}, max-age={settings.RESPONSE_CACHE_HTTP_MAX_AGE_SECONDS}, "
+            "stale-while-revalidate="
+            f"{settings.RESPONSE_CACHE_HTTP_STALE_SECONDS}"
+        )
+
+    @staticmethod
+    def _etag(key: str, stamp: str) -> str:
+        digest = hashlib.md5(
+            f"{key}:{stamp}".encode(), usedforsecurity=False
+        ).hexdigest()
+        return f'W/"{digest}"'
+
+    def _validators(
+        self, key: str, stamp: str, modified_at: float | None
+    ) -> dict[str, str]:
+        validators = {"ETag": self._etag(key, stamp)}
+        # Last-Modified has one-second resolution: sent within the second
+        # of the bump, it would also match a later write in that second.
+        if modified_at and time.time() >= int(modified_at) + 1:
+            validators["Last-Modified"] = formatdate(modified_at, usegmt=True)
+        return validators
+
+    def _not_modified(
+        self, request: Request, key: str, stamp: str, modified_at: float
+    ) -> bool:
+        # If-Modified-Since is ignored when If-None-Match is present.
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match is not None:
+            if if_none_match.strip() == "*":
+                return True
+            etag = self._etag(key, stamp).removeprefix("W/")
+            return any(
+                candidate.strip().removeprefix("W/") == etag
+                for candidate in if_none_match.split(",")
+            )
+        if_modified_since = request.headers.get("If-Modified-Since")
+        if if_modified_since is None or not modified_at:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(modified_at) <= since
+
+    async def _respond(
+        self,
+        key: str,
+        stamp: bytes,
+        modified_at: float,
+        call: Callable[[], Awaitable[Any]],
+        force: bool,
+        lagging: bool,
+    ) -> Any:
+        entry = await self._read(key)
+        current = entry is not None and entry.stamp == stamp and not force
+        if current and entry.ttl > settings.RESPONSE_CACHE_STALE_SECONDS:
+            return self._hit(key, entry, "HIT", modified_at)
+        if lagging:
+            # A current entry was stored from the primary, serve it rather
+            # than a refresh from the replica.
+            if current:
+                return self._hit(key, entry, "STALE", modified_at)
+            return await self._bypass(call)
+        flight = (key, stamp)
+        if current and flight in self._flights:
+            return self._hit(key, entry, "STALE", modified_at)
+
+        try:
+            if flight in self._flights:
+                body = await self._join(flight)
+            else:
+                body = await self._lead(
+                    flight,
+                    call,
+                    wait_for_peer=not current,
+                    timeout=(
+                        settings.RESPONSE_CACHE_REFRESH_TIMEOUT_SECONDS
+                        if entry is not None
+                        else None
+                    ),
+                )
+            if body is None and entry is None:
+                # The leader gave up, compute without coordination.
+                body = await self._store(key, stamp, call)
+        except DATABASE_ERRORS as e:
+            if entry is None:
+                raise
+            logger.warning(f"Serving a stale response for '{key}': {e!r}")
+            body = None
+        if body is None:
+            # An entry of older tag versions predates their last bump, so it
+            # is served without Last-Modified.
+            return self._hit(
+                key,
+                entry,
+                "STALE",
+                modified_at if entry.stamp == stamp else None,
+            )
+        self._set_headers("MISS", key, stamp, modified_at)
+        return FastAPICache.get_coder().decode_as_type(body, type_=None)
+
+    @staticmethod
+    async def _bypass(call: Callable[[], Awaitable[Any]]) -> Any:
+        """Respond without storing while the replica may lag behind a bump.
+
+        Rows read from the replica right after a write may predate it, so
+        they are neither stored under the new stamp nor sent with its
+        validators.
+        """
+        result = await call()
+        response = injected_response()
+        if response is not None:
+            response.headers[FastAPICache.get_cache_status_header()] = "MISS"
+            response.headers["Cache-Control"] = "no-cache"
+        return result
+
+    def _hit(
+        self,
+        key: str,
+        entry: CachedEntry,
+        status: str,
+        modified_at: float | None,
+    ) -> Any:
+        self._set_headers(status, key, entry.stamp, modified_at)
+        return FastAPICache.get_coder().decode_as_type(entry.body, type_=None)
+
+    def _set_headers(
+        self, status: str, key: str, stamp: bytes, modified_at: float | None
+    ) -> None:
+        response = injected_response()
+        if response is not None:
+            response.headers[FastAPICache.get_cache_status_header()] = status
+            response.headers.update(
+                self._validators(key, stamp.decode(), modified_at)
+            )
+
+    async def _lead(
+        self,
+        flight: tuple[str, bytes],
+        call: Callable[[], Awaitable[Any]],
+        wait_for_peer: bool,
+        timeout: float | None,
+    ) -> bytes | None:
+        """Recompute an entry on behalf of every request of this worker.
+
+        The endpoint runs in the leading request itself, as its database
+        session does not outlive the request. Followers get the leader's
+        outcome: the stored body, ``None`` when it gave up, or its error.
+        """
+        outcome = asyncio.get_running_loop().create_future()
+        self._flights[flight] = outcome
+        try:
+            async with asyncio.timeout(timeout):
+                body = await self._recompute(*flight, call, wait_for_peer)
+        except Exception as e:
+            outcome.set_result(e)
+            raise
+        except BaseException:
+            outcome.set_result(None)
+            raise
+        else:
+            outcome.set_result(body)
+            return body
+        finally:
+            del self._flights[flight]
+
+    async def _join(self, flight: tuple[str, bytes]) -> bytes | None:
+        outcome = await asyncio.shield(self._flights[flight])
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def _recompute(
+        self,
+        key: str,
+        stamp: bytes,
+        call: Callable[[], Awaitable[Any]],
+        wait_for_peer: bool,
+    ) -> bytes | None:
+        """Recompute an entry under a Redis lock shared by all workers.
+
+        A stale entry is left to the lock holder and ``None`` is returned,
+        otherwise the holder's value is awaited before computing it here.
+        """
+        redis = get_redis()
+        if redis is None:
+            return await self._store(key, stamp, call)
+        lock = redis.lock(
+            f"{key}:lock", timeout=settings.RESPONSE_CACHE_LOCK_TIMEOUT_SECONDS
+        )
+        try:
+            acquired = await lock.acquire(blocking=False)
+        except RedisError as e:
+            logger.warning(f"Failed to lock cached response '{key}': {e}")
+            return await self._store(key, stamp, call)
+        if not acquired:
+            if not wait_for_peer:
+                return None
+            body = await self._wait_for_peer(key, stamp)
+            return body or await self._store(key, stamp, call)
+        try:
+            return await self._store(key, stamp, call)
+        finally:
+            try:
+                await lock.release()
+            except (LockError, RedisError):
+                pass
+
+    async def _store(
+        self, key: str, stamp: bytes, call: Callable[[], Awaitable[Any]]
+    ) -> bytes:
+        body = FastAPICache.get_coder().encode(await call())
+        await self._write(key, stamp, body)
+        return body
+
+    async def _wait_for_peer(self, key: str, stamp: bytes) -> bytes | None:
+        """Wait for the worker holding the lock to store a fresh value.
+
+        Gives up after the lock timeout, the holder is then presumed dead.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.RESPONSE_CACHE_LOCK_TIMEOUT_SECONDS
+        while loop.time() < deadline:
+            await asyncio.sleep(LOCK_POLL_SECONDS)
+            entry = await self._read(key)
+            if (
+                entry is not None
+                and entry.stamp == stamp
+                and entry.ttl > settings.RESPONSE_CACHE_STALE_SECONDS
+            ):
+                return entry.body
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        backend = FastAPICache.get_backend()
+        tiers = backend.stats() if isinstance(backend, TieredBackend) else {}
+        return {"not_modified": self.not_modified, **tiers}
+
+    @staticmethod
+    async def _read(key: str) -> CachedEntry | None:
+        try:
+            ttl, value = await FastAPICache.get_backend().get_with_ttl(key)
+        except Exception as e:
+            logger.warning(f"Failed to read cached response '{key}': {e}")
+            return None
+        if value is None:
+            return None
+        stamp, _, body = value.partition(b"\n")
+        return CachedEntry(ttl=ttl, stamp=stamp, body=body)
+
+    @staticmethod
+    async def _write(key: str, stamp: bytes, body: bytes) -> None:
+        try:
+            await FastAPICache.get_backend().set(
+                key,
+                stamp + b"\n" + body,
+                expire=settings.RESPONSE_CACHE_TTL_SECONDS
+                + settings.RESPONSE_CACHE_STALE_SECONDS,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store cached response '{key}': {e}")
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,178 @@
+import logging
+import time
+import uuid
+from enum import StrEnum
+from typing import Any, NamedTuple
+
+from redis import RedisError
+from redis.asyncio import Redis
+
+from src.core.cache.invalidation import invalidation_bus
+from src.core.cache.lru import TTLCache
+from src.core.config import settings
+from src.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+class CacheTag(StrEnum):
+    BOOKS = "books"
+    AUTHORS = "authors"
+    GENRES = "genres"
+    LOANS = "loans"
+    USERS = "users"
+
+
+class TagVersion(NamedTuple):
+    version: int
+    # Unix time of the last bump, 0 if the tag was never bumped.
+    modified_at: float
+
+
+class CacheTags:
+    """Per-tag version counters stamped on cached responses.
+
+    An endpoint lists the tags its response depends on and its cached
+    entries are stamped with their current versions. ``invalidate`` bumps
+    a version, so every entry stamped with the old one stops being served
+    as current. Writes must call ``invalidate`` after their commit. The
+    time of the last bump is kept next to each version.
+
+    Versions are also kept in-process for ``local_ttl`` seconds, so a hit
+    on the local response tier needs no Redis round trip. Bumps reach the
+    other workers over the invalidation bus; a missed message delays them
+    by ``local_ttl`` at most. Versions only grow, so a known version is
+    never replaced by a lower one read in a race with a bump.
+
+    Counters restart at 0 when Redis loses them, so stamps also carry an
+    epoch created along with the counters. An entry or ETag issued before
+    the loss never matches the stamps that follow it.
+    """
+
+    key_prefix = "cache-tag"
+    kind = "cache-tag"
+
+    def __init__(self, local_ttl: float):
+        self.local: TTLCache[TagVersion] = TTLCache(len(CacheTag), local_ttl)
+        self.epoch: str | None = None
+        invalidation_bus.subscribe(self.kind, self._bumped, self.local.clear)
+
+    @property
+    def _epoch_key(self) -> str:
+        return f"{self.key_prefix}:epoch"
+
+    def _key(self, tag: CacheTag) -> str:
+        return f"{self.key_prefix}:{tag.value}"
+
+    def _modified_key(self, tag: CacheTag) -> str:
+        return f"{self.key_prefix}:{tag.value}:modified"
+
+    async def versions(
+        self, tags: tuple[CacheTag, ...]
+    ) -> list[TagVersion] | None:
+        known = {tag: self.local.get(tag) for tag in tags}
+        missing = [tag for tag, version in known.items() if version is None]
+        if missing:
+            redis = get_redis()
+            if redis is None:
+                return None
+            try:
+                epoch, *values = await redis.mget(
+                    [self._epoch_key]
+                    + [self._key(tag) for tag in missing]
+                    + [self._modified_key(tag) for tag in missing]
+                )
+                if epoch is None:
+                    epoch = await self._create_epoch(redis)
+            except RedisError as e:
+                logger.warning(
+                    f"Failed to read cache tag versions from Redis: {e}"
+                )
+                return None
+            if self._switch_epoch(epoch) and len(missing) < len(tags):
+                # Versions known from the previous epoch are void.
+                return await self.versions(tags)
+            versions, modified = values[: len(missing)], values[len(missing) :]
+            for tag, version, modified_at in zip(missing, versions, modified):
+                known[tag] = self._remember(
+                    tag,
+                    TagVersion(int(version or 0), float(modified_at or 0)),
+                )
+        return [known[tag] for tag in tags]
+
+    async def invalidate(self, *tags: CacheTag) -> None:
+        redis = get_redis()
+        if redis is None:
+            return
+        modified_at = time.time()
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.set(self._epoch_key, uuid.uuid4().hex, nx=True)
+                pipe.get(self._epoch_key)
+                for tag in tags:
+                    pipe.incr(self._key(tag))
+                    pipe.set(self._modified_key(tag), modified_at)
+                _, epoch, *results = await pipe.execute()
+        except RedisError as e:
+            logger.error(f"Failed to invalidate cache tags {tags}: {e}")
+            return
+        self._switch_epoch(epoch)
+        for tag, version in zip(tags, results[::2]):
+            self._remember(tag, TagVersion(version, modified_at))
+            await invalidation_bus.publish(
+                self.kind,
+                epoch=epoch,
+                tag=tag.value,
+                version=version,
+                modified_at=modified_at,
+            )
+
+    async def _create_epoch(self, redis: Redis) -> str:
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.set(self._epoch_key, uuid.uuid4().hex, nx=True)
+            pipe.get(self._epoch_key)
+            _, epoch = await pipe.execute()
+        return epoch
+
+    def _switch_epoch(self, epoch: str) -> bool:
+        if epoch == self.epoch:
+            return False
+        self.epoch = epoch
+        self.local.clear()
+        return True
+
+    def _remember(self, tag: CacheTag, version: TagVersion) -> TagVersion:
+        known = self.local.get(tag)
+        if known is not None and known.version > version.version:
+            version = known
+        self.local.set(tag, version)
+        return version
+
+    def _bumped(self, message: dict[str, Any]) -> None:
+        # Bumps of another epoch are reconciled when the local versions
+        # expire and are read again.
+        if message["epoch"] != self.epoch:
+            return
+        self._remember(
+            CacheTag(message["tag"]),
+            TagVersion(message["version"], message["modified_at"]),
+        )
+
+    async def stamp(
+        self, tags: tuple[CacheTag, ...]
+    ) -> tuple[str, float] | None:
+        """Render the current versions of ``tags`` for a cached entry.
+
+        Also returns when the last of them was bumped.
+        """
+        versions = await self.versions(tags)
+        if versions is None:
+            return None
+        stamp = f"{self.epoch}:" + ",".join(
+            f"{tag.value}={version.version}"
+            for tag, version in zip(tags, versions)
+        )
+        return stamp, max(version.modified_at for version in versions)
+
+
+cache_tags = CacheTags(local_ttl=settings.RESPONSE_CACHE_LOCAL_TTL_SECONDS)
@@ -0,0 +1,68 @@
+import logging
+import uuid
+
+from redis import RedisError
+
+from src.core.config import settings
+from src.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+class TokenVersionStore:
+    """Redis copy of ``users.token_version`` used to revoke access tokens.
+
+    Keys expire together with the access tokens they guard, a missing key
+    means the caller has to read the version from the database.
+    """
+
+    key_prefix = "token-version"
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+
+    def _key(self, user_id: str | uuid.UUID) -> str:
+        return f"{self.key_prefix}:{user_id}"
+
+    async def get(self, user_id: str | uuid.UUID) -> int | None:
+        redis = get_redis()
+        if redis is None:
+            return None
+        try:
+            version = await redis.get(self._key(user_id))
+        except RedisError as e:
+            logger.warning(f"Failed to read token version from Redis: {e}")
+            return None
+        return int(version) if version is not None else None
+
+    async def set(
+        self, user_id: str | uuid.UUID, version: int, nx: bool = False
+    ) -> None:
+        redis = get_redis()
+        if redis is None:
+            return
+        try:
+            await redis.set(self._key(user_id), version, ex=self.ttl, nx=nx)
+        except RedisError as e:
+            logger.error(f"Failed to store token version in Redis: {e}")
+
+    async def revoke(
+        self, user_id: str | uuid.UUID, version: int | None = None
+    ) -> None:
+        """Replace the stored version, raising ``RedisError`` on failure.
+
+        Without ``version`` the key is deleted and the next check reads the
+        database.
+        """
+        redis = get_redis()
+        if redis is None:
+            return
+        if version is None:
+            await redis.delete(self._key(user_id))
+        else:
+            await redis.set(self._key(user_id), version, ex=self.ttl)
+
+
+token_versions = TokenVersionStore(
+    ttl=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
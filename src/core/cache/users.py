@@ -0,0 +1,132 @@
+import json
+import logging
+import uuid
+from typing import Any
+
+from redis import RedisError
+
+from src.core.cache.invalidation import invalidation_bus
+from src.core.cache.lru import TTLCache
+from src.core.config import settings
+from src.core.redis import get_redis
+from src.db.models.users import Role, User
+
+logger = logging.getLogger(__name__)
+
+
+class UserCache:
+    """Snapshots of authenticated users keyed by the token ``sub``.
+
+    The in-process tier answers most lookups, the optional Redis tier is
+    shared between workers. Writes to a user must call ``invalidate``,
+    which is broadcast so other workers drop their local copy too.
+    """
+
+    key_prefix = "user-snapshot"
+    kind = "user-snapshot"
+
+    def __init__(
+        self, maxsize: int, local_ttl: int, redis_ttl: int, use_redis: bool
+    ):
+        self.local: TTLCache[dict[str, Any]] = TTLCache(maxsize, local_ttl)
+        self.redis_ttl = redis_ttl
+        self.use_redis = use_redis
+        self.redis_hits = 0
+        self.redis_misses = 0
+        invalidation_bus.subscribe(self.kind, self._drop, self.local.clear)
+
+    def _key(self, user_id: str) -> str:
+        return f"{self.key_prefix}:{user_id}"
+
+    @staticmethod
+    def _snapshot(user: User) -> dict[str, Any]:
+        return {
+            "id": str(user.id),
+            "email": user.email,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "role": user.role.value,
+            "is_superuser": bool(user.is_superuser),
+            "token_version": user.token_version,
+        }
+
+    @staticmethod
+    def _to_user(snapshot: dict[str, Any]) -> User:
+        return User(
+            id=uuid.UUID(snapshot["id"]),
+            email=snapshot["email"],
+            first_name=snapshot["first_name"],
+            last_name=snapshot["last_name"],
+            role=Role(snapshot["role"]),
+            is_superuser=snapshot["is_superuser"],
+            token_version=snapshot.get("token_version", 0),
+        )
+
+    async def get(self, user_id: str | uuid.UUID) -> User | None:
+        user_id = str(user_id)
+        snapshot = self.local.get(user_id)
+        if snapshot is None:
+            snapshot = await self._get_from_redis(user_id)
+            if snapshot is None:
+                return None
+            self.local.set(user_id, snapshot)
+        return self._to_user(snapshot)
+
+    async def set(self, user: User) -> None:
+        snapshot = self._snapshot(user)
+        self.local.set(snapshot["id"], snapshot)
+        redis = get_redis()
+        if not self.use_redis or redis is None:
+            return
+        try:
+            await redis.set(
+                self._key(snapshot["id"]),
+                json.dumps(snapshot),
+                ex=self.redis_ttl,
+            )
+        except RedisError as e:
+            logger.warning(f"Failed to store user snapshot in Redis: {e}")
+
+    async def invalidate(self, user_id: str | uuid.UUID) -> None:
+        user_id = str(user_id)
+        self.local.delete(user_id)
+        redis = get_redis()
+        if self.use_redis and redis is not None:
+            try:
+                await redis.delete(self._key(user_id))
+            except RedisError as e:
+                logger.warning(f"Failed to drop user snapshot from Redis: {e}")
+        await invalidation_bus.publish(self.kind, user_id=user_id)
+
+    def _drop(self, message: dict[str, Any]) -> None:
+        self.local.delete(message["user_id"])
+
+    async def _get_from_redis(self, user_id: str) -> dict[str, Any] | None:
+        redis = get_redis()
+        if not self.use_redis or redis is None:
+            return None
+        try:
+            cached = await redis.get(self._key(user_id))
+        except RedisError as e:
+            logger.warning(f"Failed to read user snapshot from Redis: {e}")
+            return None
+        if cached is None:
+            self.redis_misses += 1
+            return None
+        self.redis_hits += 1
+        return json.loads(cached)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "local": self.local.stats(),
+            "redis_hits": self.redis_hits,
+            "redis_misses": self.redis_misses,
+        }
+
+
+user_cache = UserCache(
+    maxsize=settings.USER_CACHE_MAXSIZE,
+    local_ttl=settings.USER_CACHE_LOCAL_TTL_SECONDS,
+    redis_ttl=settings.USER_CACHE_TTL_SECONDS,
+    use_redis=settings.USER_CACHE_USE_REDIS,
+)
@@ -12,19 +12,65 @@ class Settings(BaseSettings):
     DATABASE_USER: str
     DATABASE_PASSWORD: str
     DATABASE_NAME: str
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: int = 30
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_POOL_PRE_PING: bool = True
+    DATABASE_STATEMENT_CACHE_SIZE: int = 100
+
+    REPLICA_DATABASE_HOST: str | None = None
+    REPLICA_DATABASE_PORT: int | None = None
+    REPLICA_PIN_SECONDS: int = 5
 
     BOOK_LOAN_DAYS: int = 14
     BOOK_LIMIT_FOR_USER: int = 5
+    BOOK_IMPORT_BATCH_SIZE: int = 5000
+    BOOK_EXPORT_BATCH_SIZE: int = 1000
+    BATCH_CREATE_MAX_ITEMS: int = 1000
 
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    JWT_PAYLOAD_CACHE_MAXSIZE: int = 10_000
+    JWT_PAYLOAD_CACHE_TTL_SECONDS: int = 300
+
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASHER_EXECUTOR: str = "thread"
+    PASSWORD_HASHER_MAX_WORKERS: int = 4
+    PASSWORD_HASHER_CONCURRENCY: int = 4
+
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS: int = 60
+    # Failures per email and client IP, and per email across all IPs.
+    LOGIN_RATE_LIMIT_PER_EMAIL: int = 5
+    LOGIN_RATE_LIMIT_PER_EMAIL_GLOBAL: int = 50
+    LOGIN_RATE_LIMIT_PER_IP: int = 30
+    # Addresses or networks of reverse proxies whose X-Forwarded-For is
+    # trusted. Behind a proxy, all clients share its IP otherwise.
+    TRUSTED_PROXIES: list[str] = []
+
+    USER_CACHE_MAXSIZE: int = 10_000
+    USER_CACHE_LOCAL_TTL_SECONDS: int = 5
+    USER_CACHE_TTL_SECONDS: int = 300
+    USER_CACHE_USE_REDIS: bool = True
 
     LOG_LEVEL: str = "INFO"
 
     REDIS_URL: str = "redis://localhost:6379"
 
+    RESPONSE_CACHE_TTL_SECONDS: int = 6 * 60 * 60
+    RESPONSE_CACHE_STALE_SECONDS: int = 60 * 60
+    RESPONSE_CACHE_LOCK_TIMEOUT_SECONDS: int = 10
+    RESPONSE_CACHE_REFRESH_TIMEOUT_SECONDS: float = 2.0
+    RESPONSE_CACHE_LOCAL_MAXSIZE: int = 1000
+    RESPONSE_CACHE_LOCAL_TTL_SECONDS: int = 5
+    RESPONSE_CACHE_HTTP_MAX_AGE_SECONDS: int = 5
+    RESPONSE_CACHE_HTTP_STALE_SECONDS: int = 30
+    RESPONSE_CACHE_COMPRESS_MIN_BYTES: int = 1024
+    RESPONSE_CACHE_COMPRESS_LEVEL: int = 6
+
     @property
     def database_url(self) -> str:
         return (
@@ -33,6 +79,17 @@ class Settings(BaseSettings):
             f"{self.DATABASE_PORT}/{self.DATABASE_NAME}"
         )
 
+    @property
+    def replica_database_url(self) -> str | None:
+        if not self.REPLICA_DATABASE_HOST:
+            return None
+        return (
+            f"postgresql+asyncpg://{self.DATABASE_USER}:"
+            f"{self.DATABASE_PASSWORD}@{self.REPLICA_DATABASE_HOST}:"
+            f"{self.REPLICA_DATABASE_PORT or self.DATABASE_PORT}/"
+            f"{self.DATABASE_NAME}"
+        )
+
     model_config = SettingsConfigDict(
         env_file=f".env.{os.getenv('ENV', 'dev')}", env_file_encoding="utf-8"
     )
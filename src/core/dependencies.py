@@ -2,15 +2,17 @@ from typing import Callable, Type, TypeVar
 
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.core.exceptions import PermissionDeniedException
-from src.core.validations import get_current_user
-from src.db.database import get_db
+from src.core.validations import get_current_user, get_user_from_claims
+from src.db.database import get_db, get_read_db, get_read_session_factory
 from src.db.models import User
 from src.services.auth import AuthService
 from src.services.author import AuthorService
 from src.services.book import BookService
+from src.services.book_export import BookExportService
+from src.services.book_import import BookImportService
 from src.services.genre import GenreService
 from src.services.user import UserService
 
@@ -27,11 +29,32 @@ def get_service(service_class: Type[T]) -> Callable[[AsyncSession], T]:
     return _get_service
 
 
+def get_read_service(service_class: Type[T]) -> Callable[[AsyncSession], T]:
+    def _get_read_service(db: AsyncSession = Depends(get_read_db)) -> T:
+        return service_class(db)
+
+    return _get_read_service
+
+
 get_user_service = get_service(UserService)
 get_auth_service = get_service(AuthService)
 get_author_service = get_service(AuthorService)
 get_genre_service = get_service(GenreService)
 get_book_service = get_service(BookService)
+get_book_import_service = get_service(BookImportService)
+
+get_user_read_service = get_read_service(UserService)
+get_author_read_service = get_read_service(AuthorService)
+get_genre_read_service = get_read_service(GenreService)
+get_book_read_service = get_read_service(BookService)
+
+
+def get_book_export_service(
+    session_factory: async_sessionmaker[AsyncSession] = Depends(
+        get_read_session_factory
+    ),
+) -> BookExportService:
+    return BookExportService(session_factory)
 
 
 async def get_current_user_for_access(
@@ -56,8 +79,19 @@ async def get_current_user_for_refresh(
     )
 
 
+async def get_token_user_for_access(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    user_service: UserService = Depends(get_user_service),
+) -> User:
+    return await get_user_from_claims(
+        expected_token_type="access",
+        credentials=credentials,
+        user_service=user_service,
+    )
+
+
 def admin_required(
-    current_user: User = Depends(get_current_user_for_access),
+    current_user: User = Depends(get_token_user_for_access),
 ) -> User:
     if current_user.role != "admin":
         raise PermissionDeniedException()
@@ -65,7 +99,7 @@ def admin_required(
 
 
 def superuser_required(
-    current_user: User = Depends(get_current_user_for_access),
+    current_user: User = Depends(get_token_user_for_access),
 ) -> User:
     if current_user.is_superuser is not True:
         raise PermissionDeniedException()
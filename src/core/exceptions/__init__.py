@@ -4,6 +4,7 @@ from .already_exists import (
     GenreAlreadyExistsException,
     UserAlreadyExistsException,
 )
+from .bad_request import InvalidCursorException
 from .database import DatabaseConnectionException
 from .not_found import (
     AuthorNotFoundException,
@@ -16,3 +17,4 @@ from .unauthorized import (
     InvalidTokenTypeException,
     PermissionDeniedException,
 )
+from .unavailable import TokenRevocationUnavailableException
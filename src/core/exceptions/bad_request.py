@@ -0,0 +1,7 @@
+from src.core.exceptions.base import BadRequestException
+from src.core.exceptions.messages import ErrorMessage
+
+
+class InvalidCursorException(BadRequestException):
+    def __init__(self, detail: str = ErrorMessage.INVALID_CURSOR):
+        super().__init__(detail=detail)
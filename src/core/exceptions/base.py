@@ -3,8 +3,22 @@ from starlette import status
 
 
 class AppException(HTTPException):
-    def __init__(self, status_code: int, detail: str):
-        super().__init__(status_code=status_code, detail=detail)
+    def __init__(
+        self,
+        status_code: int,
+        detail: str,
+        headers: dict[str, str] | None = None,
+    ):
+        super().__init__(
+            status_code=status_code, detail=detail, headers=headers
+        )
+
+
+class BadRequestException(AppException):
+    def __init__(self, detail: str):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=detail
+        )
 
 
 class NotFoundException(AppException):
@@ -28,6 +42,11 @@ class UnauthorizedException(AppException):
 
 class LimitExceededException(AppException):
     def __init__(
-        self, detail: str, status_code: int = status.HTTP_403_FORBIDDEN
+        self,
+        detail: str,
+        status_code: int = status.HTTP_403_FORBIDDEN,
+        headers: dict[str, str] | None = None,
     ):
-        super().__init__(status_code=status_code, detail=detail)
+        super().__init__(
+            status_code=status_code, detail=detail, headers=headers
+        )
@@ -1,3 +1,5 @@
+from starlette import status
+
 from src.core.exceptions.base import LimitExceededException
 from src.core.exceptions.messages import ErrorMessage
 
@@ -5,3 +7,16 @@ from src.core.exceptions.messages import ErrorMessage
 class BookLimitExceededException(LimitExceededException):
     def __init__(self, detail: str = ErrorMessage.BOOK_LIMIT_EXCEEDED):
         super().__init__(detail=detail)
+
+
+class TooManyLoginAttemptsException(LimitExceededException):
+    def __init__(
+        self,
+        retry_after: int,
+        detail: str = ErrorMessage.TOO_MANY_LOGIN_ATTEMPTS,
+    ):
+        super().__init__(
+            detail=detail,
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={"Retry-After": str(retry_after)},
+        )
@@ -21,5 +21,11 @@ class ErrorMessage(str, Enum):
     INVALID_TOKEN_TYPE = "Invalid token type '{current_token_type}' expected '{expected_token_type}'"
 
     DATABASE_CONNECTION_ERROR = "Database connection error"
+    TOKEN_REVOCATION_UNAVAILABLE = (
+        "Access tokens cannot be revoked right now, try again later"
+    )
+
+    INVALID_CURSOR = "Invalid pagination cursor"
 
     BOOK_LIMIT_EXCEEDED = "Book limit exceeded for one user"
+    TOO_MANY_LOGIN_ATTEMPTS = "Too many login attempts, try again later"
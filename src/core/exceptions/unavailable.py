@@ -0,0 +1,13 @@
+from starlette import status
+
+from src.core.exceptions.base import AppException
+from src.core.exceptions.messages import ErrorMessage
+
+
+class TokenRevocationUnavailableException(AppException):
+    def __init__(
+        self, detail: str = ErrorMessage.TOKEN_REVOCATION_UNAVAILABLE
+    ):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail
+        )
@@ -0,0 +1,37 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.db.database import RECENT_WRITE_COOKIE
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class RecentWriteMiddleware:
+    """Marks clients that just wrote so reads are pinned to the primary.
+
+    Successful unsafe requests get a short-lived cookie that
+    ``get_read_db`` checks before choosing the replica.
+    """
+
+    def __init__(self, app: ASGIApp, pin_seconds: int):
+        self.app = app
+        self.cookie = (
+            f"{RECENT_WRITE_COOKIE}=1; Max-Age={pin_seconds}; Path=/; "
+            "HttpOnly; SameSite=Lax"
+        ).encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] < 400
+            ):
+                headers = list(message.get("headers", []))
+                headers.append((b"set-cookie", self.cookie))
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
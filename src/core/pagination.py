@@ -0,0 +1,42 @@
+import base64
+import binascii
+import json
+from typing import Any, Sequence, TypeVar
+
+from fastapi.encoders import jsonable_encoder
+
+from src.core.exceptions import InvalidCursorException
+from src.core.serialization import get_type_adapter
+
+T = TypeVar("T")
+
+
+def encode_cursor(values: dict[str, Any]) -> str:
+    data = json.dumps(jsonable_encoder(values), separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, **fields: type) -> tuple[Any, ...]:
+    """Decode the values of ``fields``, validated as the given types."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+        return tuple(
+            get_type_adapter(type_).validate_python(values[field])
+            for field, type_ in fields.items()
+        )
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise InvalidCursorException()
+
+
+def split_page(
+    rows: Sequence[T], limit: int, *fields: str
+) -> tuple[Sequence[T], str | None]:
+    """Split ``limit + 1`` fetched rows into a page and the next cursor."""
+    if len(rows) <= limit:
+        return rows, None
+    last = rows[limit - 1]
+    next_cursor = encode_cursor(
+        {field: getattr(last, field) for field in fields}
+    )
+    return rows[:limit], next_cursor
@@ -0,0 +1,186 @@
+import ipaddress
+import logging
+import math
+import time
+import uuid
+from typing import Any
+
+from redis import RedisError
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+from starlette.requests import Request
+
+from src.core.config import settings
+from src.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Sliding-window log over one sorted set per key. Every key is trimmed to
+# the current window first; the attempt is recorded on the first ARGV[4]
+# keys only when none of the keys is over its limit, the rest are only
+# checked. Returns {rejected key index, retry ms}.
+SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local member = ARGV[3]
+for i, key in ipairs(KEYS) do
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+    if redis.call('ZCARD', key) >= tonumber(ARGV[4 + i]) then
+        local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+        return {i, tonumber(oldest[2]) + window - now}
+    end
+end
+for i = 1, tonumber(ARGV[4]) do
+    redis.call('ZADD', KEYS[i], now, member)
+    redis.call('PEXPIRE', KEYS[i], window)
+end
+return {0, 0}
+"""
+
+
+def _is_trusted_proxy(host: str) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(
+        address in ipaddress.ip_network(proxy, strict=False)
+        for proxy in settings.TRUSTED_PROXIES
+    )
+
+
+def client_ip(request: Request) -> str | None:
+    """Address of the client as seen through ``TRUSTED_PROXIES``.
+
+    X-Forwarded-For is read from the right while the hop that added the
+    entry is a trusted proxy, so a client cannot choose its own address.
+    """
+    if request.client is None:
+        return None
+    host = request.client.host
+    forwarded = request.headers.get("X-Forwarded-For", "")
+    hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+    while hops and _is_trusted_proxy(host):
+        host = hops.pop()
+    return host
+
+
+class LoginRateLimiter:
+    """Throttles login attempts per client IP and failures per email in Redis.
+
+    Every attempt counts against the client IP, which bounds password
+    spraying. Only failed attempts count against an email: per client IP
+    with a low limit, so guessing from elsewhere cannot lock its owner out,
+    and across all IPs with a higher one, which bounds credential stuffing
+    spread over many IPs. Successful logins never trip either limit.
+    """
+
+    key_prefix = "login-rate"
+
+    def __init__(
+        self,
+        enabled: bool,
+        window_seconds: int,
+        email_limit: int,
+        email_global_limit: int,
+        ip_limit: int,
+    ):
+        self.enabled = enabled
+        self.window_ms = window_seconds * 1000
+        self.email_limit = email_limit
+        self.email_global_limit = email_global_limit
+        self.ip_limit = ip_limit
+        self._script: AsyncScript | None = None
+        self._script_client: Redis | None = None
+        self.allowed = 0
+        self.rejected_by_email = 0
+        self.rejected_by_ip = 0
+        self.errors = 0
+
+    def _get_script(self, redis: Redis) -> AsyncScript:
+        if self._script is None or self._script_client is not redis:
+            self._script = redis.register_script(SLIDING_WINDOW_SCRIPT)
+            self._script_client = redis
+        return self._script
+
+    def _failure_limits(self, email: str, ip: str | None) -> dict[str, int]:
+        key = f"{self.key_prefix}:email:{email.lower()}"
+        if not ip:
+            return {key: self.email_limit}
+        return {
+            f"{key}:ip:{ip}": self.email_limit,
+            key: self.email_global_limit,
+        }
+
+    async def hit(self, email: str, ip: str | None) -> int | None:
+        """Record a login attempt before its credentials are checked.
+
+        Returns ``None`` when the attempt is allowed, otherwise the number
+        of seconds after which the client may retry.
+        """
+        redis = get_redis()
+        if not self.enabled or redis is None:
+            return None
+        # Only the IP key records the attempt, the failure keys are checked.
+        limits = {f"{self.key_prefix}:ip:{ip}": self.ip_limit} if ip else {}
+        limits.update(self._failure_limits(email, ip))
+        now_ms = int(time.time() * 1000)
+        member = f"{now_ms}:{uuid.uuid4().hex}"
+        try:
+            rejected_key, retry_after_ms = await self._get_script(redis)(
+                keys=list(limits),
+                args=[
+                    now_ms,
+                    self.window_ms,
+                    member,
+                    1 if ip else 0,
+                    *limits.values(),
+                ],
+            )
+        except RedisError as e:
+            self.errors += 1
+            logger.warning(f"Login rate limiter is unavailable: {e}")
+            return None
+        if rejected_key == 0:
+            self.allowed += 1
+            return None
+        if ip and rejected_key == 1:
+            self.rejected_by_ip += 1
+        else:
+            self.rejected_by_email += 1
+        return max(1, math.ceil(int(retry_after_ms) / 1000))
+
+    async def fail(self, email: str, ip: str | None) -> None:
+        """Record a login attempt whose credentials were rejected."""
+        redis = get_redis()
+        if not self.enabled or redis is None:
+            return
+        now_ms = int(time.time() * 1000)
+        member = f"{now_ms}:{uuid.uuid4().hex}"
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for key in self._failure_limits(email, ip):
+                    pipe.zadd(key, {member: now_ms})
+                    pipe.pexpire(key, self.window_ms)
+                await pipe.execute()
+        except RedisError as e:
+            self.errors += 1
+            logger.warning(f"Login rate limiter is unavailable: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "allowed": self.allowed,
+            "rejected_by_email": self.rejected_by_email,
+            "rejected_by_ip": self.rejected_by_ip,
+            "errors": self.errors,
+        }
+
+
+login_rate_limiter = LoginRateLimiter(
+    enabled=settings.LOGIN_RATE_LIMIT_ENABLED,
+    window_seconds=settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS,
+    email_limit=settings.LOGIN_RATE_LIMIT_PER_EMAIL,
+    email_global_limit=settings.LOGIN_RATE_LIMIT_PER_EMAIL_GLOBAL,
+    ip_limit=settings.LOGIN_RATE_LIMIT_PER_IP,
+)
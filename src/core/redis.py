@@ -0,0 +1,27 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from redis.asyncio import Redis
+
+_redis: Redis | None = None
+
+
+def set_redis(redis: Redis | None) -> None:
+    global _redis
+    _redis = redis
+
+
+def get_redis() -> Redis | None:
+    return _redis
+
+
+@asynccontextmanager
+async def connect_redis(url: str) -> AsyncIterator[Redis]:
+    """Connect the shared client outside the app, e.g. in scripts."""
+    redis = Redis.from_url(url, encoding="utf8", decode_responses=True)
+    set_redis(redis)
+    try:
+        yield redis
+    finally:
+        set_redis(None)
+        await redis.aclose()
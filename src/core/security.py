@@ -1,11 +1,127 @@
+import asyncio
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Callable, TypeVar
+
 import bcrypt
 
+from src.core.config import settings
+
+T = TypeVar("T")
+
 
-def hash_password(password: str) -> bytes:
-    salt = bcrypt.gensalt()
+def hash_password(password: str, rounds: int | None = None) -> bytes:
+    salt = bcrypt.gensalt(rounds=rounds or settings.BCRYPT_ROUNDS)
     hashed_password = bcrypt.hashpw(password.encode("utf-8"), salt)
     return hashed_password
 
 
 def verify_password(password: str, hashed_password: bytes) -> bool:
     return bcrypt.checkpw(password.encode("utf-8"), hashed_password)
+
+
+def get_hash_rounds(hashed_password: bytes) -> int:
+    # Modular crypt format: $2b$<cost>$<salt and hash>
+    return int(hashed_password.split(b"$")[2])
+
+
+def needs_rehash(hashed_password: bytes) -> bool:
+    return get_hash_rounds(hashed_password) != settings.BCRYPT_ROUNDS
+
+
+class PasswordHasher:
+    """Runs bcrypt off the event loop in a bounded worker pool.
+
+    At most ``concurrency`` jobs are handed to the executor at once, the
+    rest wait on a semaphore, which is what ``queue_depth`` reports.
+    """
+
+    def __init__(self, executor_type: str, max_workers: int, concurrency: int):
+        if executor_type not in ("thread", "process"):
+            raise ValueError(f"Unknown executor type '{executor_type}'")
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self.concurrency = concurrency
+        self._executor: Executor | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.in_flight = 0
+        self.queue_depth = 0
+        self.peak_queue_depth = 0
+        self.completed = 0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="password-hasher"
+                )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        semaphore = self._get_semaphore()
+        self.queue_depth += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+        try:
+            await semaphore.acquire()
+        finally:
+            self.queue_depth -= 1
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(), func, *args
+            )
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            semaphore.release()
+
+    async def hash(self, password: str) -> bytes:
+        return await self._run(hash_password, password)
+
+    async def verify(self, password: str, hashed_password: bytes) -> bool:
+        return await self._run(verify_password, password, hashed_password)
+
+    def stats(self) -> dict[str, int | str]:
+        return {
+            "executor": self.executor_type,
+            "max_workers": self.max_workers,
+            "concurrency": self.concurrency,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "completed": self.completed,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    executor_type=settings.PASSWORD_HASHER_EXECUTOR,
+    max_workers=settings.PASSWORD_HASHER_MAX_WORKERS,
+    concurrency=settings.PASSWORD_HASHER_CONCURRENCY,
+)
+
+
+async def hash_password_async(password: str) -> bytes:
+    return await password_hasher.hash(password)
+
+
+async def verify_password_async(password: str, hashed_password: bytes) -> bool:
+    return await password_hasher.verify(password, hashed_password)
@@ -0,0 +1,75 @@
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Iterable, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.types import Receive, Scope, Send
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_current_request: ContextVar[Request | None] = ContextVar(
+    "current_request", default=None
+)
+_injected_response: ContextVar[Response | None] = ContextVar(
+    "injected_response", default=None
+)
+
+
+async def bind_request(request: Request, response: Response) -> None:
+    """Router dependency that remembers the request and its ``Response``.
+
+    It is async so it runs in the request's own context rather than in a
+    worker thread.
+    """
+    _current_request.set(request)
+    _injected_response.set(response)
+
+
+def current_request() -> Request | None:
+    return _current_request.get()
+
+
+def injected_response() -> Response | None:
+    return _injected_response.get()
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(type_: Any) -> TypeAdapter:
+    return TypeAdapter(type_)
+
+
+def validate_list(model: type[ModelT], objects: Iterable[Any]) -> list[ModelT]:
+    """Validate ORM objects into response models in a single pass."""
+    return get_type_adapter(list[model]).validate_python(
+        objects, from_attributes=True
+    )
+
+
+class JSONBytesResponse(JSONResponse):
+    """JSON response whose body is serialized before it is created.
+
+    Returning a response makes FastAPI skip its own validation and
+    serialization against ``response_model``. It also drops the headers
+    set on the injected ``Response``, which the response cache fills in
+    only after the endpoint returns or before a hit is decoded, so those
+    are merged in on send.
+    """
+
+    def __init__(self, content: bytes, **kwargs):
+        super().__init__(content, **kwargs)
+        self.headers_from = _injected_response.get()
+
+    def render(self, content: bytes) -> bytes:
+        return content
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if self.headers_from is not None:
+            self.headers.update(self.headers_from.headers)
+        await super().__call__(scope, receive, send)
+
+
+def json_response(type_: Any, content: Any) -> JSONBytesResponse:
+    """Serialize validated response models straight to JSON bytes."""
+    return JSONBytesResponse(get_type_adapter(type_).dump_json(content))
@@ -1,12 +1,16 @@
+import uuid
+
 import jwt
 from fastapi.security import HTTPAuthorizationCredentials
 
+from src.core.cache import token_payload_cache, token_versions, user_cache
 from src.core.config import settings
 from src.core.exceptions import (
     InvalidTokenException,
     InvalidTokenTypeException,
 )
 from src.db.models import User
+from src.db.models.users import Role
 from src.services.user import UserService
 
 
@@ -28,15 +32,20 @@ async def get_payload(
     credentials: HTTPAuthorizationCredentials,
     expected_token_type: str,
 ) -> dict:
-    try:
-        token = credentials.credentials
-        payload = jwt.decode(
-            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
-        )
-        await validate_token(expected_token_type, payload)
-        return payload
-    except jwt.PyJWTError:
-        raise InvalidTokenException()
+    token = credentials.credentials
+    payload = token_payload_cache.get(token)
+    if payload is None:
+        try:
+            payload = jwt.decode(
+                token,
+                settings.JWT_SECRET_KEY,
+                algorithms=[settings.JWT_ALGORITHM],
+            )
+        except jwt.PyJWTError:
+            raise InvalidTokenException()
+        token_payload_cache.set(token, payload)
+    await validate_token(expected_token_type, payload)
+    return payload
 
 
 async def get_current_user(
@@ -45,5 +54,36 @@ async def get_current_user(
     user_service: UserService,
 ) -> User:
     payload = await get_payload(credentials, expected_token_type)
-    user = await user_service.get_by_id_or_raise(payload["sub"])
+    return await get_user_by_id(payload["sub"], user_service)
+
+
+async def get_user_by_id(user_id: str, user_service: UserService) -> User:
+    user = await user_cache.get(user_id)
+    if user is None:
+        user = await user_service.get_by_id_or_raise(user_id)
+        await user_cache.set(user)
     return user
+
+
+async def get_user_from_claims(
+    expected_token_type: str,
+    credentials: HTTPAuthorizationCredentials,
+    user_service: UserService,
+) -> User:
+    payload = await get_payload(credentials, expected_token_type)
+    if not {"role", "is_superuser", "ver"} <= payload.keys():
+        return await get_user_by_id(payload["sub"], user_service)
+    version = await token_versions.get(payload["sub"])
+    if version is None:
+        user = await get_user_by_id(payload["sub"], user_service)
+        version = user.token_version
+        await token_versions.set(user.id, version, nx=True)
+    if payload["ver"] != version:
+        raise InvalidTokenException()
+    return User(
+        id=uuid.UUID(payload["sub"]),
+        email=payload.get("email"),
+        role=Role(payload["role"]),
+        is_superuser=payload["is_superuser"],
+        token_version=payload["ver"],
+    )
@@ -1,21 +1,117 @@
 import logging
-from typing import AsyncGenerator
+import time
+from typing import Any, AsyncGenerator
 
+from fastapi import Request
+from sqlalchemy import exc
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.core.config import settings
 from src.core.exceptions import DatabaseConnectionException
 
 logger = logging.getLogger(__name__)
 
-engine = create_async_engine(settings.database_url, echo=settings.DEBUG)
+
+class PoolStats:
+    def __init__(self):
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool) -> None:
+        self.checkouts += 1
+        self.checkout_timeouts += int(timed_out)
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self, pool: AsyncAdaptedQueuePool) -> dict[str, Any]:
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "checkouts": self.checkouts,
+            "checkout_timeouts": self.checkout_timeouts,
+            "avg_wait_ms": (
+                self.total_wait / self.checkouts * 1000
+                if self.checkouts
+                else 0.0
+            ),
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
+
+def instrumented_pool(stats: PoolStats) -> type[AsyncAdaptedQueuePool]:
+    class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+        def connect(self):
+            started = time.perf_counter()
+            timed_out = False
+            try:
+                return super().connect()
+            except exc.TimeoutError:
+                timed_out = True
+                raise
+            finally:
+                stats.record(time.perf_counter() - started, timed_out)
+
+    return InstrumentedQueuePool
+
+
+def create_engine(url: str, stats: PoolStats) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        poolclass=instrumented_pool(stats),
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+        connect_args={
+            "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": (
+                settings.DATABASE_STATEMENT_CACHE_SIZE
+            ),
+        },
+    )
+
+
+pool_stats = PoolStats()
+engine = create_engine(settings.database_url, pool_stats)
 async_session = async_sessionmaker(bind=engine, expire_on_commit=False)
 
+replica_pool_stats = PoolStats()
+replica_engine = (
+    create_engine(settings.replica_database_url, replica_pool_stats)
+    if settings.replica_database_url
+    else None
+)
+async_read_session = (
+    async_sessionmaker(bind=replica_engine, expire_on_commit=False)
+    if replica_engine is not None
+    else async_session
+)
+
+RECENT_WRITE_COOKIE = "recent_write"
+
+
+def get_pool_stats() -> dict[str, Any]:
+    return pool_stats.snapshot(engine.pool)
+
+
+def get_replica_pool_stats() -> dict[str, Any] | None:
+    if replica_engine is None:
+        return None
+    return replica_pool_stats.snapshot(replica_engine.pool)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
@@ -24,3 +120,29 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except SQLAlchemyError as e:
             logger.error(f"Ошибка подключения к базе данных: {e}")
             raise DatabaseConnectionException()
+
+
+def get_read_session_factory(
+    request: Request,
+) -> async_sessionmaker[AsyncSession]:
+    # Clients that wrote recently are pinned to the primary, so they
+    # never read data older than their own writes.
+    if RECENT_WRITE_COOKIE in request.cookies:
+        return async_session
+    return async_read_session
+
+
+def reads_from_replica(request: Request) -> bool:
+    return get_read_session_factory(request) is not async_session
+
+
+async def get_read_db(
+    request: Request,
+) -> AsyncGenerator[AsyncSession, None]:
+    session_factory = get_read_session_factory(request)
+    async with session_factory() as session:
+        try:
+            yield session
+        except SQLAlchemyError as e:
+            logger.error(f"Ошибка подключения к базе данных: {e}")
+            raise DatabaseConnectionException()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Integer, Table
+from sqlalchemy import Column, ForeignKey, Index, Integer, Table
 
 from src.db.base import Base
 
@@ -17,6 +17,7 @@ book_genre_association = Table(
         ForeignKey("genres.id", ondelete="CASCADE"),
         primary_key=True,
     ),
+    Index("ix_book_genre_association_genre_id_book_id", "genre_id", "book_id"),
 )
 
 book_author_association = Table(
@@ -34,4 +35,7 @@ book_author_association = Table(
         ForeignKey("authors.id", ondelete="CASCADE"),
         primary_key=True,
     ),
+    Index(
+        "ix_book_author_association_author_id_book_id", "author_id", "book_id"
+    ),
 )
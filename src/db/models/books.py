@@ -7,7 +7,15 @@ if TYPE_CHECKING:
 else:
     User = "User"
 
-from sqlalchemy import Date, ForeignKey, UniqueConstraint
+from sqlalchemy import (
+    Computed,
+    Date,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+    desc,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.base import (
@@ -28,6 +36,8 @@ from src.db.models.utils import (
     get_current_utc_datetime,
 )
 
+BOOK_SEARCH_CONFIG = "simple"
+
 
 class Genre(Base):
     __tablename__ = "genres"
@@ -59,6 +69,35 @@ class Book(Base):
         "BookLoan", back_populates="book"
     )
     available_copies: Mapped[int] = mapped_column(nullable=False, default=0)
+    loan_count: Mapped[int] = mapped_column(
+        nullable=False, default=0, server_default="0"
+    )
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{BOOK_SEARCH_CONFIG}', "
+            "coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{BOOK_SEARCH_CONFIG}', "
+            "coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_books_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_books_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        Index("ix_books_loan_count_id", desc("loan_count"), "id"),
+    )
 
     def __repr__(self):
         return f"<Book(id={self.id}, title='{self.title}', available_copies={self.available_copies})>"
@@ -88,14 +127,14 @@ class BookLoan(Base):
     )
     book: Mapped["Book"] = relationship("Book", back_populates="book_loans")
     user_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("users.id"), nullable=False
+        ForeignKey("users.id"), nullable=False, index=True
     )
     user: Mapped["User"] = relationship("User", back_populates="book_loans")
     loan_date: Mapped[datetime] = mapped_column(
         nullable=False, default=get_current_utc_datetime
     )
     return_date: Mapped[datetime] = mapped_column(
-        nullable=False, default=default_return_utc_datetime
+        nullable=False, default=default_return_utc_datetime, index=True
     )
     returned: Mapped[bool] = mapped_column(nullable=False, default=False)
 
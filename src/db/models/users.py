@@ -8,7 +8,7 @@ else:
 
 from pydantic import EmailStr
 from sqlalchemy import Enum as SQLAlchemyEnum
-from sqlalchemy import LargeBinary
+from sqlalchemy import Index, LargeBinary, desc
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.base import Base, str_16, uuidpk
@@ -34,6 +34,19 @@ class User(Base):
         "BookLoan", back_populates="user"
     )
     is_superuser: Mapped[bool] = mapped_column(default=False)
+    token_version: Mapped[int] = mapped_column(
+        nullable=False, default=0, server_default="0"
+    )
+    loan_count: Mapped[int] = mapped_column(
+        nullable=False, default=0, server_default="0"
+    )
+    active_loans: Mapped[int] = mapped_column(
+        nullable=False, default=0, server_default="0"
+    )
+
+    __table_args__ = (
+        Index("ix_users_loan_count_id", desc("loan_count"), "id"),
+    )
 
     def __repr__(self):
         return f"<User(email='{self.email}', role='{self.role}')>"
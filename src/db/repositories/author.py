@@ -1,6 +1,7 @@
 from typing import Sequence
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,6 +23,22 @@ class AuthorRepository:
             await self.db.rollback()
             raise AuthorAlreadyExistsException()
 
+    async def create_many(self, authors: list[dict]) -> Sequence[Author]:
+        """Insert new authors in one statement, skipping taken names.
+
+        Only the rows that were actually inserted are returned.
+        """
+        stmt = (
+            insert(Author)
+            .values(authors)
+            .on_conflict_do_nothing(index_elements=[Author.name])
+            .returning(Author)
+        )
+        result = await self.db.execute(stmt)
+        created = result.scalars().all()
+        await self.db.commit()
+        return sorted(created, key=lambda author: author.id)
+
     async def get_all_with_pagination(
         self, limit: int, offset: int
     ) -> Sequence[Author]:
@@ -29,6 +46,15 @@ class AuthorRepository:
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
+    async def get_all_after_cursor(
+        self, limit: int, after_id: int | None = None
+    ) -> Sequence[Author]:
+        stmt = select(Author).order_by(Author.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(Author.id > after_id)
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
+
     async def get_by_id_or_none(self, author_id: int) -> Author | None:
         stmt = select(Author).filter(Author.id == author_id)  # type: ignore
         result = await self.db.execute(stmt)
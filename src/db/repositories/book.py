@@ -1,14 +1,48 @@
 import uuid
 from typing import Any, Optional, Sequence
 
-from sqlalchemy import Row, and_, func, select
+from sqlalchemy import (
+    Select,
+    and_,
+    cast,
+    exists,
+    false,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncScalarResult, AsyncSession
+from sqlalchemy.orm import aliased, selectinload
 
-from src.core.exceptions import BookAlreadyExistsException
+from src.core.exceptions import (
+    BookAlreadyExistsException,
+    UserNotFoundException,
+)
 from src.core.exceptions.already_exists import BookLoanAlreadyExistsException
-from src.db.models.books import Author, Book, BookLoan, Genre
+from src.core.exceptions.base import AppException
+from src.core.exceptions.limit_exceeded import BookLimitExceededException
+from src.core.exceptions.messages import ErrorMessage
+from src.core.exceptions.not_found import (
+    BookCopyNotFoundException,
+    BookNotFoundException,
+)
+from src.db.models.books import (
+    BOOK_SEARCH_CONFIG,
+    Author,
+    Book,
+    BookLoan,
+    Genre,
+)
+from src.db.models.users import User
+from src.db.models.utils import (
+    default_return_utc_datetime,
+    get_current_utc_datetime,
+)
 
 
 class BookRepository:
@@ -24,16 +58,10 @@ class BookRepository:
             await self.db.rollback()
             raise BookAlreadyExistsException()
 
-    async def get_all_with_pagination_and_filtration(
-        self, limit: int, offset: int, filters: Optional[dict[str, Any]] = None
-    ) -> Sequence[Book]:
-        stmt = (
-            select(Book)
-            .options(selectinload(Book.authors), selectinload(Book.genres))
-            .order_by(Book.id)
-            .offset(offset)
-            .limit(limit)
-        )
+    @staticmethod
+    def _apply_filters(
+        stmt: Select, filters: Optional[dict[str, Any]]
+    ) -> Select:
         if filters:
             filter_conditions = []
             if "title" in filters:
@@ -53,10 +81,84 @@ class BookRepository:
 
             if filter_conditions:
                 stmt = stmt.where(and_(*filter_conditions))
+        return stmt
 
+    async def get_all_with_pagination_and_filtration(
+        self, limit: int, offset: int, filters: Optional[dict[str, Any]] = None
+    ) -> Sequence[Book]:
+        stmt = (
+            select(Book)
+            .options(selectinload(Book.authors), selectinload(Book.genres))
+            .order_by(Book.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        stmt = self._apply_filters(stmt, filters)
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
+    async def search_with_pagination_and_filtration(
+        self,
+        query: str,
+        limit: int,
+        offset: int,
+        filters: Optional[dict[str, Any]] = None,
+    ) -> Sequence[Book]:
+        ts_query = func.websearch_to_tsquery(
+            cast(BOOK_SEARCH_CONFIG, REGCONFIG), query
+        )
+        rank = func.ts_rank_cd(Book.search_vector, ts_query) + func.similarity(
+            Book.title, query
+        )
+        stmt = (
+            select(Book)
+            .options(selectinload(Book.authors), selectinload(Book.genres))
+            .where(
+                or_(
+                    Book.search_vector.bool_op("@@")(ts_query),
+                    Book.title.bool_op("%")(query),
+                )
+            )
+            .order_by(rank.desc(), Book.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        stmt = self._apply_filters(stmt, filters)
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
+
+    async def get_all_after_cursor_with_filtration(
+        self,
+        limit: int,
+        after_id: Optional[int] = None,
+        filters: Optional[dict[str, Any]] = None,
+    ) -> Sequence[Book]:
+        stmt = (
+            select(Book)
+            .options(selectinload(Book.authors), selectinload(Book.genres))
+            .order_by(Book.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            stmt = stmt.where(Book.id > after_id)
+        stmt = self._apply_filters(stmt, filters)
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
+
+    async def stream_all(self, batch_size: int) -> AsyncScalarResult[Book]:
+        """Stream every book through a server-side cursor.
+
+        Rows are fetched ``batch_size`` at a time, and the authors and genres
+        are loaded per batch, so memory does not grow with the catalog.
+        """
+        stmt = (
+            select(Book)
+            .options(selectinload(Book.authors), selectinload(Book.genres))
+            .order_by(Book.id)
+            .execution_options(yield_per=batch_size)
+        )
+        return await self.db.stream_scalars(stmt)
+
     async def get_by_id_or_none(self, book_id: int) -> Book | None:
         stmt = (
             select(Book)
@@ -69,26 +171,34 @@ class BookRepository:
 
     async def get_most_popular_books(
         self, limit: int, offset: int
-    ) -> Sequence[Row[tuple[Book, int]]]:
-        subquery = (
-            select(
-                BookLoan.book_id, func.count(BookLoan.id).label("loan_count")
-            )
-            .group_by(BookLoan.book_id)
-            .subquery()
-        )
-
+    ) -> Sequence[Book]:
         stmt = (
-            select(Book, func.coalesce(subquery.c.loan_count, 0))
-            .outerjoin(subquery, Book.id == subquery.c.book_id)
+            select(Book)
             .options(selectinload(Book.authors), selectinload(Book.genres))
-            .order_by(subquery.c.loan_count.desc().nullslast(), Book.id)
+            .order_by(Book.loan_count.desc(), Book.id)
             .offset(offset)
             .limit(limit)
         )
-
         result = await self.db.execute(stmt)
-        return result.all()
+        return result.scalars().all()
+
+    async def reconcile_loan_counts(self) -> int:
+        """Rebuild ``loan_count`` from ``book_loans`` without committing.
+
+        Returns the number of books whose counter had drifted.
+        """
+        actual = (
+            select(func.count(BookLoan.id))
+            .where(BookLoan.book_id == Book.id)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            update(Book)
+            .where(Book.loan_count != actual)
+            .values(loan_count=actual)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
 
     async def update(self, book: Book) -> None:
         await self.db.commit()
@@ -98,14 +208,301 @@ class BookRepository:
         await self.db.delete(book)
         await self.db.commit()
 
-    async def create_book_loan(self, book_loan: BookLoan) -> BookLoan:
+    async def lend(
+        self, book_id: int, user_id: uuid.UUID, loan_limit: int
+    ) -> BookLoan:
+        """Lend a copy of a book in a single transaction.
+
+        The reader's quota slot is taken first with a conditional increment
+        of ``active_loans``, then the copy with a conditional decrement of
+        ``available_copies``. Neither can be overrun by concurrent lends,
+        and rows are always locked user first, then book. A refused lend
+        still reports a missing or unavailable book before the reader's
+        quota.
+        """
         try:
-            self.db.add(book_loan)
+            reserved_slot = await self.db.execute(
+                update(User)
+                .where(User.id == user_id, User.active_loans < loan_limit)
+                .values(
+                    active_loans=User.active_loans + 1,
+                    loan_count=User.loan_count + 1,
+                )
+                .returning(User.id)
+                .execution_options(synchronize_session=False)
+            )
+            if reserved_slot.scalar_one_or_none() is None:
+                await self._check_lendable(book_id)
+                user_exists = await self.db.scalar(
+                    select(exists().where(User.id == user_id))
+                )
+                if not user_exists:
+                    raise UserNotFoundException()
+                raise BookLimitExceededException()
+
+            taken_copy = (
+                update(Book)
+                .where(Book.id == book_id, Book.available_copies > 0)
+                .values(
+                    available_copies=Book.available_copies - 1,
+                    loan_count=Book.loan_count + 1,
+                )
+                .returning(Book.id)
+                .cte("taken_copy")
+            )
+            created_loan = await self.db.scalars(
+                insert(BookLoan)
+                .from_select(
+                    [
+                        "book_id",
+                        "user_id",
+                        "loan_date",
+                        "return_date",
+                        "returned",
+                    ],
+                    select(
+                        taken_copy.c.id,
+                        literal(user_id, BookLoan.user_id.type),
+                        literal(
+                            get_current_utc_datetime(),
+                            BookLoan.loan_date.type,
+                        ),
+                        literal(
+                            default_return_utc_datetime(),
+                            BookLoan.return_date.type,
+                        ),
+                        false(),
+                    ),
+                )
+                .returning(BookLoan)
+            )
+            book_loan = created_loan.one_or_none()
+            if book_loan is None:
+                await self._check_lendable(book_id)
+                raise BookCopyNotFoundException()
+
             await self.db.commit()
             return book_loan
         except IntegrityError:
             await self.db.rollback()
             raise BookLoanAlreadyExistsException()
+        except AppException:
+            await self.db.rollback()
+            raise
+
+    async def _check_lendable(self, book_id: int) -> None:
+        available_copies = await self.db.scalar(
+            select(Book.available_copies).where(Book.id == book_id)
+        )
+        if available_copies is None:
+            raise BookNotFoundException()
+        if available_copies < 1:
+            raise BookCopyNotFoundException()
+
+    async def lend_many(
+        self, book_ids: list[int], user_id: uuid.UUID, loan_limit: int
+    ) -> dict[int, BookLoan | ErrorMessage]:
+        """Lend several books to one reader in a single transaction.
+
+        The reader and then the books, in id order, are locked up front, so
+        every outcome is decided from one consistent view and the copies,
+        counters and loans are written with one statement each. Books are
+        granted in request order until the quota runs out.
+
+        Returns the new loan or the reason it was refused for every
+        distinct book id, in request order.
+        """
+        book_ids = list(dict.fromkeys(book_ids))
+        try:
+            active_loans = await self.db.scalar(
+                select(User.active_loans)
+                .where(User.id == user_id)
+                .with_for_update()
+            )
+            if active_loans is None:
+                raise UserNotFoundException()
+
+            already_lent = (
+                exists()
+                .where(
+                    BookLoan.book_id == Book.id, BookLoan.user_id == user_id
+                )
+                .label("already_lent")
+            )
+            result = await self.db.execute(
+                select(Book.id, Book.available_copies, already_lent)
+                .where(Book.id.in_(book_ids))
+                .order_by(Book.id)
+                .with_for_update(of=Book)
+            )
+            books = {book_id: row for book_id, *row in result.all()}
+
+            outcomes: dict[int, BookLoan | ErrorMessage] = {}
+            granted = []
+            for book_id in book_ids:
+                if book_id not in books:
+                    outcomes[book_id] = ErrorMessage.BOOK_NOT_FOUND
+                    continue
+                available_copies, lent = books[book_id]
+                if lent:
+                    outcomes[book_id] = ErrorMessage.BOOK_LOAN_ALREADY_EXISTS
+                elif available_copies < 1:
+                    outcomes[book_id] = ErrorMessage.BOOK_COPY_NOT_FOUND
+                elif active_loans + len(granted) >= loan_limit:
+                    outcomes[book_id] = ErrorMessage.BOOK_LIMIT_EXCEEDED
+                else:
+                    granted.append(book_id)
+
+            if granted:
+                await self.db.execute(
+                    update(User)
+                    .where(User.id == user_id)
+                    .values(
+                        active_loans=User.active_loans + len(granted),
+                        loan_count=User.loan_count + len(granted),
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                await self.db.execute(
+                    update(Book)
+                    .where(Book.id.in_(granted))
+                    .values(
+                        available_copies=Book.available_copies - 1,
+                        loan_count=Book.loan_count + 1,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                loan_date = get_current_utc_datetime()
+                return_date = default_return_utc_datetime()
+                created_loans = await self.db.scalars(
+                    insert(BookLoan)
+                    .values(
+                        [
+                            {
+                                "book_id": book_id,
+                                "user_id": user_id,
+                                "loan_date": loan_date,
+                                "return_date": return_date,
+                                "returned": False,
+                            }
+                            for book_id in granted
+                        ]
+                    )
+                    .returning(BookLoan)
+                )
+                for book_loan in created_loans:
+                    outcomes[book_loan.book_id] = book_loan
+
+            await self.db.commit()
+            return {book_id: outcomes[book_id] for book_id in book_ids}
+        except IntegrityError:
+            await self.db.rollback()
+            raise BookLoanAlreadyExistsException()
+        except AppException:
+            await self.db.rollback()
+            raise
+
+    async def return_book(
+        self, book_loan_id: int, user_id: uuid.UUID
+    ) -> BookLoan | None:
+        """Close an open loan and put the copy back in one statement.
+
+        The CTEs are chained so rows are locked in the same order as in
+        ``lend``: user first, then book.
+
+        Returns ``None`` when the loan does not exist, belongs to another
+        user or has already been returned.
+        """
+        closed_loan = (
+            update(BookLoan)
+            .where(
+                BookLoan.id == book_loan_id,
+                BookLoan.user_id == user_id,
+                BookLoan.returned.is_(False),
+            )
+            .values(returned=True, return_date=get_current_utc_datetime())
+            .returning(*BookLoan.__table__.c)
+            .cte("closed_loan")
+        )
+        released_slot = (
+            update(User)
+            .where(User.id == closed_loan.c.user_id)
+            .values(active_loans=User.active_loans - 1)
+            .returning(closed_loan.c.book_id)
+            .cte("released_slot")
+        )
+        restocked_book = (
+            update(Book)
+            .where(Book.id == released_slot.c.book_id)
+            .values(available_copies=Book.available_copies + 1)
+            .cte("restocked_book")
+        )
+        result = await self.db.execute(
+            select(aliased(BookLoan, closed_loan)).add_cte(restocked_book)
+        )
+        book_loan = result.scalars().one_or_none()
+        await self.db.commit()
+        return book_loan
+
+    async def return_many(
+        self, book_loan_ids: list[int], user_id: uuid.UUID
+    ) -> dict[int, BookLoan | None]:
+        """Close several open loans of one reader in one statement.
+
+        Works like ``return_book``, except that the restocked books are
+        locked in id order, the same order ``lend_many`` uses.
+
+        Returns the closed loan, or ``None`` for ids that do not exist,
+        belong to another user or have already been returned.
+        """
+        closed_loans = (
+            update(BookLoan)
+            .where(
+                BookLoan.id.in_(book_loan_ids),
+                BookLoan.user_id == user_id,
+                BookLoan.returned.is_(False),
+            )
+            .values(returned=True, return_date=get_current_utc_datetime())
+            .returning(*BookLoan.__table__.c)
+            .cte("closed_loans")
+        )
+        released_slots = (
+            update(User)
+            .where(User.id == user_id, exists(select(closed_loans.c.id)))
+            .values(
+                active_loans=User.active_loans
+                - select(func.count())
+                .select_from(closed_loans)
+                .scalar_subquery()
+            )
+            .returning(User.id)
+            .cte("released_slots")
+        )
+        locked_books = (
+            select(Book.id)
+            .where(
+                Book.id.in_(select(closed_loans.c.book_id)),
+                exists(select(released_slots.c.id)),
+            )
+            .order_by(Book.id)
+            .with_for_update()
+            .cte("locked_books")
+        )
+        restocked_books = (
+            update(Book)
+            .where(Book.id.in_(select(locked_books.c.id)))
+            .values(available_copies=Book.available_copies + 1)
+            .cte("restocked_books")
+        )
+        result = await self.db.execute(
+            select(aliased(BookLoan, closed_loans)).add_cte(restocked_books)
+        )
+        closed = {book_loan.id: book_loan for book_loan in result.scalars()}
+        await self.db.commit()
+        return {
+            book_loan_id: closed.get(book_loan_id)
+            for book_loan_id in book_loan_ids
+        }
 
     async def get_book_loans_by_user_id(self, user_id: uuid.UUID):
         stmt = (
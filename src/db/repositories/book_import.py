@@ -0,0 +1,188 @@
+from datetime import date
+from typing import Optional, Sequence
+
+from sqlalchemy import (
+    ARRAY,
+    Column,
+    Date,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    delete,
+    func,
+    literal_column,
+    select,
+    true,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models.associations import (
+    book_author_association,
+    book_genre_association,
+)
+from src.db.models.books import Author, Book, Genre
+
+StagedBook = tuple[int, str, Optional[str], date, int, list[str], list[str]]
+
+# Lives in its own metadata so ``Base.metadata.create_all`` never sees it.
+book_import_staging = Table(
+    "book_import_staging",
+    MetaData(),
+    Column("line", Integer, primary_key=True, autoincrement=False),
+    Column("title", String(64), nullable=False),
+    Column("description", String(256)),
+    Column("published_at", Date, nullable=False),
+    Column("available_copies", Integer, nullable=False),
+    Column("author_names", ARRAY(String), nullable=False),
+    Column("genre_names", ARRAY(String), nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+
+class BookImportRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def import_batch(
+        self, rows: Sequence[StagedBook]
+    ) -> tuple[int, int, list[tuple[int, str]]]:
+        """Upsert one batch of books in a single transaction.
+
+        Returns the number of created and updated books and the rejected
+        ``(line, detail)`` pairs.
+        """
+        try:
+            await self._stage(rows)
+            errors = await self._reject_invalid_rows()
+            created, updated = await self._upsert_books()
+            await self._link(
+                book_author_association,
+                "author_id",
+                Author,
+                book_import_staging.c.author_names,
+                updated,
+            )
+            await self._link(
+                book_genre_association,
+                "genre_id",
+                Genre,
+                book_import_staging.c.genre_names,
+                updated,
+            )
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        return len(created), len(updated), errors
+
+    async def _stage(self, rows: Sequence[StagedBook]) -> None:
+        connection = await self.db.connection()
+        await connection.run_sync(book_import_staging.create)
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            book_import_staging.name,
+            records=rows,
+            columns=[column.name for column in book_import_staging.c],
+        )
+
+    async def _reject_invalid_rows(self) -> list[tuple[int, str]]:
+        staging = book_import_staging
+        first_line = (
+            func.min(staging.c.line).over(partition_by=staging.c.title)
+        ).label("first_line")
+        duplicates = select(staging.c.line, first_line).subquery()
+        result = await self.db.execute(
+            select(duplicates.c.line, duplicates.c.first_line).where(
+                duplicates.c.line != duplicates.c.first_line
+            )
+        )
+        errors = {
+            line: f"Duplicate title, first seen on line {first}"
+            for line, first in result.all()
+        }
+
+        for model, names, label in (
+            (Author, staging.c.author_names, "author"),
+            (Genre, staging.c.genre_names, "genre"),
+        ):
+            name = func.unnest(names).table_valued("name").lateral()
+            result = await self.db.execute(
+                select(staging.c.line, func.array_agg(name.c.name))
+                .select_from(staging)
+                .join(name, true())
+                .outerjoin(model, model.name == name.c.name)
+                .where(model.id.is_(None))
+                .group_by(staging.c.line)
+            )
+            for line, missing in result.all():
+                detail = f"Unknown {label}: {', '.join(missing)}"
+                errors[line] = (
+                    f"{errors[line]}; {detail}" if line in errors else detail
+                )
+
+        if errors:
+            await self.db.execute(
+                delete(staging).where(staging.c.line.in_(list(errors)))
+            )
+        return sorted(errors.items())
+
+    async def _upsert_books(self) -> tuple[list[int], list[int]]:
+        staging = book_import_staging
+        stmt = insert(Book).from_select(
+            ["title", "description", "published_at", "available_copies"],
+            select(
+                staging.c.title,
+                staging.c.description,
+                staging.c.published_at,
+                staging.c.available_copies,
+            ),
+        )
+        # available_copies of existing books is left to lending and
+        # returns, the file cannot account for copies currently on loan.
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Book.title],
+            set_={
+                "description": stmt.excluded.description,
+                "published_at": stmt.excluded.published_at,
+            },
+        ).returning(
+            Book.id,
+            # xmax is only set on rows rewritten by ON CONFLICT DO UPDATE.
+            (literal_column("xmax") == 0).label("created"),
+        )
+        result = await self.db.execute(stmt)
+        created, updated = [], []
+        for book_id, was_created in result.all():
+            (created if was_created else updated).append(book_id)
+        return created, updated
+
+    async def _link(
+        self,
+        association: Table,
+        key: str,
+        model: type[Author] | type[Genre],
+        names: Column,
+        updated: list[int],
+    ) -> None:
+        staging = book_import_staging
+        if updated:
+            await self.db.execute(
+                delete(association).where(association.c.book_id.in_(updated))
+            )
+        name = func.unnest(names).table_valued("name").lateral()
+        await self.db.execute(
+            insert(association)
+            .from_select(
+                ["book_id", key],
+                select(Book.id, model.id)
+                .select_from(staging)
+                .join(Book, Book.title == staging.c.title)
+                .join(name, true())
+                .join(model, model.name == name.c.name)
+                .distinct(),
+            )
+            .on_conflict_do_nothing()
+        )
@@ -1,6 +1,7 @@
 from typing import Sequence
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,6 +23,22 @@ class GenreRepository:
             await self.db.rollback()
             raise GenreAlreadyExistsException()
 
+    async def create_many(self, genres: list[dict]) -> Sequence[Genre]:
+        """Insert new genres in one statement, skipping taken names.
+
+        Only the rows that were actually inserted are returned.
+        """
+        stmt = (
+            insert(Genre)
+            .values(genres)
+            .on_conflict_do_nothing(index_elements=[Genre.name])
+            .returning(Genre)
+        )
+        result = await self.db.execute(stmt)
+        created = result.scalars().all()
+        await self.db.commit()
+        return sorted(created, key=lambda genre: genre.id)
+
     async def get_by_ids_or_none(
         self, genre_ids: list[int]
     ) -> list[Genre] | None:
@@ -43,6 +60,15 @@ class GenreRepository:
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
+    async def get_all_after_cursor(
+        self, limit: int, after_id: int | None = None
+    ) -> Sequence[Genre]:
+        stmt = select(Genre).order_by(Genre.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(Genre.id > after_id)
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
+
     async def delete(self, genre: Genre) -> None:
         await self.db.delete(genre)
         await self.db.commit()
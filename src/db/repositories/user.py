@@ -2,7 +2,7 @@ import uuid
 from typing import Sequence
 
 from pydantic import EmailStr
-from sqlalchemy import Row, func, select
+from sqlalchemy import func, or_, select, tuple_, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -48,27 +48,57 @@ class UserRepository:
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
+    async def get_all_after_cursor(
+        self,
+        limit: int,
+        after: tuple[str, uuid.UUID] | None = None,
+    ) -> Sequence[User]:
+        stmt = select(User).order_by(User.email, User.id).limit(limit)
+        if after is not None:
+            stmt = stmt.where(tuple_(User.email, User.id) > after)
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
+
     async def get_most_active_users(
         self, limit: int, offset: int
-    ) -> Sequence[Row[tuple[User, int]]]:
-        subquery = (
-            select(
-                BookLoan.user_id, func.count(BookLoan.id).label("loan_count")
-            )
-            .group_by(BookLoan.user_id)
-            .subquery()
-        )
-
+    ) -> Sequence[User]:
         stmt = (
-            select(User, func.coalesce(subquery.c.loan_count, 0))
-            .outerjoin(subquery, User.id == subquery.c.user_id)
-            .order_by(subquery.c.loan_count.desc().nullslast(), User.id)
+            select(User)
+            .order_by(User.loan_count.desc(), User.id)
             .offset(offset)
             .limit(limit)
         )
-
         result = await self.db.execute(stmt)
-        return result.all()
+        return result.scalars().all()
+
+    async def reconcile_loan_counts(self) -> int:
+        """Rebuild ``loan_count`` and ``active_loans`` from ``book_loans``
+        without committing.
+
+        Returns the number of users whose counters had drifted.
+        """
+        actual_loans = (
+            select(func.count(BookLoan.id))
+            .where(BookLoan.user_id == User.id)
+            .scalar_subquery()
+        )
+        actual_active_loans = (
+            select(func.count(BookLoan.id))
+            .where(BookLoan.user_id == User.id, BookLoan.returned.is_(False))
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            update(User)
+            .where(
+                or_(
+                    User.loan_count != actual_loans,
+                    User.active_loans != actual_active_loans,
+                )
+            )
+            .values(loan_count=actual_loans, active_loans=actual_active_loans)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
 
     async def update(self, user: User) -> None:
         await self.db.commit()
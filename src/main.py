@@ -10,8 +10,17 @@ from redis import RedisError
 from redis import asyncio as aioredis
 
 from src.api.v1 import router as v1_router
+from src.core.cache import (
+    ResponseBytesCoder,
+    TieredBackend,
+    invalidation_bus,
+    request_key_builder,
+)
 from src.core.config import settings
 from src.core.logging import setup_logging
+from src.core.middleware import RecentWriteMiddleware
+from src.core.redis import set_redis
+from src.core.security import password_hasher
 
 setup_logging()
 
@@ -31,13 +40,35 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
             f"Failed to connect to Redis: {type(e).__name__}: {str(e)}"
         )
         raise RuntimeError(f"Redis connection error: {e}")
-    FastAPICache.init(RedisBackend(redis), prefix="fastapi-cache")
+    # Cached responses are raw, possibly compressed bytes, so the cache
+    # gets a client that does not decode replies.
+    cache_redis = aioredis.from_url(settings.REDIS_URL)
+    FastAPICache.init(
+        TieredBackend(
+            RedisBackend(cache_redis),
+            maxsize=settings.RESPONSE_CACHE_LOCAL_MAXSIZE,
+            local_ttl=settings.RESPONSE_CACHE_LOCAL_TTL_SECONDS,
+        ),
+        prefix="fastapi-cache",
+        coder=ResponseBytesCoder,
+        key_builder=request_key_builder,
+    )
+    set_redis(redis)
+    invalidation_bus.start(redis)
     yield
+    await invalidation_bus.stop()
+    set_redis(None)
+    await cache_redis.aclose()
     await redis.aclose()
+    password_hasher.shutdown()
 
 
 app = FastAPI(debug=settings.DEBUG, lifespan=lifespan)
 
+app.add_middleware(
+    RecentWriteMiddleware, pin_seconds=settings.REPLICA_PIN_SECONDS
+)
+
 app.include_router(v1_router)
 
 
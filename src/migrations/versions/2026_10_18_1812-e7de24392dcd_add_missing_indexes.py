@@ -0,0 +1,54 @@
+"""add missing indexes
+
+Revision ID: e7de24392dcd
+Revises: 7275a97e9a43
+Create Date: 2026-10-18 18:12:41.503318
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7de24392dcd"
+down_revision: Union[str, None] = "7275a97e9a43"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_book_author_association_author_id_book_id",
+        "book_author_association",
+        ["author_id", "book_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_book_genre_association_genre_id_book_id",
+        "book_genre_association",
+        ["genre_id", "book_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_book_loans_return_date"),
+        "book_loans",
+        ["return_date"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_book_loans_user_id"), "book_loans", ["user_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_book_loans_user_id"), table_name="book_loans")
+    op.drop_index(op.f("ix_book_loans_return_date"), table_name="book_loans")
+    op.drop_index(
+        "ix_book_genre_association_genre_id_book_id",
+        table_name="book_genre_association",
+    )
+    op.drop_index(
+        "ix_book_author_association_author_id_book_id",
+        table_name="book_author_association",
+    )
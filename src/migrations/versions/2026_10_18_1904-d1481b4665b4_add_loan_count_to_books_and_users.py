@@ -0,0 +1,68 @@
+"""add loan_count to books and users
+
+Revision ID: d1481b4665b4
+Revises: e7de24392dcd
+Create Date: 2026-10-18 19:04:52.118734
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d1481b4665b4"
+down_revision: Union[str, None] = "e7de24392dcd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "books",
+        sa.Column(
+            "loan_count", sa.Integer(), server_default="0", nullable=False
+        ),
+    )
+    op.add_column(
+        "users",
+        sa.Column(
+            "loan_count", sa.Integer(), server_default="0", nullable=False
+        ),
+    )
+    op.execute(
+        """
+        UPDATE books SET loan_count = counts.loan_count
+        FROM (SELECT book_id, count(*) AS loan_count
+              FROM book_loans GROUP BY book_id) AS counts
+        WHERE books.id = counts.book_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE users SET loan_count = counts.loan_count
+        FROM (SELECT user_id, count(*) AS loan_count
+              FROM book_loans GROUP BY user_id) AS counts
+        WHERE users.id = counts.user_id
+        """
+    )
+    op.create_index(
+        "ix_books_loan_count_id",
+        "books",
+        [sa.text("loan_count DESC"), "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_users_loan_count_id",
+        "users",
+        [sa.text("loan_count DESC"), "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_loan_count_id", table_name="users")
+    op.drop_index("ix_books_loan_count_id", table_name="books")
+    op.drop_column("users", "loan_count")
+    op.drop_column("books", "loan_count")
@@ -0,0 +1,40 @@
+"""add active_loans to users
+
+Revision ID: 6ca2426d9644
+Revises: d1481b4665b4
+Create Date: 2026-10-18 19:41:17.662093
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6ca2426d9644"
+down_revision: Union[str, None] = "d1481b4665b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column(
+            "active_loans", sa.Integer(), server_default="0", nullable=False
+        ),
+    )
+    op.execute(
+        """
+        UPDATE users SET active_loans = counts.active_loans
+        FROM (SELECT user_id, count(*) AS active_loans
+              FROM book_loans WHERE returned IS false
+              GROUP BY user_id) AS counts
+        WHERE users.id = counts.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "active_loans")
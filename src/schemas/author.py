@@ -22,5 +22,10 @@ class AuthorUpdate(BaseModel):
     birth_date: Optional[date] = Field(default=None)
 
 
+class AuthorBatchCreateResponse(BaseModel):
+    created: list[AuthorResponse]
+    existing: list[str]
+
+
 class AuthorDeleteResponse(BaseModel):
     message: Optional[str] = Field(default="Author deleted successfully")
@@ -1,11 +1,12 @@
 import uuid
 from datetime import date, datetime
+from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from src.schemas.author import AuthorResponse
-from src.schemas.common import PaginationParams
+from src.schemas.common import CursorPaginationParams, PaginationParams
 from src.schemas.genre import GenreResponse
 
 
@@ -57,6 +58,10 @@ class BookFilterParams(BaseModel):
 
 
 class BookQueryParams(BookFilterParams, PaginationParams):
+    search: Optional[str] = Field(default=None, min_length=1, max_length=64)
+
+
+class BookCursorQueryParams(BookFilterParams, CursorPaginationParams):
     pass
 
 
@@ -78,6 +83,27 @@ class BookLoanResponse(BookLoanCreate):
     model_config = ConfigDict(from_attributes=True)
 
 
+class BookLoanBatchCreate(BaseModel):
+    user_id: uuid.UUID
+    book_ids: list[int] = Field(..., min_length=1, max_length=100)
+
+
+class BookLendResult(BaseModel):
+    book_id: int
+    loan: Optional[BookLoanResponse] = None
+    error: Optional[str] = None
+
+
+class BookLoanBatchReturn(BaseModel):
+    loan_ids: list[int] = Field(..., min_length=1, max_length=100)
+
+
+class BookReturnResult(BaseModel):
+    loan_id: int
+    loan: Optional[BookLoanResponse] = None
+    error: Optional[str] = None
+
+
 class BookLoanUpdate(BaseModel):
     return_date: datetime
     returned: bool
@@ -85,3 +111,48 @@ class BookLoanUpdate(BaseModel):
 
 class BookLoanReturnResponse(BaseModel):
     message: Optional[str] = Field(default="Book returned successfully")
+
+
+class BookFileFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class BookImportRow(BaseModel):
+    title: str = Field(..., min_length=1, max_length=64)
+    description: Optional[str] = Field(default=None, max_length=256)
+    published_at: date
+    available_copies: int = Field(default=0, ge=0)
+    authors: list[str] = Field(..., min_length=1)
+    genres: list[str] = Field(..., min_length=1)
+
+    @field_validator("description", mode="before")
+    def empty_to_none(cls, value):
+        if value == "":
+            return None
+        return value
+
+    @field_validator("available_copies", mode="before")
+    def empty_to_zero(cls, value):
+        if value == "":
+            return 0
+        return value
+
+    @field_validator("authors", "genres", mode="before")
+    def split_names(cls, value):
+        if isinstance(value, str):
+            return [name.strip() for name in value.split(";") if name.strip()]
+        return value
+
+
+class BookImportError(BaseModel):
+    line: int
+    detail: str
+
+
+class BookImportReport(BaseModel):
+    total: int = 0
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+    errors: list[BookImportError] = Field(default_factory=list)
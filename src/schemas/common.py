@@ -1,6 +1,20 @@
+from typing import Generic, Optional, TypeVar
+
 from pydantic import BaseModel, Field
 
+T = TypeVar("T")
+
 
 class PaginationParams(BaseModel):
     limit: int = Field(default=10, gt=0, le=100)
     offset: int = Field(default=0, ge=0)
+
+
+class CursorPaginationParams(BaseModel):
+    limit: int = Field(default=10, gt=0, le=100)
+    cursor: Optional[str] = Field(default=None)
+
+
+class CursorPage(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: Optional[str] = None
@@ -13,5 +13,10 @@ class GenreResponse(GenreCreate):
     model_config = ConfigDict(from_attributes=True)
 
 
+class GenreBatchCreateResponse(BaseModel):
+    created: list[GenreResponse]
+    existing: list[str]
+
+
 class GenreDeleteResponse(BaseModel):
     message: Optional[str] = Field(default="Genre deleted successfully")
@@ -0,0 +1,24 @@
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class DatabasePoolMetrics(BaseModel):
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    checkout_timeouts: int
+    avg_wait_ms: float
+    max_wait_ms: float
+
+
+class MetricsResponse(BaseModel):
+    database_pool: DatabasePoolMetrics
+    replica_database_pool: DatabasePoolMetrics | None
+    password_hasher: dict[str, Any]
+    login_rate_limiter: dict[str, Any]
+    token_payload_cache: dict[str, Any]
+    user_cache: dict[str, Any]
+    response_cache: dict[str, Any]
@@ -0,0 +1,53 @@
+"""Recommend a BCRYPT_ROUNDS value for this host.
+
+python -m src.scripts.calibrate_bcrypt --target-ms 250
+"""
+
+import argparse
+import statistics
+import time
+
+import bcrypt
+
+MIN_ROUNDS = 4
+MAX_ROUNDS = 31
+
+
+def measure(rounds: int, samples: int) -> float:
+    password = b"Calibrate0!"
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds))
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(target_ms: float, samples: int) -> int:
+    recommended = MIN_ROUNDS
+    for rounds in range(MIN_ROUNDS, MAX_ROUNDS + 1):
+        elapsed = measure(rounds, samples)
+        print(f"rounds={rounds:>2}: {elapsed:8.1f} ms")
+        if elapsed > target_ms:
+            break
+        recommended = rounds
+    return recommended
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=250,
+        help="upper bound for a single hash on this host",
+    )
+    parser.add_argument("--samples", type=int, default=3)
+    args = parser.parse_args()
+
+    recommended = calibrate(args.target_ms, args.samples)
+    print(f"\nRecommended: BCRYPT_ROUNDS={recommended}")
+
+
+if __name__ == "__main__":
+    main()
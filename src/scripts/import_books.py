@@ -0,0 +1,66 @@
+"""Bulk import books from a CSV or NDJSON file.
+
+python -m src.scripts.import_books catalog.csv
+python -m src.scripts.import_books catalog.ndjson --format ndjson
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+from typing import AsyncIterator
+
+from src.core.config import settings
+from src.core.redis import connect_redis
+from src.db.database import async_session, engine
+from src.schemas.book import BookFileFormat, BookImportReport
+from src.services.book_import import BookImportService
+
+CHUNK_SIZE = 1 << 16
+
+
+async def read_chunks(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as file:
+        while chunk := file.read(CHUNK_SIZE):
+            yield chunk
+
+
+async def run(
+    path: Path, import_format: BookFileFormat, batch_size: int
+) -> BookImportReport:
+    # The service invalidates cached books after each batch.
+    async with connect_redis(settings.REDIS_URL), async_session() as session:
+        report = await BookImportService(session).import_stream(
+            read_chunks(path), import_format, batch_size=batch_size
+        )
+    await engine.dispose()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path)
+    parser.add_argument(
+        "--format",
+        type=BookFileFormat,
+        choices=list(BookFileFormat),
+        help="defaults to the file extension",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.BOOK_IMPORT_BATCH_SIZE
+    )
+    args = parser.parse_args()
+
+    import_format = args.format or BookFileFormat(
+        args.path.suffix.lstrip(".").lower()
+    )
+    report = asyncio.run(run(args.path, import_format, args.batch_size))
+    for error in report.errors:
+        print(f"line {error.line}: {error.detail}")
+    print(
+        f"{report.total} rows: {report.created} created, "
+        f"{report.updated} updated, {report.failed} failed"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Rebuild the loan counters of books and users from book_loans.
+
+python -m src.scripts.reconcile_loan_counts
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import text
+
+from src.core.cache import CacheTag, cache_tags
+from src.core.config import settings
+from src.core.redis import connect_redis
+from src.db.database import async_session, engine
+from src.db.repositories.book import BookRepository
+from src.db.repositories.user import UserRepository
+
+
+async def reconcile(dry_run: bool) -> tuple[int, int]:
+    async with async_session() as session:
+        # SHARE mode blocks new loans until the counters are rewritten, so
+        # nothing can be lent between counting and updating.
+        await session.execute(text("LOCK TABLE book_loans IN SHARE MODE"))
+        books = await BookRepository(session).reconcile_loan_counts()
+        users = await UserRepository(session).reconcile_loan_counts()
+        if dry_run:
+            await session.rollback()
+        else:
+            await session.commit()
+    await engine.dispose()
+    if not dry_run and (books or users):
+        async with connect_redis(settings.REDIS_URL):
+            await cache_tags.invalidate(CacheTag.LOANS)
+    return books, users
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="report drifted counters without writing them",
+    )
+    args = parser.parse_args()
+
+    books, users = asyncio.run(reconcile(args.dry_run))
+    action = "Would fix" if args.dry_run else "Fixed"
+    print(f"{action} loan counters for {books} books and {users} users")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import create_access_token, create_refresh_token
 from src.core.exceptions import InvalidCredentialException
-from src.core.security import verify_password
+from src.core.exceptions.limit_exceeded import TooManyLoginAttemptsException
+from src.core.rate_limit import login_rate_limiter
+from src.core.security import (
+    hash_password_async,
+    needs_rehash,
+    verify_password_async,
+)
+from src.db.models import User
 from src.db.repositories.user import UserRepository
 from src.schemas.auth import AccessToken, TokenPair
 from src.schemas.users import UserLogin
@@ -12,20 +19,33 @@ class AuthService:
     def __init__(self, db: AsyncSession):
         self.user_repo = UserRepository(db)
 
-    async def login(self, user_data: UserLogin) -> TokenPair:
+    async def login(
+        self, user_data: UserLogin, client_ip: str | None = None
+    ) -> TokenPair:
+        retry_after = await login_rate_limiter.hit(user_data.email, client_ip)
+        if retry_after is not None:
+            raise TooManyLoginAttemptsException(retry_after)
         db_user = await self.user_repo.get_by_email_or_none(user_data.email)
-        if not db_user or not verify_password(
+        if not db_user or not await verify_password_async(
             user_data.password, db_user.hashed_password
         ):
+            await login_rate_limiter.fail(user_data.email, client_ip)
             raise InvalidCredentialException()
+        if needs_rehash(db_user.hashed_password):
+            db_user.hashed_password = await hash_password_async(
+                user_data.password
+            )
+            await self.user_repo.update(db_user)
 
-        access_token = create_access_token(data={"sub": db_user.id})
+        access_token = create_access_token(
+            data={"sub": db_user.id}, user=db_user
+        )
         refresh_token = create_refresh_token(data={"sub": db_user.id})
         return TokenPair(
             access_token=access_token, refresh_token=refresh_token
         )
 
     @staticmethod
-    async def refresh_jwt(data: dict) -> AccessToken:
-        access_token = create_access_token(data=data)
+    async def refresh_jwt(user: User) -> AccessToken:
+        access_token = create_access_token(data={"sub": user.id}, user=user)
         return AccessToken(access_token=access_token)
@@ -1,9 +1,17 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import CacheTag, cache_tags
 from src.core.exceptions import AuthorNotFoundException
+from src.core.pagination import decode_cursor, split_page
+from src.core.serialization import validate_list
 from src.db.models.books import Author
 from src.db.repositories.author import AuthorRepository
-from src.schemas.author import AuthorCreate, AuthorResponse
+from src.schemas.author import (
+    AuthorBatchCreateResponse,
+    AuthorCreate,
+    AuthorResponse,
+)
+from src.schemas.common import CursorPage, CursorPaginationParams
 
 
 class AuthorService:
@@ -17,15 +25,50 @@ class AuthorService:
             birth_date=author_data.birth_date,
         )
         created_author = await self.author_repo.create(author)
+        await cache_tags.invalidate(CacheTag.AUTHORS)
         return AuthorResponse.model_validate(created_author)
 
+    async def create_many(
+        self, authors_data: list[AuthorCreate]
+    ) -> AuthorBatchCreateResponse:
+        # A name repeated within the batch is created once, from its first
+        # occurrence.
+        rows = {}
+        for author_data in authors_data:
+            rows.setdefault(author_data.name, author_data.model_dump())
+        created = await self.author_repo.create_many(list(rows.values()))
+        if created:
+            await cache_tags.invalidate(CacheTag.AUTHORS)
+        created_names = {author.name for author in created}
+        return AuthorBatchCreateResponse(
+            created=[
+                AuthorResponse.model_validate(author) for author in created
+            ],
+            existing=[name for name in rows if name not in created_names],
+        )
+
     async def get_all_with_pagination(
         self, limit: int, offset: int
     ) -> list[AuthorResponse]:
         authors = await self.author_repo.get_all_with_pagination(
             limit=limit, offset=offset
         )
-        return [AuthorResponse.model_validate(author) for author in authors]
+        return validate_list(AuthorResponse, authors)
+
+    async def get_all_with_cursor(
+        self, params: CursorPaginationParams
+    ) -> CursorPage[AuthorResponse]:
+        after_id = None
+        if params.cursor:
+            (after_id,) = decode_cursor(params.cursor, id=int)
+        authors = await self.author_repo.get_all_after_cursor(
+            limit=params.limit + 1, after_id=after_id
+        )
+        authors, next_cursor = split_page(authors, params.limit, "id")
+        return CursorPage[AuthorResponse](
+            items=validate_list(AuthorResponse, authors),
+            next_cursor=next_cursor,
+        )
 
     async def get_by_id_or_raise(self, user_id: int) -> Author:
         author = await self.author_repo.get_by_id_or_none(user_id)
@@ -46,8 +89,10 @@ class AuthorService:
         ).items():
             setattr(author, key, value)
         await self.author_repo.update(author)
+        await cache_tags.invalidate(CacheTag.AUTHORS)
         return AuthorResponse.model_validate(author)
 
     async def delete(self, author_id) -> None:
         author = await self.get_by_id_or_raise(author_id)
         await self.author_repo.delete(author)
+        await cache_tags.invalidate(CacheTag.AUTHORS)
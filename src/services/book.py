@@ -1,28 +1,35 @@
 import uuid
-from datetime import UTC, datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import CacheTag, cache_tags
 from src.core.config import settings
-from src.core.exceptions.limit_exceeded import BookLimitExceededException
+from src.core.exceptions.messages import ErrorMessage
 from src.core.exceptions.not_found import (
-    BookCopyNotFoundException,
     BookLoanNotFoundException,
     BookNotFoundException,
 )
+from src.core.pagination import decode_cursor, split_page
+from src.core.serialization import validate_list
 from src.db.models.books import Author, Book, BookLoan, Genre
 from src.db.repositories.book import BookRepository
 from src.schemas.book import (
     BookCreate,
+    BookCursorQueryParams,
     BookFilterParams,
+    BookLendResult,
+    BookLoanBatchCreate,
+    BookLoanBatchReturn,
     BookLoanCreate,
     BookLoanResponse,
     BookLoanUpdate,
     BookQueryParams,
     BookResponse,
     BookResponseWithStats,
+    BookReturnResult,
     BookUpdate,
 )
+from src.schemas.common import CursorPage
 from src.services.author import AuthorService
 from src.services.genre import GenreService
 from src.services.user import UserService
@@ -51,6 +58,7 @@ class BookService:
             available_copies=book_data.available_copies,
         )
         created_book = await self.book_repo.create(book)
+        await cache_tags.invalidate(CacheTag.BOOKS)
         return BookResponse.model_validate(created_book)
 
     async def get_all_with_pagination_and_filtration(
@@ -59,10 +67,38 @@ class BookService:
         filters = BookFilterParams.model_validate(params).model_dump(
             exclude_none=True, exclude_unset=True
         )
-        books = await self.book_repo.get_all_with_pagination_and_filtration(
-            limit=params.limit, offset=params.offset, filters=filters
+        if params.search:
+            books = await self.book_repo.search_with_pagination_and_filtration(
+                query=params.search,
+                limit=params.limit,
+                offset=params.offset,
+                filters=filters,
+            )
+        else:
+            books = (
+                await self.book_repo.get_all_with_pagination_and_filtration(
+                    limit=params.limit, offset=params.offset, filters=filters
+                )
+            )
+        return validate_list(BookResponse, books)
+
+    async def get_all_with_cursor_and_filtration(
+        self, params: BookCursorQueryParams
+    ) -> CursorPage[BookResponse]:
+        filters = BookFilterParams.model_validate(params).model_dump(
+            exclude_none=True, exclude_unset=True
+        )
+        after_id = None
+        if params.cursor:
+            (after_id,) = decode_cursor(params.cursor, id=int)
+        books = await self.book_repo.get_all_after_cursor_with_filtration(
+            limit=params.limit + 1, after_id=after_id, filters=filters
+        )
+        books, next_cursor = split_page(books, params.limit, "id")
+        return CursorPage[BookResponse](
+            items=validate_list(BookResponse, books),
+            next_cursor=next_cursor,
         )
-        return [BookResponse.model_validate(book) for book in books]
 
     async def get_by_id_or_raise(self, book_id: int) -> Book:
         book = await self.book_repo.get_by_id_or_none(book_id)
@@ -76,11 +112,7 @@ class BookService:
         books = await self.book_repo.get_most_popular_books(
             limit=limit, offset=offset
         )
-        books_with_stats = []
-        for book, loan_count in books:
-            book.loan_count = loan_count
-            books_with_stats.append(BookResponseWithStats.model_validate(book))
-        return books_with_stats
+        return validate_list(BookResponseWithStats, books)
 
     async def update(self, book_id: int, new_data: BookUpdate) -> BookResponse:
         book = await self.get_by_id_or_raise(book_id)
@@ -97,12 +129,14 @@ class BookService:
         ).items():
             setattr(book, key, value)
         await self.book_repo.update(book)
+        await cache_tags.invalidate(CacheTag.BOOKS)
         updated_book = await self.get_by_id_or_raise(book.id)
         return BookResponse.model_validate(updated_book)
 
     async def delete(self, book_id) -> None:
         book = await self.get_by_id_or_raise(book_id)
         await self.book_repo.delete(book)
+        await cache_tags.invalidate(CacheTag.BOOKS)
 
     async def get_book_loan_by_id_or_raise(
         self, book_loan_id: int
@@ -128,36 +162,66 @@ class BookService:
         ).items():
             setattr(book_loan, key, value)
         await self.book_repo.update_book_loan(book_loan)
+        await cache_tags.invalidate(CacheTag.LOANS)
         return BookLoanResponse.model_validate(book_loan)
 
     async def lend(self, book_loan: BookLoanCreate) -> BookLoanResponse:
-        book = await self.get_by_id_or_raise(book_loan.book_id)
-        if book.available_copies <= 0:
-            raise BookCopyNotFoundException()
-        user = await self.user_service.get_by_id_or_raise(book_loan.user_id)
-        users_book_loans = await self.get_book_loans_by_user_id(user.id)
-        if len(users_book_loans) >= settings.BOOK_LIMIT_FOR_USER:
-            raise BookLimitExceededException()
-        book_loan = BookLoan(book_id=book.id, user_id=user.id)
-        created_book_loan = await self.book_repo.create_book_loan(book_loan)
-        book.available_copies -= 1
-        await self.book_repo.update(book)
+        created_book_loan = await self.book_repo.lend(
+            book_id=book_loan.book_id,
+            user_id=book_loan.user_id,
+            loan_limit=settings.BOOK_LIMIT_FOR_USER,
+        )
+        await cache_tags.invalidate(CacheTag.LOANS)
         return BookLoanResponse.model_validate(created_book_loan)
 
+    async def lend_many(
+        self, batch: BookLoanBatchCreate
+    ) -> list[BookLendResult]:
+        outcomes = await self.book_repo.lend_many(
+            book_ids=batch.book_ids,
+            user_id=batch.user_id,
+            loan_limit=settings.BOOK_LIMIT_FOR_USER,
+        )
+        if any(isinstance(outcome, BookLoan) for outcome in outcomes.values()):
+            await cache_tags.invalidate(CacheTag.LOANS)
+        return [
+            (
+                BookLendResult(
+                    book_id=book_id,
+                    loan=BookLoanResponse.model_validate(outcome),
+                )
+                if isinstance(outcome, BookLoan)
+                else BookLendResult(book_id=book_id, error=outcome.value)
+            )
+            for book_id, outcome in outcomes.items()
+        ]
+
+    async def return_many(
+        self, batch: BookLoanBatchReturn, user_id: uuid.UUID
+    ) -> list[BookReturnResult]:
+        outcomes = await self.book_repo.return_many(batch.loan_ids, user_id)
+        if any(outcomes.values()):
+            await cache_tags.invalidate(CacheTag.LOANS)
+        return [
+            (
+                BookReturnResult(
+                    loan_id=loan_id,
+                    loan=BookLoanResponse.model_validate(book_loan),
+                )
+                if book_loan is not None
+                else BookReturnResult(
+                    loan_id=loan_id,
+                    error=ErrorMessage.BOOK_LOAN_NOT_FOUND.value,
+                )
+            )
+            for loan_id, book_loan in outcomes.items()
+        ]
+
     async def return_book(
         self, loan_id: int, user_id: uuid.UUID
     ) -> BookLoanResponse:
-        book_loan = await self.get_book_loan_by_id_or_raise(loan_id)
-        if user_id != book_loan.user_id or book_loan.returned:
+        book_loan = await self.book_repo.return_book(loan_id, user_id)
+        if book_loan is None:
             raise BookLoanNotFoundException()
-        book_loan_new_data = BookLoanUpdate(
-            returned=True,
-            return_date=datetime.now(UTC).replace(tzinfo=None),
-        )
-        updated_book_loan = await self.update_book_loan(
-            loan_id, book_loan_new_data
-        )
-        book = book_loan.book
-        book_new_data = BookUpdate(available_copies=book.available_copies + 1)
-        await self.update(book.id, book_new_data)
-        return BookLoanResponse.model_validate(updated_book_loan)
+        await cache_tags.invalidate(CacheTag.LOANS)
+        return BookLoanResponse.model_validate(book_loan)
@@ -0,0 +1,83 @@
+import csv
+import io
+import json
+from typing import AsyncIterator, Callable, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config import settings
+from src.db.models.books import Book
+from src.db.repositories.book import BookRepository
+from src.schemas.book import BookFileFormat
+
+# Same columns the importer reads, so an export can be imported back.
+EXPORT_COLUMNS = (
+    "id",
+    "title",
+    "description",
+    "published_at",
+    "available_copies",
+    "authors",
+    "genres",
+)
+
+MEDIA_TYPES = {
+    BookFileFormat.CSV: "text/csv; charset=utf-8",
+    BookFileFormat.NDJSON: "application/x-ndjson",
+}
+
+
+def book_record(book: Book) -> dict:
+    return {
+        "id": book.id,
+        "title": book.title,
+        "description": book.description,
+        "published_at": book.published_at.isoformat(),
+        "available_copies": book.available_copies,
+        "authors": [author.name for author in book.authors],
+        "genres": [genre.name for genre in book.genres],
+    }
+
+
+def encode_ndjson(books: Sequence[Book]) -> bytes:
+    return "".join(
+        json.dumps(book_record(book), ensure_ascii=False) + "\n"
+        for book in books
+    ).encode()
+
+
+def encode_csv(books: Sequence[Book]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for book in books:
+        record = book_record(book)
+        record["authors"] = ";".join(record["authors"])
+        record["genres"] = ";".join(record["genres"])
+        writer.writerow(record.values())
+    return buffer.getvalue().encode()
+
+
+ENCODERS: dict[BookFileFormat, Callable[[Sequence[Book]], bytes]] = {
+    BookFileFormat.CSV: encode_csv,
+    BookFileFormat.NDJSON: encode_ndjson,
+}
+
+
+class BookExportService:
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        # The export outlives the request-scoped session, which is closed
+        # before a streaming body is sent, so it opens its own.
+        self.session_factory = session_factory
+
+    async def export(
+        self,
+        export_format: BookFileFormat,
+        batch_size: int = settings.BOOK_EXPORT_BATCH_SIZE,
+    ) -> AsyncIterator[bytes]:
+        encode = ENCODERS[export_format]
+        if export_format is BookFileFormat.CSV:
+            yield (",".join(EXPORT_COLUMNS) + "\n").encode()
+        async with self.session_factory() as session:
+            books = await BookRepository(session).stream_all(batch_size)
+            async for batch in books.partitions():
+                yield encode(batch)
@@ -0,0 +1,154 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterable, AsyncIterator
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import CacheTag, cache_tags
+from src.core.config import settings
+from src.db.repositories.book_import import BookImportRepository, StagedBook
+from src.schemas.book import (
+    BookFileFormat,
+    BookImportError,
+    BookImportReport,
+    BookImportRow,
+)
+
+ParsedRecord = tuple[int, dict | str]
+
+
+async def iter_lines(
+    chunks: AsyncIterable[bytes],
+) -> AsyncIterator[tuple[int, str]]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    line_number = 0
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            line_number += 1
+            yield line_number, line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield line_number + 1, buffer.rstrip("\r")
+
+
+async def parse_ndjson(
+    lines: AsyncIterable[tuple[int, str]],
+) -> AsyncIterator[ParsedRecord]:
+    async for line_number, line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, f"Invalid JSON: {e.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, "Invalid JSON: expected an object"
+            continue
+        yield line_number, record
+
+
+async def parse_csv(
+    lines: AsyncIterable[tuple[int, str]],
+) -> AsyncIterator[ParsedRecord]:
+    header = None
+    pending, start = [], 0
+    async for line_number, line in lines:
+        if not pending:
+            start = line_number
+        pending.append(line)
+        text = "\n".join(pending)
+        # A quoted field may span lines; wait for its closing quote.
+        if text.count('"') % 2:
+            continue
+        pending = []
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield start, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        yield start, dict(zip(header, values))
+    if pending:
+        yield start, "Unterminated quoted field"
+
+
+PARSERS = {
+    BookFileFormat.CSV: parse_csv,
+    BookFileFormat.NDJSON: parse_ndjson,
+}
+
+
+class BookImportService:
+    def __init__(self, db: AsyncSession):
+        self.import_repo = BookImportRepository(db)
+
+    async def import_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        import_format: BookFileFormat,
+        batch_size: int = settings.BOOK_IMPORT_BATCH_SIZE,
+    ) -> BookImportReport:
+        report = BookImportReport()
+        batch: list[StagedBook] = []
+        parser = PARSERS[import_format]
+        async for line_number, record in parser(iter_lines(chunks)):
+            report.total += 1
+            if isinstance(record, str):
+                report.errors.append(
+                    BookImportError(line=line_number, detail=record)
+                )
+                continue
+            try:
+                row = BookImportRow.model_validate(record)
+            except ValidationError as e:
+                error = e.errors()[0]
+                field = ".".join(str(part) for part in error["loc"])
+                report.errors.append(
+                    BookImportError(
+                        line=line_number, detail=f"{field}: {error['msg']}"
+                    )
+                )
+                continue
+            batch.append(
+                (
+                    line_number,
+                    row.title,
+                    row.description,
+                    row.published_at,
+                    row.available_copies,
+                    row.authors,
+                    row.genres,
+                )
+            )
+            if len(batch) >= batch_size:
+                await self._flush(batch, report)
+                batch = []
+        if batch:
+            await self._flush(batch, report)
+        report.errors.sort(key=lambda error: error.line)
+        report.failed = len(report.errors)
+        return report
+
+    async def _flush(
+        self, batch: list[StagedBook], report: BookImportReport
+    ) -> None:
+        created, updated, errors = await self.import_repo.import_batch(batch)
+        # Each batch commits on its own, so a later failure must not keep
+        # the earlier ones out of the cached lists.
+        if created or updated:
+            await cache_tags.invalidate(CacheTag.BOOKS)
+        report.created += created
+        report.updated += updated
+        report.errors.extend(
+            BookImportError(line=line, detail=detail)
+            for line, detail in errors
+        )
@@ -1,9 +1,17 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import CacheTag, cache_tags
 from src.core.exceptions import GenreNotFoundException
+from src.core.pagination import decode_cursor, split_page
+from src.core.serialization import validate_list
 from src.db.models.books import Genre
 from src.db.repositories.genre import GenreRepository
-from src.schemas.genre import GenreCreate, GenreResponse
+from src.schemas.common import CursorPage, CursorPaginationParams
+from src.schemas.genre import (
+    GenreBatchCreateResponse,
+    GenreCreate,
+    GenreResponse,
+)
 
 
 class GenreService:
@@ -15,8 +23,26 @@ class GenreService:
             name=genre_data.name,
         )
         created_genre = await self.genre_repo.create(genre)
+        await cache_tags.invalidate(CacheTag.GENRES)
         return GenreResponse.model_validate(created_genre)
 
+    async def create_many(
+        self, genres_data: list[GenreCreate]
+    ) -> GenreBatchCreateResponse:
+        # A name repeated within the batch is created once, from its first
+        # occurrence.
+        rows = {}
+        for genre_data in genres_data:
+            rows.setdefault(genre_data.name, genre_data.model_dump())
+        created = await self.genre_repo.create_many(list(rows.values()))
+        if created:
+            await cache_tags.invalidate(CacheTag.GENRES)
+        created_names = {genre.name for genre in created}
+        return GenreBatchCreateResponse(
+            created=[GenreResponse.model_validate(genre) for genre in created],
+            existing=[name for name in rows if name not in created_names],
+        )
+
     async def get_by_ids_or_raise(self, genre_ids: list[int]) -> list[Genre]:
         genres = await self.genre_repo.get_by_ids_or_none(genre_ids)
         if genres is None:
@@ -35,8 +61,24 @@ class GenreService:
         genres = await self.genre_repo.get_all_with_pagination(
             limit=limit, offset=offset
         )
-        return [GenreResponse.model_validate(genre) for genre in genres]
+        return validate_list(GenreResponse, genres)
+
+    async def get_all_with_cursor(
+        self, params: CursorPaginationParams
+    ) -> CursorPage[GenreResponse]:
+        after_id = None
+        if params.cursor:
+            (after_id,) = decode_cursor(params.cursor, id=int)
+        genres = await self.genre_repo.get_all_after_cursor(
+            limit=params.limit + 1, after_id=after_id
+        )
+        genres, next_cursor = split_page(genres, params.limit, "id")
+        return CursorPage[GenreResponse](
+            items=validate_list(GenreResponse, genres),
+            next_cursor=next_cursor,
+        )
 
     async def delete(self, genre_id: int) -> None:
         genre = await self.get_by_id_or_raise(genre_id)
         await self.genre_repo.delete(genre)
+        await cache_tags.invalidate(CacheTag.GENRES)
@@ -1,11 +1,24 @@
 import uuid
 
+from redis import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.exceptions import UserNotFoundException
-from src.core.security import hash_password
+from src.core.cache import (
+    CacheTag,
+    cache_tags,
+    token_versions,
+    user_cache,
+)
+from src.core.exceptions import (
+    TokenRevocationUnavailableException,
+    UserNotFoundException,
+)
+from src.core.pagination import decode_cursor, split_page
+from src.core.security import hash_password_async
+from src.core.serialization import validate_list
 from src.db.models.users import Role, User
 from src.db.repositories.user import UserRepository
+from src.schemas.common import CursorPage, CursorPaginationParams
 from src.schemas.users import (
     UserCreate,
     UserResponse,
@@ -21,7 +34,7 @@ class UserService:
     async def create(
         self, user_data: UserCreate, role: Role = "READER"
     ) -> UserResponse:
-        hashed_password = hash_password(user_data.password)
+        hashed_password = await hash_password_async(user_data.password)
         user = User(
             email=user_data.email,
             first_name=user_data.first_name,
@@ -30,6 +43,7 @@ class UserService:
             role=role,
         )
         created_user = await self.user_repo.create(user)
+        await cache_tags.invalidate(CacheTag.USERS)
         return UserResponse.model_validate(created_user)
 
     async def get_by_id_or_raise(self, user_id: uuid.UUID) -> User:
@@ -44,7 +58,22 @@ class UserService:
         users = await self.user_repo.get_all_with_pagination(
             limit=limit, offset=offset
         )
-        return [UserResponse.model_validate(user) for user in users]
+        return validate_list(UserResponse, users)
+
+    async def get_all_with_cursor(
+        self, params: CursorPaginationParams
+    ) -> CursorPage[UserResponse]:
+        after = None
+        if params.cursor:
+            after = decode_cursor(params.cursor, email=str, id=uuid.UUID)
+        users = await self.user_repo.get_all_after_cursor(
+            limit=params.limit + 1, after=after
+        )
+        users, next_cursor = split_page(users, params.limit, "email", "id")
+        return CursorPage[UserResponse](
+            items=validate_list(UserResponse, users),
+            next_cursor=next_cursor,
+        )
 
     async def get_most_active_users(
         self, limit: int, offset: int
@@ -52,20 +81,38 @@ class UserService:
         users = await self.user_repo.get_most_active_users(
             limit=limit, offset=offset
         )
-        users_with_stats = []
-        for user, loan_count in users:
-            user.loan_count = loan_count
-            users_with_stats.append(UserResponseWithStats.model_validate(user))
-        return users_with_stats
+        return validate_list(UserResponseWithStats, users)
 
     async def change_role(
         self, user_id: uuid.UUID, new_role: Role
     ) -> UserResponse:
         user = await self.get_by_id_or_raise(user_id)
+        # Revocation fails closed: the role is only changed once the old
+        # version is out of Redis, where token checks would trust it.
+        try:
+            await token_versions.revoke(user.id)
+        except RedisError:
+            raise TokenRevocationUnavailableException()
         user.role = new_role
+        user.token_version += 1
         await self.user_repo.update(user)
+        await user_cache.invalidate(user.id)
+        await cache_tags.invalidate(CacheTag.USERS)
+        await self._store_token_version(user)
         return UserResponse.model_validate(user)
 
+    @staticmethod
+    async def _store_token_version(user: User) -> None:
+        # A check that read the database before the commit may have cached
+        # the old version again. Overwrite it, or at least delete it.
+        for version in (user.token_version, None):
+            try:
+                await token_versions.revoke(user.id, version)
+                return
+            except RedisError:
+                continue
+        raise TokenRevocationUnavailableException()
+
     async def update_data(
         self, user_id: uuid.UUID, new_data: UserUpdate
     ) -> UserResponse:
@@ -75,6 +122,8 @@ class UserService:
         ).items():
             setattr(user, key, value)
         await self.user_repo.update(user)
+        await user_cache.invalidate(user.id)
+        await cache_tags.invalidate(CacheTag.USERS)
         return UserResponse.model_validate(user)
 
     @staticmethod
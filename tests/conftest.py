@@ -7,14 +7,22 @@ from fastapi_cache import FastAPICache
 from fastapi_cache.backends.redis import RedisBackend
 from httpx import ASGITransport, AsyncClient
 from redis import asyncio as aioredis
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
 
+from src.core.cache import (
+    ResponseBytesCoder,
+    TieredBackend,
+    cache_tags,
+    request_key_builder,
+)
 from src.core.config import test_settings
+from src.core.redis import set_redis
 from src.db.base import Base
-from src.db.database import get_db
+from src.db.database import get_db, get_read_db, get_read_session_factory
 from src.db.models.books import Author, Genre
 from src.db.models.users import Role
 from src.main import app
@@ -45,11 +53,16 @@ async def override_get_db():
 
 
 app.dependency_overrides[get_db] = override_get_db  # type: ignore
+app.dependency_overrides[get_read_db] = override_get_db  # type: ignore
+app.dependency_overrides[get_read_session_factory] = (  # type: ignore
+    lambda: async_session_test
+)
 
 
 @pytest.fixture(scope="function", autouse=True)
 async def setup_test_db() -> AsyncGenerator[None, None]:
     async with engine_test.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
     try:
         yield
@@ -65,8 +78,30 @@ async def initialize_cache() -> AsyncGenerator[None, None]:
         test_settings.REDIS_URL, encoding="utf8", decode_responses=True
     )
     await redis.ping()
-    FastAPICache.init(RedisBackend(redis), prefix="fastapi-cache")
+    for pattern in ("login-rate:*", "cache-tag:*"):
+        async for key in redis.scan_iter(pattern):
+            await redis.delete(key)
+    cache_redis = aioredis.from_url(test_settings.REDIS_URL)
+    async for key in cache_redis.scan_iter("fastapi-cache:*"):
+        await cache_redis.delete(key)
+    cache_tags.local.clear()
+    FastAPICache.init(
+        TieredBackend(
+            RedisBackend(cache_redis),
+            maxsize=test_settings.RESPONSE_CACHE_LOCAL_MAXSIZE,
+            local_ttl=test_settings.RESPONSE_CACHE_LOCAL_TTL_SECONDS,
+        ),
+        prefix="fastapi-cache",
+        coder=ResponseBytesCoder,
+        key_builder=request_key_builder,
+    )
+    set_redis(redis)
     yield
+    set_redis(None)
+    # ``init`` is a no-op once initialized, which would keep this test's
+    # closed client for the next one.
+    FastAPICache.reset()
+    await cache_redis.aclose()
     await redis.aclose()
 
 
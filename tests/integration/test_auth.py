@@ -1,6 +1,18 @@
+import asyncio
+import threading
+import time
+
+import pytest
 from httpx import AsyncClient
+from starlette.requests import Request
 
+from src.core.cache import token_payload_cache
+from src.core.config import settings
+from src.core.rate_limit import client_ip, login_rate_limiter
+from src.core.security import PasswordHasher, get_hash_rounds, hash_password
+from src.db.models import User
 from src.schemas.users import UserCreateResponseTest
+from tests.conftest import async_session_test
 
 
 async def test_login(
@@ -125,3 +137,177 @@ async def test_refresh_jwt_not_auth(async_client: AsyncClient):
     assert (
         response_json["detail"] == "Not authenticated"
     ), f"Unexpected detail message: {response_json['detail']}"
+
+
+async def test_verified_token_payload_is_memoized(
+    async_client: AsyncClient, create_reader: UserCreateResponseTest
+):
+    headers = {"Authorization": f"Bearer {create_reader.access_token}"}
+    await async_client.get("/api/v1/users/me", headers=headers)
+    hits = token_payload_cache.stats()["hits"]
+    response = await async_client.get("/api/v1/users/me", headers=headers)
+
+    assert (
+        response.status_code == 200
+    ), f"Unexpected status code: {response.status_code}, Response JSON: {response.json()}"
+    assert (
+        token_payload_cache.stats()["hits"] == hits + 1
+    ), "Token payload was verified again instead of being served from cache"
+
+
+async def test_login_throttled_after_too_many_attempts(
+    async_client: AsyncClient, create_reader: UserCreateResponseTest
+):
+    credentials = {"email": create_reader.email, "password": "wrong"}
+    for _ in range(settings.LOGIN_RATE_LIMIT_PER_EMAIL):
+        response = await async_client.post("/api/v1/auth", json=credentials)
+        assert response.status_code == 401
+
+    response = await async_client.post("/api/v1/auth", json=credentials)
+    response_json = response.json()
+
+    assert (
+        response.status_code == 429
+    ), f"Unexpected status code: {response.status_code}, Response JSON: {response_json}"
+    assert (
+        response_json["detail"] == "Too many login attempts, try again later"
+    ), f"Unexpected detail message: {response_json['detail']}"
+    assert int(response.headers["Retry-After"]) > 0
+
+
+async def test_successful_logins_are_not_throttled(
+    async_client: AsyncClient, create_reader: UserCreateResponseTest
+):
+    credentials = {
+        "email": create_reader.email,
+        "password": create_reader.password,
+    }
+    for _ in range(settings.LOGIN_RATE_LIMIT_PER_EMAIL + 1):
+        response = await async_client.post("/api/v1/auth", json=credentials)
+        assert (
+            response.status_code == 200
+        ), f"Unexpected status code: {response.status_code}, Response JSON: {response.json()}"
+
+
+async def test_failed_logins_only_throttle_their_client_ip():
+    email = "victim@example.com"
+    for _ in range(settings.LOGIN_RATE_LIMIT_PER_EMAIL):
+        assert await login_rate_limiter.hit(email, "10.0.0.1") is None
+        await login_rate_limiter.fail(email, "10.0.0.1")
+
+    assert await login_rate_limiter.hit(email, "10.0.0.1") is not None
+    assert (
+        await login_rate_limiter.hit(email, "10.0.0.2") is None
+    ), "Failures from another IP must not lock the email out"
+
+
+async def test_failed_logins_across_ips_throttle_the_email(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(login_rate_limiter, "email_global_limit", 3)
+    email = "victim@example.com"
+    for i in range(3):
+        assert await login_rate_limiter.hit(email, f"10.0.1.{i}") is None
+        await login_rate_limiter.fail(email, f"10.0.1.{i}")
+
+    assert (
+        await login_rate_limiter.hit(email, "10.0.2.1") is not None
+    ), "Failures spread over many IPs must still throttle the email"
+
+
+@pytest.mark.parametrize(
+    "peer, forwarded, expected",
+    [
+        ("203.0.113.7", "", "203.0.113.7"),
+        ("203.0.113.7", "198.51.100.1", "203.0.113.7"),
+        ("10.0.0.2", "198.51.100.1", "198.51.100.1"),
+        ("10.0.0.2", "198.51.100.1, 10.0.0.3", "198.51.100.1"),
+        ("10.0.0.2", "spoofed, 198.51.100.1", "198.51.100.1"),
+    ],
+)
+def test_client_ip_trusts_only_configured_proxies(
+    monkeypatch: pytest.MonkeyPatch, peer: str, forwarded: str, expected: str
+):
+    monkeypatch.setattr(settings, "TRUSTED_PROXIES", ["10.0.0.0/8"])
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    request = Request(
+        {"type": "http", "client": (peer, 1234), "headers": headers}
+    )
+    assert client_ip(request) == expected
+
+
+async def test_login_rehashes_password_with_configured_cost(
+    async_client: AsyncClient,
+):
+    password = "Rehashed0!"
+    async with async_session_test() as session:
+        user = User(
+            email="rehash@example.com",
+            first_name="some",
+            last_name="user",
+            hashed_password=hash_password(password, rounds=4),
+        )
+        session.add(user)
+        await session.commit()
+
+    response = await async_client.post(
+        "/api/v1/auth",
+        json={"email": "rehash@example.com", "password": password},
+    )
+    assert (
+        response.status_code == 200
+    ), f"Unexpected status code: {response.status_code}, Response JSON: {response.json()}"
+
+    async with async_session_test() as session:
+        db_user = await session.get(User, user.id)
+    assert (
+        get_hash_rounds(db_user.hashed_password) == settings.BCRYPT_ROUNDS
+    ), "Password hash was not upgraded to the configured cost"
+
+
+async def test_password_hasher_bounds_concurrency():
+    hasher = PasswordHasher("thread", max_workers=4, concurrency=2)
+    lock = threading.Lock()
+    running = peak = 0
+
+    def job() -> None:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    try:
+        await asyncio.gather(*(hasher._run(job) for _ in range(6)))
+    finally:
+        hasher.shutdown()
+
+    assert peak == 2, "More jobs ran at once than the configured concurrency"
+    stats = hasher.stats()
+    assert stats["peak_queue_depth"] == 4
+    assert stats["completed"] == 6
+    assert stats["in_flight"] == 0
+    assert stats["queue_depth"] == 0
+
+
+async def test_password_hasher_counts_failed_jobs_and_restarts():
+    hasher = PasswordHasher("thread", max_workers=1, concurrency=1)
+    try:
+        hashed = await hasher.hash("Secret0!")
+        with pytest.raises(ValueError):
+            await hasher.verify("Secret0!", b"not a hash")
+        assert hasher.stats()["completed"] == 2
+        assert hasher.stats()["in_flight"] == 0
+
+        hasher.shutdown()
+        assert await hasher.verify("Secret0!", hashed)
+    finally:
+        hasher.shutdown()
+    assert hasher.stats()["completed"] == 3
+
+
+def test_password_hasher_rejects_unknown_executor():
+    with pytest.raises(ValueError):
+        PasswordHasher("fiber", max_workers=1, concurrency=1)
@@ -3,7 +3,12 @@ from datetime import date, datetime
 import pytest
 from httpx import AsyncClient
 from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from starlette.requests import Request
 
+from src.core.pagination import encode_cursor
+from src.db import database
+from src.db.database import RECENT_WRITE_COOKIE
 from src.schemas.author import AuthorResponse
 from src.schemas.users import UserCreateResponseTest
 
@@ -41,6 +46,81 @@ async def test_create_author(
     assert author_response.biography == author_data["biography"]
 
 
+async def test_create_author_pins_client_to_primary(
+    async_client: AsyncClient, create_admin: UserCreateResponseTest
+):
+    headers = {"Authorization": f"Bearer {create_admin.access_token}"}
+    response = await async_client.post(
+        "/api/v1/authors/create",
+        json={"name": "Leo Tolstoy", "birth_date": "1828-09-09"},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    assert (
+        RECENT_WRITE_COOKIE in response.cookies
+    ), "Write response does not mark the client as a recent writer"
+
+    response = await async_client.get("/api/v1/authors")
+    assert (
+        RECENT_WRITE_COOKIE not in response.cookies
+    ), "Read response must not extend the recent writer marker"
+
+
+@pytest.mark.parametrize("recent_writer", [False, True])
+def test_read_session_factory_routing(
+    monkeypatch: pytest.MonkeyPatch, recent_writer: bool
+):
+    replica = async_sessionmaker()
+    monkeypatch.setattr(database, "async_read_session", replica)
+    headers = (
+        [(b"cookie", f"{RECENT_WRITE_COOKIE}=1".encode())]
+        if recent_writer
+        else []
+    )
+    request = Request({"type": "http", "headers": headers})
+
+    expected = database.async_session if recent_writer else replica
+    assert database.get_read_session_factory(request) is expected
+    assert database.reads_from_replica(request) is not recent_writer
+
+
+async def test_create_authors_batch(
+    async_client: AsyncClient,
+    create_admin: UserCreateResponseTest,
+    create_author: AuthorResponse,
+):
+    authors_data = [
+        {"name": "Anton Chekhov", "birth_date": "1860-01-29"},
+        {"name": create_author.name, "birth_date": "1900-01-01"},
+        {"name": "Ivan Bunin", "birth_date": "1870-10-22"},
+        {"name": "Anton Chekhov", "birth_date": "1999-01-01"},
+    ]
+    headers = {"Authorization": f"Bearer {create_admin.access_token}"}
+    response = await async_client.post(
+        "/api/v1/authors/batch",
+        json=authors_data,
+        headers=headers,
+    )
+    response_json = response.json()
+    assert (
+        response.status_code == 201
+    ), f"Unexpected status code: {response.status_code}, Response JSON: {response_json}"
+    created = [AuthorResponse(**author) for author in response_json["created"]]
+    assert [author.name for author in created] == [
+        "Anton Chekhov",
+        "Ivan Bunin",
+    ]
+    assert created[0].birth_date == date(1860, 1, 29)
+    assert response_json["existing"] == [create_author.name]
+
+    response = await async_client.post(
+        "/api/v1/authors/batch",
+        json=authors_data[:1],
+        headers=headers,
+    )
+    assert response.json() == {"created": [], "existing": ["Anton Chekhov"]}
+
+
 async def test_get_authors(
     async_client: AsyncClient, create_three_authors: None
 ):
@@ -121,3 +201,51 @@ async def test_delete_author(
     assert (
         "Author deleted successfully" in response_json["message"]
     ), f"Expected 'Author deleted successfully'. but got {response_json["message"]}"
+
+
+async def test_get_authors_by_cursor(
+    async_client: AsyncClient, create_three_authors: None
+):
+    response = await async_client.get("/api/v1/authors/cursor?limit=2")
+    response_json = response.json()
+    assert (
+        response.status_code == 200
+    ), f"Unexpected status code: {response.status_code}, Response JSON: {response_json}"
+    first_page = [author["id"] for author in response_json["items"]]
+    assert len(first_page) == 2, f"Expected 2 authors, but got {first_page}"
+    assert response_json["next_cursor"], "Expected a cursor for the next page"
+
+    response = await async_client.get(
+        "/api/v1/authors/cursor",
+        params={"limit": 2, "cursor": response_json["next_cursor"]},
+    )
+    response_json = response.json()
+    assert response.status_code == 200
+    second_page = [author["id"] for author in response_json["items"]]
+    assert len(second_page) == 1, f"Expected 1 author, but got {second_page}"
+    assert response_json["next_cursor"] is None, "Expected the last page"
+    assert max(first_page) < min(second_page), "Pages overlap or are unordered"
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor",
+        encode_cursor({"id": "abc"}),
+        encode_cursor({"name": "abc"}),
+        encode_cursor([1]),
+    ],
+)
+async def test_get_authors_by_invalid_cursor(
+    async_client: AsyncClient, cursor: str
+):
+    response = await async_client.get(
+        "/api/v1/authors/cursor", params={"cursor": cursor}
+    )
+    response_json = response.json()
+    assert (
+        response.status_code == 400
+    ), f"Unexpected status code: {response.status_code}, Response JSON: {response_json}"
+    assert (
+        response_json["detail"] == "Invalid pagination cursor"
+    ), f"Unexpected detail message: {response_json['detail']}"
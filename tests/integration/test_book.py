@@ -1,14 +1,36 @@
+import asyncio
+import gzip
+import json
+import time
 from datetime import datetime
 
 import pytest
 from httpx import AsyncClient
 from pydantic import ValidationError
+from redis import asyncio as aioredis
+from sqlalchemy import update
+from sqlalchemy.exc import OperationalError
 
+from src.core.cache import (
+    CacheTag,
+    cache_tags,
+    invalidation_bus,
+    response_cache,
+)
+from src.core.config import settings, test_settings
 from src.core.exceptions.messages import ErrorMessage
+from src.core.redis import get_redis
+from src.db.models.books import Book
+from src.db.models.users import User
+from src.db.repositories.book import BookRepository
+from src.db.repositories.user import UserRepository
 from src.schemas.author import AuthorResponse
 from src.schemas.book import BookLoanResponse, BookResponse
 from src.schemas.genre import GenreResponse
 from src.schemas.users import UserCreateResponseTest
+from src.services.book import BookService
+from tests.conftest import async_session_test
+from tests.utils import subscribers
 
 
 async def test_create_book(
@@ -74,6 +96,358 @@ async def test_get_books(async_client: AsyncClient, create_three_books: None):
     ), f"Expected 3 books, but got {len(response_json)}"
     assert len(book_ids) == len(set(book_ids)), "Duplicate author IDs found"
 
+    assert response.headers["X-FastAPI-Cache"] == "MISS"
+    cached_response = await async_client.get("/api/v1/books")
+    assert cached_response.headers["X-FastAPI-Cache"] == "HIT"
+    assert cached_response.content == response.content
+
+
+async def test_cached_books_are_stored_compressed(
+    async_client: AsyncClient,
+    create_three_books: None,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_COMPRESS_MIN_BYTES", 1)
+    response = await async_client.get("/api/v1/books")
+    assert response.headers["X-FastAPI-Cache"] == "MISS"
+
+    redis = aioredis.from_url(test_settings.REDIS_URL)
+    try:
+        keys = [key async for key in redis.scan_iter("fastapi-cache:*")]
+        assert len(keys) == 1
+        stored = await redis.get(keys[0])
+    finally:
+        await redis.aclose()
+    stamp, _, body = stored.partition(b"\n")
+    assert (
+        stamp
+        == f"{cache_tags.epoch}:books=0,authors=0,genres=0,loans=0".encode()
+    )
+    assert gzip.decompress(body) == response.content
+
+    cached_response = await async_client.get("/api/v1/books")
+    assert cached_response.headers["X-FastAPI-Cache"] == "HIT"
+    assert cached_response.headers["content-type"] == "application/json"
+    assert cached_response.content == response.content
+
+
+async def test_writes_invalidate_cached_books(
+    async_client: AsyncClient,
+    create_admin: UserCreateResponseTest,
+    create_book: BookResponse,
+    create_reader: UserCreateResponseTest,
+):
+    response = await async_client.get("/api/v1/books")
+    assert response.headers["X-FastAPI-Cache"] == "MISS"
+    assert (
+        response.json()[0]["available_copies"] == create_book.available_copies
+    )
+
+    headers = {"Authorization": f"Bearer {create_admin.access_token}"}
+    response = await async_client.post(
+        "/api/v1/books/lend",
+        json={"book_id": create_book.id, "user_id": str(create_reader.id)},
+        headers=headers,
+    )
+    assert response.status_code == 201
+
+    response = await async_client.get("/api/v1/books")
+    assert response.headers["X-FastAPI-Cache"] == "MISS"
+    assert (
+        response.json()[0]["available_copies"]
+        == create_book.available_copies - 1
+    )
+
+    response = await async_client.patch(
+        f"/api/v1/books/update/{create_book.id}",
+        json={"title": "Renamed"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+
+    response = await async_client.get("/api/v1/books")
+    assert response.headers["X-FastAPI-Cache"] == "MISS"
+    assert response.json()[0]["title"] == "Renamed"
+    cached_response = await async_client.get("/api/v1/books")
+    assert cached_response.headers["X-FastAPI-Cache"] == "HIT"
+
+
+async def test_replica_reads_are_not_cached_right_after_writes(
+    async_client: AsyncClient,
+    create_admin: UserCreateResponseTest,
+    create_book: BookResponse,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        "src.core.cache.responses.reads_from_replica", lambda request: True
+    )
+    headers = {"Authorization": f"Bearer {create_admin.access_token}"}
+    response = await async_client.patch(
+        f"/api/v1/books/update/{create_book.id}",
+        json={"title": "Renamed"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+
+    for _ in range(2):
+        response = await async_client.get("/api/v1/books")
+        assert response.status_code == 200
+        assert response.headers["X-FastAPI-Cache"] == "MISS"
+        assert "ETag" not in response.headers
+        assert response.headers["Cache-Control"] == "no-cache"
+
+    monkeypatch.setattr(settings, "REPLICA_PIN_SECONDS", 0)
+    response = await async_client.get("/api/v1/books")
+    assert response.headers["X-FastAPI-Cache"] == "MISS"
+    assert "ETag" in response.headers
+    response = await async_client.get("/api/v1/books")
+    assert response.headers["X-FastAPI-Cache"] == "HIT"
+
+
+async def test_conditional_requests_for_books(
+    async_client: AsyncClient,
+    create_admin: UserCreateResponseTest,
+    create_book: BookResponse,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    # Last-Modified is the time of the last write, so make one first.
+    headers = {"Authorization": f"Bearer {create_admin.access_token}"}
+    response = await async_client.patch(
+        f"/api/v1/books/update/{create_book.id}",
+        json={"title": "Renamed"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    # Last-Modified is only sent once the second of the write has passed.
+    response = await async_client.get("/api/v1/books")
+    modified_at = cache_tags.local.get(CacheTag.BOOKS).modified_at
+    if time.time() < int(modified_at) + 1:
+        assert "Last-Modified" not in response.headers
+    await asyncio.sleep(int(modified_at) + 1 - time.time())
+
+    response = await async_client.get("/api/v1/books")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    last_modified = response.headers["Last-Modified"]
+    assert response.headers["Cache-Control"].startswith("public, max-age=")
+
+    async def unreachable(*args, **kwargs):
+        pytest.fail("A matching ETag must not reach the service")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(
+            BookService, "get_all_with_pagination_and_filtration", unreachable
+        )
+        response = await async_client.get(
+            "/api/v1/books", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        response = await async_client.get(
+            "/api/v1/books", headers={"If-Modified-Since": last_modified}
+        )
+        assert response.status_code == 304
+    assert response_cache.stats()["not_modified"] >= 2
+
+    # Redis loses the counters, the next write takes books back to 1.
+    redis = get_redis()
+    await redis.delete(*[key async for key in redis.scan_iter("cache-tag:*")])
+    cache_tags.local.clear()
+    response = await async_client.patch(
+        f"/api/v1/books/update/{create_book.id}",
+        json={"title": "Renamed again"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+
+    response = await async_client.get(
+        "/api/v1/books", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()[0]["title"] == "Renamed again"
+    assert response.headers["ETag"] != etag
+
+
+async def test_concurrent_misses_compute_once(
+    async_client: AsyncClient,
+    create_three_books: None,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    calls = 0
+    get_most_popular_books = BookService.get_most_popular_books
+
+    async def counting(self, *args, **kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        return await get_most_popular_books(self, *args, **kwargs)
+
+    monkeypatch.setattr(BookService, "get_most_popular_books", counting)
+    responses = await asyncio.gather(
+        *(
+            async_client.get("/api/v1/books/statistics/popular-books")
+            for _ in range(10)
+        )
+    )
+    assert [response.status_code for response in responses] == [200] * 10
+    assert len({response.content for response in responses}) == 1
+    assert calls == 1
+
+
+async def test_stale_books_are_served_while_refreshing(
+    async_client: AsyncClient,
+    create_book: BookResponse,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    # Every stored entry is immediately stale.
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_TTL_SECONDS", 0)
+    response = await async_client.get("/api/v1/books")
+    assert response.headers["X-FastAPI-Cache"] == "MISS"
+
+    async with async_session_test() as session:
+        await session.execute(update(Book).values(available_copies=42))
+        await session.commit()
+
+    get_books = BookService.get_all_with_pagination_and_filtration
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def slow(self, *args, **kwargs):
+        started.set()
+        await release.wait()
+        return await get_books(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        BookService, "get_all_with_pagination_and_filtration", slow
+    )
+    refreshing = asyncio.create_task(async_client.get("/api/v1/books"))
+    await started.wait()
+    stale_responses = await asyncio.gather(
+        *(async_client.get("/api/v1/books") for _ in range(4))
+    )
+    for stale_response in stale_responses:
+        assert stale_response.headers["X-FastAPI-Cache"] == "STALE"
+        assert stale_response.content == response.content
+    release.set()
+    refreshed = await refreshing
+    assert refreshed.headers["X-FastAPI-Cache"] == "MISS"
+    assert refreshed.json()[0]["available_copies"] == 42
+
+    async def unavailable(*args, **kwargs):
+        raise OperationalError("SELECT", None, ConnectionRefusedError())
+
+    monkeypatch.setattr(
+        BookService, "get_all_with_pagination_and_filtration", unavailable
+    )
+    await cache_tags.invalidate(CacheTag.BOOKS)
+    fallback_response = await async_client.get("/api/v1/books")
+    assert fallback_response.status_code == 200
+    assert fallback_response.headers["X-FastAPI-Cache"] == "STALE"
+    assert fallback_response.content == refreshed.content
+
+
+async def test_other_workers_invalidations_reach_local_tiers(
+    async_client: AsyncClient, create_three_books: None
+):
+    redis = get_redis()
+    invalidation_bus.start(redis)
+    try:
+        async with asyncio.timeout(1):
+            while not await subscribers(redis, invalidation_bus.channel):
+                await asyncio.sleep(0.01)
+
+        response = await async_client.get("/api/v1/books")
+        assert response.headers["X-FastAPI-Cache"] == "MISS"
+        response = await async_client.get("/api/v1/books")
+        assert response.headers["X-FastAPI-Cache"] == "HIT"
+        stats = response_cache.stats()
+        assert stats["local"]["hits"] == 1
+        assert stats["redis"]["misses"] == 1
+
+        # Malformed messages are skipped without stopping the listener.
+        await redis.publish(invalidation_bus.channel, "not json")
+        await redis.publish(
+            invalidation_bus.channel,
+            json.dumps(
+                {
+                    "origin": "another-worker",
+                    "kind": cache_tags.kind,
+                    "epoch": cache_tags.epoch,
+                    "tag": "nope",
+                }
+            ),
+        )
+
+        # A write on another worker bumps the tag in Redis and broadcasts.
+        version = await redis.incr("cache-tag:books")
+        await redis.publish(
+            invalidation_bus.channel,
+            json.dumps(
+                {
+                    "origin": "another-worker",
+                    "kind": cache_tags.kind,
+                    "epoch": cache_tags.epoch,
+                    "tag": "books",
+                    "version": version,
+                    "modified_at": time.time(),
+                }
+            ),
+        )
+        async with asyncio.timeout(1):
+            while cache_tags.local.get(CacheTag.BOOKS).version != version:
+                await asyncio.sleep(0.01)
+        response = await async_client.get("/api/v1/books")
+        assert response.headers["X-FastAPI-Cache"] == "MISS"
+    finally:
+        await invalidation_bus.stop()
+
+
+async def test_search_books(
+    async_client: AsyncClient,
+    create_admin: UserCreateResponseTest,
+    create_author: AuthorResponse,
+    create_genre: GenreResponse,
+):
+    headers = {"Authorization": f"Bearer {create_admin.access_token}"}
+    books = [
+        ("War and Peace", "A novel about the French invasion of Russia"),
+        ("Anna Karenina", "A story of love and society"),
+        ("Resurrection", "A nobleman seeks redemption"),
+    ]
+    for title, description in books:
+        response = await async_client.post(
+            "/api/v1/books/create",
+            json={
+                "title": title,
+                "description": description,
+                "published_at": "1870-01-01",
+                "author_ids": create_author.id,
+                "genre_ids": create_genre.id,
+            },
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+    response = await async_client.get(
+        "/api/v1/books", params={"search": "invasion"}
+    )
+    response_json = response.json()
+    assert (
+        response.status_code == 200
+    ), f"Unexpected status code: {response.status_code}, Response JSON: {response_json}"
+    assert [book["title"] for book in response_json] == [
+        "War and Peace"
+    ], "Expected a match on the description"
+
+    response = await async_client.get(
+        "/api/v1/books", params={"search": "Ana Karenina"}
+    )
+    response_json = response.json()
+    assert response.status_code == 200
+    assert (
+        response_json and response_json[0]["title"] == "Anna Karenina"
+    ), f"Expected a typo tolerant match, but got {response_json}"
+
 
 async def test_update_book(
     async_client: AsyncClient,
@@ -135,6 +509,119 @@ async def test_delete_book(
     ), f"Expected 'Book deleted successfully'. but got {response_json["message"]}"
 
 
+async def test_import_books_csv(
+    async_client: AsyncClient,
+    create_admin: UserCreateResponseTest,
+    create_book: BookResponse,
+):
+    body = (
+        "title,description,published_at,available_copies,authors,genres\n"
+        'Imported,"A book, with commas",1999-01-01,4,SomeAuthor,SomeGenre\n'
+        "Orphan,,1999-01-01,1,Nobody,SomeGenre\n"
+        "Imported,,1999-01-01,2,SomeAuthor,SomeGenre\n"
+        "Broken,,not-a-date,1,SomeAuthor,SomeGenre\n"
+    )
+    headers = {"Authorization": f"Bearer {create_admin.access_token}"}
+    response = await async_client.post(
+        "/api/v1/books/import",
+        params={"format": "csv"},
+        content=body.encode(),
+        headers=headers,
+    )
+    response_json = response.json()
+    assert (
+        response.status_code == 200
+    ), f"Unexpected status code: {response.status_code}, Response JSON: {response_json}"
+    assert response_json["total"] == 4
+    assert response_json["created"] == 1
+    assert response_json["updated"] == 0
+    assert response_json["failed"] == 3
+    errors = {
+        error["line"]: error["detail"] for error in response_json["errors"]
+    }
+    assert errors[3] == "Unknown author: Nobody"
+    assert errors[4] == "Duplicate title, first seen on line 2"
+    assert errors[5].startswith("published_at")
+
+    response = await async_client.get(
+        "/api/v1/books", params={"title": "Imported"}
+    )
+    [book] = response.json()
+    assert book["description"] == "A book, with commas"
+    assert book["available_copies"] == 4
+    assert [author["name"] for author in book["authors"]] == ["SomeAuthor"]
+    assert [genre["name"] for genre in book["genres"]] == ["SomeGenre"]
+
+
+async def test_import_books_ndjson_updates_existing(
+    async_client: AsyncClient,
+    create_admin: UserCreateResponseTest,
+    create_book: BookResponse,
+):
+    body = (
+        '{"title": "SomeGenre", "published_at": "2001-01-01", '
+        '"available_copies": 7, "authors": ["SomeAuthor"], '
+        '"genres": ["SomeGenre"]}\n'
+        "not json\n"
+        '{"title": "Authorless", "published_at": "2001-01-01", '
+        '"authors": [], "genres": ["SomeGenre"]}\n'
+    )
+    headers = {"Authorization": f"Bearer {create_admin.access_token}"}
+    response = await async_client.post(
+        "/api/v1/books/import",
+        params={"format": "ndjson"},
+        content=body.encode(),
+        headers=headers,
+    )
+    response_json = response.json()
+    assert response.status_code == 200, response_json
+    assert response_json["created"] == 0
+    assert response_json["updated"] == 1
+    errors = {
+        error["line"]: error["detail"] for error in response_json["errors"]
+    }
+    assert list(errors) == [2, 3]
+    assert errors[3].startswith("authors")
+
+    async with async_session_test() as session:
+        book = await BookRepository(session).get_by_id_or_none(create_book.id)
+    # Copies are only counted by lending and returns once a book exists.
+    assert book.available_copies == create_book.available_copies
+    assert book.published_at.year == 2001
+    assert [author.name for author in book.authors] == ["SomeAuthor"]
+    assert [genre.name for genre in book.genres] == ["SomeGenre"]
+
+
+async def test_export_books(
+    async_client: AsyncClient,
+    create_admin: UserCreateResponseTest,
+    create_three_books: None,
+):
+    headers = {"Authorization": f"Bearer {create_admin.access_token}"}
+    response = await async_client.get(
+        "/api/v1/books/export", params={"format": "ndjson"}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/x-ndjson"
+    books = [json.loads(line) for line in response.text.splitlines()]
+    assert [book["title"] for book in books] == [
+        f"book{i}@example.com" for i in range(1, 4)
+    ]
+    assert books[0]["authors"] == ["SomeAuthor"]
+    assert books[0]["genres"] == ["SomeGenre"]
+
+    response = await async_client.get(
+        "/api/v1/books/export", params={"format": "csv"}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+    header, *rows = response.text.splitlines()
+    assert header == (
+        "id,title,description,published_at,available_copies,authors,genres"
+    )
+    assert len(rows) == 3
+    assert rows[0].endswith(",SomeAuthor,SomeGenre")
+
+
 async def test_lend_book(
     async_client: AsyncClient,
     create_admin: UserCreateResponseTest,
@@ -166,6 +653,57 @@ async def test_lend_book(
     assert book_loan_response.returned is False
 
 
+async def test_concurrent_lends_do_not_oversell(
+    async_client: AsyncClient,
+    create_admin: UserCreateResponseTest,
+    create_author: AuthorResponse,
+    create_genre: GenreResponse,
+):
+    headers = {"Authorization": f"Bearer {create_admin.access_token}"}
+    response = await async_client.post(
+        "/api/v1/books/create",
+        json={
+            "title": "Dead Souls",
+            "published_at": "1842-05-21",
+            "available_copies": 3,
+            "author_ids": create_author.id,
+            "genre_ids": create_genre.id,
+        },
+        headers=headers,
+    )
+    book_id = response.json()["id"]
+    async with async_session_test() as session:
+        readers = [
+            User(
+                email=f"borrower{i}@example.com",
+                first_name="Borrower",
+                last_name="Reader",
+                hashed_password=b"unused",
+            )
+            for i in range(10)
+        ]
+        session.add_all(readers)
+        await session.commit()
+
+    responses = await asyncio.gather(
+        *(
+            async_client.post(
+                "/api/v1/books/lend",
+                json={"book_id": book_id, "user_id": str(reader.id)},
+                headers=headers,
+            )
+            for reader in readers
+        )
+    )
+    status_codes = sorted(response.status_code for response in responses)
+    assert status_codes == [201] * 3 + [404] * 7, status_codes
+
+    async with async_session_test() as session:
+        book = await session.get(Book, book_id)
+        assert book.available_copies == 0, "Inventory was oversold"
+        assert book.loan_count == 3
+
+
 async def test_return_book(
     async_client: AsyncClient,
     create_admin: UserCreateResponseTest,
@@ -194,6 +732,129 @@ async def test_return_book(
         "Book returned successfully" in response_return_json["message"]
     ), f"Expected 'Book returned successfully'. but got {response_return_json["message"]}"
 
+    async with async_session_test() as session:
+        book = await session.get(Book, create_book.id)
+        assert (
+            book.available_copies == create_book.available_copies
+        ), "Returned copy was not put back on the shelf"
+
+
+async def test_active_loan_quota(
+    async_client: AsyncClient,
+    create_admin: UserCreateResponseTest,
+    create_book: BookResponse,
+    create_reader: UserCreateResponseTest,
+):
+    headers_admin = {"Authorization": f"Bearer {create_admin.access_token}"}
+    loan = {"book_id": create_book.id, "user_id": str(create_reader.id)}
+    async with async_session_test() as session:
+        await session.execute(
+            update(User)
+            .where(User.id == create_reader.id)
+            .values(active_loans=settings.BOOK_LIMIT_FOR_USER)
+        )
+        await session.commit()
+
+    response = await async_client.post(
+        "/api/v1/books/lend", json=loan, headers=headers_admin
+    )
+    response_json = response.json()
+    assert (
+        response.status_code == 403
+    ), f"Unexpected status code: {response.status_code}, Response JSON: {response_json}"
+    assert response_json["detail"] == ErrorMessage.BOOK_LIMIT_EXCEEDED
+
+    # A missing book is reported before the reader's quota.
+    response = await async_client.post(
+        "/api/v1/books/lend",
+        json={"book_id": 999, "user_id": str(create_reader.id)},
+        headers=headers_admin,
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == ErrorMessage.BOOK_NOT_FOUND
+
+    async with async_session_test() as session:
+        await session.execute(
+            update(User)
+            .where(User.id == create_reader.id)
+            .values(active_loans=settings.BOOK_LIMIT_FOR_USER - 1)
+        )
+        await session.commit()
+
+    response = await async_client.post(
+        "/api/v1/books/lend", json=loan, headers=headers_admin
+    )
+    assert response.status_code == 201
+    headers_reader = {"Authorization": f"Bearer {create_reader.access_token}"}
+    response = await async_client.post(
+        f"/api/v1/books/return-book/{response.json()['id']}",
+        headers=headers_reader,
+    )
+    assert response.status_code == 200
+
+    async with async_session_test() as session:
+        user = await session.get(User, create_reader.id)
+        assert (
+            user.active_loans == settings.BOOK_LIMIT_FOR_USER - 1
+        ), "Returning a book did not release the quota slot"
+
+
+async def test_lend_and_return_books_batch(
+    async_client: AsyncClient,
+    create_admin: UserCreateResponseTest,
+    create_three_books: None,
+    create_reader: UserCreateResponseTest,
+):
+    async with async_session_test() as session:
+        await session.execute(
+            update(Book).where(Book.id == 2).values(available_copies=0)
+        )
+        await session.execute(
+            update(User)
+            .where(User.id == create_reader.id)
+            .values(active_loans=settings.BOOK_LIMIT_FOR_USER - 1)
+        )
+        await session.commit()
+
+    headers_admin = {"Authorization": f"Bearer {create_admin.access_token}"}
+    response = await async_client.post(
+        "/api/v1/books/lend/batch",
+        json={"user_id": str(create_reader.id), "book_ids": [1, 2, 3, 999, 1]},
+        headers=headers_admin,
+    )
+    response_json = response.json()
+    assert (
+        response.status_code == 200
+    ), f"Unexpected status code: {response.status_code}, Response JSON: {response_json}"
+    assert [result["book_id"] for result in response_json] == [1, 2, 3, 999]
+    assert response_json[0]["loan"]["book_id"] == 1
+    assert [result["error"] for result in response_json] == [
+        None,
+        ErrorMessage.BOOK_COPY_NOT_FOUND,
+        ErrorMessage.BOOK_LIMIT_EXCEEDED,
+        ErrorMessage.BOOK_NOT_FOUND,
+    ]
+
+    loan_id = response_json[0]["loan"]["id"]
+    headers_reader = {"Authorization": f"Bearer {create_reader.access_token}"}
+    response = await async_client.post(
+        "/api/v1/books/return-book/batch",
+        json={"loan_ids": [loan_id, loan_id + 100]},
+        headers=headers_reader,
+    )
+    response_json = response.json()
+    assert response.status_code == 200, response_json
+    assert response_json[0]["loan"]["returned"] is True
+    assert response_json[1]["error"] == ErrorMessage.BOOK_LOAN_NOT_FOUND
+
+    async with async_session_test() as session:
+        book = await session.get(Book, 1)
+        user = await session.get(User, create_reader.id)
+    assert book.available_copies == 1, "Returned copy was not restocked"
+    assert book.loan_count == 1
+    assert user.active_loans == settings.BOOK_LIMIT_FOR_USER - 1
+    assert user.loan_count == 1
+
 
 async def test_get_popular_books(
     async_client: AsyncClient, create_three_books: None
@@ -222,6 +883,44 @@ async def test_get_popular_books(
     assert len(book_ids) == len(set(book_ids)), "Duplicate author IDs found"
 
 
+async def test_loan_counts_follow_lending_and_reconciliation(
+    async_client: AsyncClient,
+    create_admin: UserCreateResponseTest,
+    create_book: BookResponse,
+    create_reader: UserCreateResponseTest,
+):
+    headers = {"Authorization": f"Bearer {create_admin.access_token}"}
+    response = await async_client.post(
+        "/api/v1/books/lend",
+        json={"book_id": create_book.id, "user_id": str(create_reader.id)},
+        headers=headers,
+    )
+    assert response.status_code == 201
+
+    async with async_session_test() as session:
+        book = await session.get(Book, create_book.id)
+        user = await session.get(User, create_reader.id)
+        assert book.loan_count == 1, "Lending did not bump the book counter"
+        assert user.loan_count == 1, "Lending did not bump the user counter"
+
+        await session.execute(
+            update(Book).where(Book.id == book.id).values(loan_count=7)
+        )
+        await session.execute(
+            update(User).where(User.id == user.id).values(loan_count=0)
+        )
+        await session.commit()
+
+        assert await BookRepository(session).reconcile_loan_counts() == 1
+        assert await UserRepository(session).reconcile_loan_counts() == 1
+        await session.commit()
+
+        await session.refresh(book)
+        await session.refresh(user)
+        assert book.loan_count == 1, "Book counter was not rebuilt"
+        assert user.loan_count == 1, "User counter was not rebuilt"
+
+
 async def test_create_book_invalid_data(
     async_client: AsyncClient,
     create_admin: UserCreateResponseTest,
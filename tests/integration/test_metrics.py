@@ -0,0 +1,35 @@
+import pytest
+from httpx import AsyncClient
+from pydantic import ValidationError
+
+from src.schemas.metrics import MetricsResponse
+from src.schemas.users import UserCreateResponseTest
+
+
+async def test_get_metrics(
+    async_client: AsyncClient, create_admin: UserCreateResponseTest
+):
+    headers = {"Authorization": f"Bearer {create_admin.access_token}"}
+    response = await async_client.get("/api/v1/metrics", headers=headers)
+    response_json = response.json()
+    assert (
+        response.status_code == 200
+    ), f"Unexpected status code: {response.status_code}, Response JSON: {response_json}"
+    try:
+        MetricsResponse(**response_json)
+    except ValidationError as e:
+        pytest.fail(f"Response validation failed: {e}")
+
+
+async def test_get_metrics_not_admin(
+    async_client: AsyncClient, create_reader: UserCreateResponseTest
+):
+    headers = {"Authorization": f"Bearer {create_reader.access_token}"}
+    response = await async_client.get("/api/v1/metrics", headers=headers)
+    response_json = response.json()
+    assert (
+        response.status_code == 403
+    ), f"Unexpected status code: {response.status_code}, Response JSON: {response_json}"
+    assert (
+        "Permission denied" in response_json["detail"]
+    ), f"Expected 'Permission denied'. but got {response_json['detail']}"
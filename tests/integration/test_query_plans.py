@@ -0,0 +1,215 @@
+import json
+from typing import Any, Awaitable, Callable, Iterator
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.repositories.author import AuthorRepository
+from src.db.repositories.book import BookRepository
+from src.db.repositories.genre import GenreRepository
+from src.db.repositories.user import UserRepository
+from tests.conftest import async_session_test, engine_test
+
+USERS = 5_000
+AUTHORS = 2_000
+GENRES = 50
+BOOKS = 20_000
+LOANS_PER_USER = 10
+
+LARGE_TABLES = {
+    "users",
+    "authors",
+    "books",
+    "book_loans",
+    "book_author_association",
+    "book_genre_association",
+}
+
+SEED_STATEMENTS = [
+    f"""
+    INSERT INTO users (id, email, first_name, last_name, hashed_password,
+                       role, is_superuser, token_version)
+    SELECT gen_random_uuid(), 'reader' || g || '@example.com', 'Reader',
+           'Reader', '\\x00'::bytea, 'READER', false, 0
+    FROM generate_series(1, {USERS}) g
+    """,
+    f"""
+    INSERT INTO authors (name, birth_date)
+    SELECT 'Author ' || g, DATE '1800-01-01' + g
+    FROM generate_series(1, {AUTHORS}) g
+    """,
+    f"""
+    INSERT INTO genres (name)
+    SELECT 'Genre ' || g FROM generate_series(1, {GENRES}) g
+    """,
+    f"""
+    INSERT INTO books (title, description, published_at, available_copies)
+    SELECT 'Book ' || g, 'Description of book number ' || g,
+           DATE '1900-01-01' + g % 40000, 5
+    FROM generate_series(1, {BOOKS}) g
+    """,
+    f"""
+    INSERT INTO book_author_association (book_id, author_id)
+    SELECT g, g % {AUTHORS} + 1 FROM generate_series(1, {BOOKS}) g
+    """,
+    f"""
+    INSERT INTO book_genre_association (book_id, genre_id)
+    SELECT g, g % {GENRES} + 1 FROM generate_series(1, {BOOKS}) g
+    UNION ALL
+    SELECT g, (g + 7) % {GENRES} + 1 FROM generate_series(1, {BOOKS}) g
+    """,
+    f"""
+    INSERT INTO book_loans (book_id, user_id, loan_date, return_date,
+                            returned)
+    SELECT (u.n * {LOANS_PER_USER} + l) % {BOOKS} + 1, u.id,
+           now() - interval '1 day' * l, now() + interval '14 days',
+           l % 2 = 0
+    FROM (SELECT id, row_number() OVER (ORDER BY email) AS n FROM users) u,
+         generate_series(1, {LOANS_PER_USER}) l
+    """,
+    """
+    UPDATE books SET loan_count = counts.loan_count
+    FROM (SELECT book_id, count(*) AS loan_count
+          FROM book_loans GROUP BY book_id) counts
+    WHERE books.id = counts.book_id
+    """,
+    f"""
+    UPDATE users SET loan_count = {LOANS_PER_USER},
+                     active_loans = {LOANS_PER_USER // 2}
+    """,
+    "ANALYZE",
+]
+
+
+async def _loans_by_user(db: AsyncSession) -> Any:
+    user = await UserRepository(db).get_by_email_or_none(
+        "reader42@example.com"
+    )
+    return await BookRepository(db).get_book_loans_by_user_id(user.id)
+
+
+async def _users_after_cursor(db: AsyncSession) -> Any:
+    user = await UserRepository(db).get_by_email_or_none(
+        "reader42@example.com"
+    )
+    return await UserRepository(db).get_all_after_cursor(
+        limit=11, after=(user.email, user.id)
+    )
+
+
+HOT_QUERIES: dict[str, Callable[[AsyncSession], Awaitable[Any]]] = {
+    "books_page": lambda db: BookRepository(
+        db
+    ).get_all_with_pagination_and_filtration(limit=10, offset=0),
+    "books_deep_page": lambda db: BookRepository(
+        db
+    ).get_all_after_cursor_with_filtration(limit=11, after_id=15_000),
+    "books_by_author": lambda db: BookRepository(
+        db
+    ).get_all_with_pagination_and_filtration(
+        limit=10, offset=0, filters={"author_ids": [42]}
+    ),
+    "books_by_genre": lambda db: BookRepository(
+        db
+    ).get_all_with_pagination_and_filtration(
+        limit=10, offset=0, filters={"genre_ids": [7]}
+    ),
+    "books_by_title": lambda db: BookRepository(
+        db
+    ).get_all_with_pagination_and_filtration(
+        limit=10, offset=0, filters={"title": "ook 1234"}
+    ),
+    "books_search": lambda db: BookRepository(
+        db
+    ).search_with_pagination_and_filtration(
+        query="Book 1234", limit=10, offset=0
+    ),
+    "popular_books": lambda db: BookRepository(db).get_most_popular_books(
+        limit=10, offset=0
+    ),
+    "book_by_id": lambda db: BookRepository(db).get_by_id_or_none(1234),
+    "loans_by_user": _loans_by_user,
+    "loan_by_id": lambda db: BookRepository(db).get_book_loan_by_id_or_none(
+        1234
+    ),
+    "authors_page": lambda db: AuthorRepository(db).get_all_with_pagination(
+        limit=10, offset=0
+    ),
+    "authors_by_ids": lambda db: AuthorRepository(db).get_by_ids_or_none(
+        [1, 2, 3]
+    ),
+    "genres_page": lambda db: GenreRepository(db).get_all_with_pagination(
+        limit=10, offset=0
+    ),
+    "users_page": lambda db: UserRepository(db).get_all_with_pagination(
+        limit=10, offset=0
+    ),
+    "users_after_cursor": _users_after_cursor,
+    "active_users": lambda db: UserRepository(db).get_most_active_users(
+        limit=10, offset=0
+    ),
+}
+
+
+@pytest.fixture(scope="function")
+async def seed_catalog() -> None:
+    async with engine_test.begin() as conn:
+        for statement in SEED_STATEMENTS:
+            await conn.execute(text(statement))
+
+
+async def capture_statements(
+    query: Callable[[AsyncSession], Awaitable[Any]],
+) -> list[tuple[str, tuple]]:
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, tuple(parameters or ())))
+
+    event.listen(engine_test.sync_engine, "before_cursor_execute", record)
+    try:
+        async with async_session_test() as session:
+            await query(session)
+    finally:
+        event.remove(engine_test.sync_engine, "before_cursor_execute", record)
+    return statements
+
+
+async def explain(statement: str, parameters: tuple) -> dict:
+    async with engine_test.connect() as conn:
+        raw_connection = await conn.get_raw_connection()
+        plan = await raw_connection.driver_connection.fetchval(
+            f"EXPLAIN (FORMAT JSON) {statement}", *parameters
+        )
+    # The asyncpg dialect registers a json codec, so the plan may arrive
+    # already decoded.
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def sequential_scans(plan: dict) -> Iterator[str]:
+    if (
+        plan["Node Type"] == "Seq Scan"
+        and plan["Relation Name"] in LARGE_TABLES
+    ):
+        yield plan["Relation Name"]
+    for child in plan.get("Plans", []):
+        yield from sequential_scans(child)
+
+
+async def test_hot_queries_avoid_sequential_scans(seed_catalog: None):
+    offenders = []
+    for name, query in HOT_QUERIES.items():
+        statements = await capture_statements(query)
+        assert statements, f"Query '{name}' did not reach the database"
+        for statement, parameters in statements:
+            plan = await explain(statement, parameters)
+            scans = list(sequential_scans(plan))
+            if scans:
+                offenders.append(
+                    f"{name} scans {scans} sequentially:\n{statement}"
+                )
+    assert not offenders, "\n\n".join(offenders)
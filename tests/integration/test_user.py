@@ -1,10 +1,18 @@
+import asyncio
+import json
 import uuid
 
 import pytest
 from httpx import AsyncClient
 from pydantic import ValidationError
+from redis import RedisError
 
+from src.core.cache import invalidation_bus, user_cache
+from src.core.redis import get_redis
+from src.db.models.users import Role, User
 from src.schemas.users import UserCreateResponseTest, UserResponse
+from tests.conftest import async_session_test
+from tests.utils import subscribers
 
 
 async def test_register(async_client: AsyncClient):
@@ -67,6 +75,149 @@ async def test_change_user_role(
     assert user_response.role == new_role, "Role does not match"
 
 
+async def test_change_user_role_invalidates_cached_user(
+    async_client: AsyncClient,
+    create_superuser: UserCreateResponseTest,
+    create_reader: UserCreateResponseTest,
+):
+    reader_headers = {"Authorization": f"Bearer {create_reader.access_token}"}
+    response = await async_client.get(
+        "/api/v1/users/me", headers=reader_headers
+    )
+    assert response.json()["role"] == "reader"
+
+    headers = {"Authorization": f"Bearer {create_superuser.access_token}"}
+    response = await async_client.patch(
+        f"/api/v1/users/{create_reader.id}/change-role?new_role=admin",
+        headers=headers,
+    )
+    assert response.status_code == 200
+
+    response = await async_client.get(
+        "/api/v1/users/me", headers=reader_headers
+    )
+    response_json = response.json()
+    assert (
+        response.status_code == 200
+    ), f"Unexpected status code: {response.status_code}, Response JSON: {response_json}"
+    assert (
+        response_json["role"] == "admin"
+    ), "Cached user still has the old role"
+
+
+async def test_change_user_role_revokes_access_token(
+    async_client: AsyncClient,
+    create_superuser: UserCreateResponseTest,
+    create_admin: UserCreateResponseTest,
+):
+    admin_headers = {"Authorization": f"Bearer {create_admin.access_token}"}
+    response = await async_client.get("/api/v1/users", headers=admin_headers)
+    assert response.status_code == 200
+
+    headers = {"Authorization": f"Bearer {create_superuser.access_token}"}
+    response = await async_client.patch(
+        f"/api/v1/users/{create_admin.id}/change-role?new_role=reader",
+        headers=headers,
+    )
+    assert response.status_code == 200
+
+    response = await async_client.get("/api/v1/users", headers=admin_headers)
+    response_json = response.json()
+    assert (
+        response.status_code == 401
+    ), f"Unexpected status code: {response.status_code}, Response JSON: {response_json}"
+    assert (
+        response_json["detail"] == "Invalid token"
+    ), f"Unexpected detail message: {response_json['detail']}"
+
+
+async def test_other_workers_user_invalidations_reach_local_cache(
+    async_client: AsyncClient, create_reader: UserCreateResponseTest
+):
+    redis = get_redis()
+    invalidation_bus.start(redis)
+    try:
+        async with asyncio.timeout(1):
+            while not await subscribers(redis, invalidation_bus.channel):
+                await asyncio.sleep(0.01)
+
+        headers = {"Authorization": f"Bearer {create_reader.access_token}"}
+        response = await async_client.get("/api/v1/users/me", headers=headers)
+        assert response.status_code == 200
+        user_id = str(create_reader.id)
+        assert user_cache.local.get(user_id) is not None
+
+        # A write on another worker drops the snapshot and broadcasts.
+        await redis.publish(
+            invalidation_bus.channel,
+            json.dumps(
+                {
+                    "origin": "another-worker",
+                    "kind": user_cache.kind,
+                    "user_id": user_id,
+                }
+            ),
+        )
+        async with asyncio.timeout(1):
+            while user_cache.local.get(user_id) is not None:
+                await asyncio.sleep(0.01)
+    finally:
+        await invalidation_bus.stop()
+
+
+async def test_change_user_role_revokes_token_when_redis_write_fails(
+    async_client: AsyncClient,
+    create_superuser: UserCreateResponseTest,
+    create_admin: UserCreateResponseTest,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    admin_headers = {"Authorization": f"Bearer {create_admin.access_token}"}
+    response = await async_client.get("/api/v1/users", headers=admin_headers)
+    assert response.status_code == 200
+
+    async def failing_set(*args, **kwargs):
+        raise RedisError("Redis is down")
+
+    headers = {"Authorization": f"Bearer {create_superuser.access_token}"}
+    with monkeypatch.context() as patch:
+        patch.setattr(get_redis(), "set", failing_set)
+        response = await async_client.patch(
+            f"/api/v1/users/{create_admin.id}/change-role?new_role=reader",
+            headers=headers,
+        )
+    assert response.status_code == 200
+
+    response = await async_client.get("/api/v1/users", headers=admin_headers)
+    assert (
+        response.status_code == 401
+    ), f"Unexpected status code: {response.status_code}, Response JSON: {response.json()}"
+
+
+async def test_change_user_role_fails_closed_without_redis(
+    async_client: AsyncClient,
+    create_superuser: UserCreateResponseTest,
+    create_admin: UserCreateResponseTest,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    async def failing(*args, **kwargs):
+        raise RedisError("Redis is down")
+
+    headers = {"Authorization": f"Bearer {create_superuser.access_token}"}
+    with monkeypatch.context() as patch:
+        patch.setattr(get_redis(), "delete", failing)
+        response = await async_client.patch(
+            f"/api/v1/users/{create_admin.id}/change-role?new_role=reader",
+            headers=headers,
+        )
+    assert (
+        response.status_code == 503
+    ), f"Unexpected status code: {response.status_code}, Response JSON: {response.json()}"
+
+    async with async_session_test() as session:
+        user = await session.get(User, create_admin.id)
+    assert user.role == Role.ADMIN, "Role changed without revoking tokens"
+
+
 async def test_get_users(
     async_client: AsyncClient,
     create_admin: UserCreateResponseTest,
@@ -248,3 +399,30 @@ async def test_update_current_user_not_auth(async_client: AsyncClient):
     assert (
         "Not authenticated" in response_json["detail"]
     ), f"Expected 'Permission denied'. but got {response_json["detail"]}"
+
+
+async def test_get_users_by_cursor(
+    async_client: AsyncClient,
+    create_admin: UserCreateResponseTest,
+    create_three_readers: UserCreateResponseTest,
+):
+    headers = {"Authorization": f"Bearer {create_admin.access_token}"}
+    emails = []
+    cursor = None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        response = await async_client.get(
+            "/api/v1/users/cursor", headers=headers, params=params
+        )
+        response_json = response.json()
+        assert (
+            response.status_code == 200
+        ), f"Unexpected status code: {response.status_code}, Response JSON: {response_json}"
+        emails.extend(user["email"] for user in response_json["items"])
+        cursor = response_json["next_cursor"]
+        if cursor is None:
+            break
+    assert len(emails) == 4, f"Expected 4 users, but got {len(emails)}"
+    assert emails == sorted(emails), "Users are not ordered by email"
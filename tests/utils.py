@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from pydantic import EmailStr
+from redis import asyncio as aioredis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import create_access_token, create_refresh_token
@@ -32,7 +33,8 @@ async def create_user_for_tests(
     )
     session.add(user)
     await session.commit()
-    access_token = create_access_token(data={"sub": user.id})
+    await session.refresh(user)
+    access_token = create_access_token(data={"sub": user.id}, user=user)
     refresh_token = create_refresh_token(data={"sub": user.id})
     return UserCreateResponseTest(
         id=user.id,
@@ -104,3 +106,8 @@ async def create_book_for_tests(
         genres=[GenreResponse.model_validate(genre) for genre in genres],
         authors=[AuthorResponse.model_validate(author) for author in authors],
     )
+
+
+async def subscribers(redis: aioredis.Redis, channel: str) -> int:
+    ((_, count),) = await redis.pubsub_numsub(channel)
+    return count